@@ -108,6 +108,15 @@ CONF_SCHEMA = {
             "description": "Process only new candles.",
             "type": "boolean",
         },
+        "analyze_workers": {
+            "description": (
+                "Number of threads used to analyze pairs concurrently. "
+                "1 analyzes pairs one after another."
+            ),
+            "type": "integer",
+            "minimum": 1,
+            "default": 1,
+        },
         "minimal_roi": {
             "description": f"Minimum return on investment. {__IN_STRATEGY}",
             "type": "object",
@@ -236,6 +245,23 @@ CONF_SCHEMA = {
             "type": "string",
             "enum": BACKTEST_CACHE_AGE,
         },
+        "backtest_skip_idle_candles": {
+            "description": (
+                "Skip candles on which a pair has neither an open trade nor an entry signal. "
+                "Produces identical results, but speeds up backtesting of sparse signals."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "backtest_wallets_check_interval": {
+            "description": (
+                "Compare the incrementally updated backtesting wallets with a full "
+                "recalculation every N wallet updates. 0 to disable. For debugging only."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 0,
+        },
         # Hyperopt
         "hyperopt_path": {
             "description": "Specify additional lookup path for Hyperopt Loss functions.",
@@ -266,6 +292,15 @@ CONF_SCHEMA = {
             "description": "Perform analysis after each epoch in Hyperopt.",
             "type": "boolean",
         },
+        "hyperopt_indicator_cache_mb": {
+            "description": (
+                "Memory budget (in MB, per hyperopt worker) for reusing indicators between "
+                "epochs with `analyze_per_epoch`. 0 disables the cache."
+            ),
+            "type": "number",
+            "minimum": 0,
+            "default": 0,
+        },
         "print_all": {
             "description": "Print all hyperopt trials, not just the best ones.",
             "type": "boolean",
@@ -281,6 +316,23 @@ CONF_SCHEMA = {
             "type": "integer",
             "default": -1,
         },
+        "hyperopt_persistent_workers": {
+            "description": (
+                "Start hyperopt worker processes once and keep them for all epochs, "
+                "sending only the parameters of each epoch to the workers."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
+        "hyperopt_async_scheduling": {
+            "description": (
+                "Keep all hyperopt workers busy by asking for a new point as soon as an epoch "
+                "finishes, instead of evaluating epochs in batches. "
+                "Implies `hyperopt_persistent_workers`."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "hyperopt_random_state": {
             "description": "Random state for hyperopt trials.",
             "type": "integer",
@@ -763,6 +815,15 @@ CONF_SCHEMA = {
                     "type": "string",
                     "enum": ["error", "info"],
                 },
+                "pair_history_cache_size": {
+                    "description": (
+                        "Memory budget (in MB) for cached strategies, candle data and "
+                        "analyzed dataframes of the pair history endpoint. 0 disables the cache."
+                    ),
+                    "type": "integer",
+                    "minimum": 0,
+                    "default": 256,
+                },
             },
             "required": ["enabled", "listen_ip_address", "listen_port", "username", "password"],
         },
@@ -811,6 +872,22 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "candle_driven_loop": {
+                    "description": (
+                        "Run the full bot iteration when a new candle closes, "
+                        "only managing open orders and trades in between."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
+                "check_open_trades_cache": {
+                    "description": (
+                        "Compare cached open trades with the database on every access. "
+                        "For debugging only."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -1108,6 +1185,16 @@ CONF_SCHEMA = {
                     "maximum": 20,
                     "default": 8,
                 },
+                "dataframe_encoding": {
+                    "description": (
+                        "Encoding of dataframes received from producers. "
+                        "`arrow` uses binary Arrow IPC frames, and falls back to `json` "
+                        "for producers not supporting it."
+                    ),
+                    "type": "string",
+                    "enum": ["json", "arrow"],
+                    "default": "json",
+                },
             },
             "required": ["producers"],
         },
@@ -4,7 +4,7 @@ Functions to convert orderflow data from public_trades
 
 import logging
 import time
-from datetime import datetime
+from itertools import pairwise
 
 import numpy as np
 import pandas as pd
@@ -76,6 +76,163 @@ def _calculate_ohlcv_candle_start_and_end(df: pd.DataFrame, timeframe: str):
         df.drop(columns=["datetime"], inplace=True)
 
 
+def _match_candles(dates: pd.Series | None, candle_starts: pd.Series) -> np.ndarray:
+    """
+    Find the rows of candle_starts within the (sorted) dates.
+    :return: Array with the row of each candle start - or -1 if not found
+    """
+    if dates is None or dates.empty or dates.dt.tz != candle_starts.dt.tz:
+        # Timezone-aware dates never match timezone-naive dates.
+        return np.full(len(candle_starts), -1)
+    candle_starts = candle_starts.astype(dates.dtype)
+    positions = dates.searchsorted(candle_starts)
+    found = positions < len(dates)
+    found[found] = dates.to_numpy()[positions[found]] == candle_starts.to_numpy()[found]
+    return np.where(found, positions, -1)
+
+
+def _set_column_values(dataframe: pd.DataFrame, column: str, rows: np.ndarray, values) -> None:
+    col_idx = dataframe.columns.get_loc(column)
+    if dataframe[column].dtype == object:
+        # Assign element-wise - values may be lists or dicts.
+        obj_values = np.empty(len(values), dtype=object)
+        obj_values[:] = list(values)
+        dataframe.iloc[rows, col_idx] = obj_values
+    else:
+        dataframe.iloc[rows, col_idx] = values
+
+
+def _split(values: list, bounds: np.ndarray) -> list[list]:
+    return [values[start:end] for start, end in pairwise(bounds)]
+
+
+def _calculate_orderflow(trades: pd.DataFrame, config_orderflow: dict) -> dict[str, list]:
+    """
+    Calculate the orderflow columns for all candles at once.
+    :param trades: Trades sorted by candle_start
+    :param config_orderflow: orderflow configuration
+    :return: Dict of column name to one value per candle (in candle_start order)
+    """
+    candle_start = trades["candle_start"]
+    is_sell = trades["side"].str.contains("sell").to_numpy()
+    is_buy = trades["side"].str.contains("buy").to_numpy()
+    amount = trades["amount"].to_numpy()
+    bid = np.where(is_sell, amount, 0)
+    ask = np.where(is_buy, amount, 0)
+    per_trade = pd.DataFrame(
+        {"candle_start": candle_start, "bid": bid, "ask": ask, "cum_delta": ask - bid}
+    )
+    per_trade["cum_delta"] = per_trade.groupby("candle_start")["cum_delta"].cumsum()
+    stats = per_trade.groupby("candle_start").agg(
+        max_delta=("cum_delta", "max"),
+        min_delta=("cum_delta", "min"),
+        bid=("bid", "sum"),
+        ask=("ask", "sum"),
+        total_trades=("bid", "size"),
+    )
+    stats["delta"] = stats["ask"] - stats["bid"]
+
+    # Trades per candle
+    trade_bounds = np.append(np.flatnonzero(candle_start.ne(candle_start.shift())), len(trades))
+    result: dict[str, list] = {
+        "trades": _split(
+            trades.drop(columns=["candle_start", "candle_end"]).to_dict(orient="records"),
+            trade_bounds,
+        )
+    }
+
+    # Volume profile of all candles, binned by price level
+    scale = config_orderflow["scale"]
+    profile = (
+        pd.DataFrame(
+            {
+                "candle_start": candle_start,
+                "price": ((trades["price"] / scale).round() * scale).astype("float64").values,
+                "bid": is_sell.astype(int),
+                "ask": is_buy.astype(int),
+                "delta": ask - bid,
+                "bid_amount": bid,
+                "ask_amount": ask,
+                "total_volume": ask + bid,
+                "total_trades": is_sell.astype(int) + is_buy.astype(int),
+            }
+        )
+        .groupby(["candle_start", "price"])
+        .sum()
+    )
+    profile_candles = profile.index.get_level_values("candle_start")
+    profile_bounds = np.append(
+        np.flatnonzero(profile_candles[1:] != profile_candles[:-1]) + 1, len(profile)
+    )
+    profile_bounds = np.insert(profile_bounds, 0, 0)
+    prices = _split(profile.index.get_level_values("price").tolist(), profile_bounds)
+    result["orderflow"] = [
+        dict(zip(levels, records, strict=True))
+        for levels, records in zip(
+            prices, _split(profile.to_dict(orient="records"), profile_bounds), strict=True
+        )
+    ]
+
+    # Imbalances compare bid and ask diagonally - within each candle
+    next_ask = profile["ask"].groupby(level="candle_start").shift(-1)
+    low_volume = profile["total_volume"] < config_orderflow["imbalance_volume"]
+    imbalances = pd.DataFrame(
+        {
+            "bid_imbalance": np.where(
+                low_volume,
+                False,
+                (profile["bid"] / next_ask) > (config_orderflow["imbalance_ratio"]),
+            ),
+            "ask_imbalance": np.where(
+                low_volume,
+                False,
+                (next_ask / profile["bid"]) > (config_orderflow["imbalance_ratio"]),
+            ),
+        }
+    )
+    result["imbalances"] = [
+        dict(zip(levels, records, strict=True))
+        for levels, records in zip(
+            prices, _split(imbalances.to_dict(orient="records"), profile_bounds), strict=True
+        )
+    ]
+    stacked_range = config_orderflow["stacked_imbalance_range"]
+    for label in ("bid", "ask"):
+        result[f"stacked_imbalances_{label}"] = _stacked_imbalances(
+            imbalances[f"{label}_imbalance"].to_numpy(),
+            profile.index.get_level_values("price").to_numpy(),
+            profile_bounds,
+            stacked_range,
+        )
+
+    for col in ("max_delta", "min_delta", "bid", "ask", "delta", "total_trades"):
+        result[col] = stats[col].to_numpy()
+    return result
+
+
+def _stacked_imbalances(
+    imbalance: np.ndarray, prices: np.ndarray, bounds: np.ndarray, stacked_imbalance_range: int
+) -> list[list]:
+    """
+    Vectorized equivalent of stacked_imbalance() for multiple candles.
+    :param imbalance: Boolean imbalance per price level
+    :param prices: Price levels
+    :param bounds: Boundaries of the candles within imbalance / prices
+    :return: List of stacked imbalance prices per candle
+    """
+    # Length of the run of consecutive imbalances ending at each level - runs end
+    # at candle boundaries.
+    run_start = np.zeros(len(imbalance), dtype=bool)
+    run_start[bounds[:-1]] = True
+    run_start[1:] |= imbalance[1:] != imbalance[:-1]
+    run_id = np.cumsum(run_start) - 1
+    run_length = np.arange(len(imbalance)) - np.flatnonzero(run_start)[run_id] + 1
+    valid = np.flatnonzero(imbalance & (run_length >= stacked_imbalance_range))
+    stacked_prices = prices[valid - (stacked_imbalance_range - 1)]
+    candle_bounds = np.searchsorted(valid, bounds)
+    return [list(stacked_prices[start:end]) for start, end in pairwise(candle_bounds)]
+
+
 def populate_dataframe_with_trades(
     cached_grouped_trades: pd.DataFrame | None,
     config: Config,
@@ -109,72 +266,32 @@ def populate_dataframe_with_trades(
         trades = trades.loc[trades["candle_start"] >= start_date]
         trades.reset_index(inplace=True, drop=True)
 
-        # group trades by candle start
-        trades_grouped_by_candle_start = trades.groupby("candle_start", group_keys=False)
-
-        candle_start: datetime
-        for candle_start, trades_grouped_df in trades_grouped_by_candle_start:
-            is_between = candle_start == dataframe["date"]
-            if is_between.any():
-                # there can only be one row with the same date
-                index = dataframe.index[is_between][0]
-
-                if (
-                    cached_grouped_trades is not None
-                    and (candle_start == cached_grouped_trades["date"]).any()
-                ):
-                    # Check if the trades are already in the cache
-                    cache_idx = cached_grouped_trades.index[
-                        cached_grouped_trades["date"] == candle_start
-                    ][0]
-                    for col in ORDERFLOW_ADDED_COLUMNS:
-                        dataframe.at[index, col] = cached_grouped_trades.at[cache_idx, col]
-                    continue
-
-                dataframe.at[index, "trades"] = trades_grouped_df.drop(
-                    columns=["candle_start", "candle_end"]
-                ).to_dict(orient="records")
-
-                # Calculate orderflow for each candle
-                orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(
-                    trades_grouped_df, scale=config_orderflow["scale"]
-                )
-                dataframe.at[index, "orderflow"] = orderflow.to_dict(orient="index")
-                # orderflow_series.loc[[index]] = [orderflow.to_dict(orient="index")]
-                # Calculate imbalances for each candle's orderflow
-                imbalances = trades_orderflow_to_imbalances(
-                    orderflow,
-                    imbalance_ratio=config_orderflow["imbalance_ratio"],
-                    imbalance_volume=config_orderflow["imbalance_volume"],
-                )
-                dataframe.at[index, "imbalances"] = imbalances.to_dict(orient="index")
-
-                stacked_imbalance_range = config_orderflow["stacked_imbalance_range"]
-                dataframe.at[index, "stacked_imbalances_bid"] = stacked_imbalance(
-                    imbalances, label="bid", stacked_imbalance_range=stacked_imbalance_range
+        # Candles with trades - and their row in the dataframe
+        candle_starts = trades["candle_start"].drop_duplicates().sort_values()
+        rows = _match_candles(dataframe["date"], candle_starts)
+        candle_starts, rows = candle_starts[rows >= 0], rows[rows >= 0]
+
+        cached = _match_candles(
+            cached_grouped_trades["date"] if cached_grouped_trades is not None else None,
+            candle_starts,
+        )
+        if cached_grouped_trades is not None and (cached >= 0).any():
+            # Reuse cached results for candles which have already been calculated
+            for col in ORDERFLOW_ADDED_COLUMNS:
+                _set_column_values(
+                    dataframe,
+                    col,
+                    rows[cached >= 0],
+                    cached_grouped_trades[col].to_numpy()[cached[cached >= 0]],
                 )
 
-                dataframe.at[index, "stacked_imbalances_ask"] = stacked_imbalance(
-                    imbalances, label="ask", stacked_imbalance_range=stacked_imbalance_range
-                )
-
-                bid = np.where(
-                    trades_grouped_df["side"].str.contains("sell"), trades_grouped_df["amount"], 0
-                )
-
-                ask = np.where(
-                    trades_grouped_df["side"].str.contains("buy"), trades_grouped_df["amount"], 0
-                )
-                deltas_per_trade = ask - bid
-                dataframe.at[index, "max_delta"] = deltas_per_trade.cumsum().max()
-                dataframe.at[index, "min_delta"] = deltas_per_trade.cumsum().min()
-
-                dataframe.at[index, "bid"] = bid.sum()
-                dataframe.at[index, "ask"] = ask.sum()
-                dataframe.at[index, "delta"] = (
-                    dataframe.at[index, "ask"] - dataframe.at[index, "bid"]
-                )
-                dataframe.at[index, "total_trades"] = len(trades_grouped_df)
+        new_candles = candle_starts[cached < 0]
+        if not new_candles.empty:
+            new_trades = trades.loc[trades["candle_start"].isin(new_candles)]
+            # Stable sort - the order of trades within a candle matters for the cumulative delta
+            new_trades = new_trades.sort_values("candle_start", kind="stable", ignore_index=True)
+            for col, values in _calculate_orderflow(new_trades, config_orderflow).items():
+                _set_column_values(dataframe, col, rows[cached < 0], values)
 
         logger.debug(f"trades.groups_keys in {time.time() - start_time} seconds")
 
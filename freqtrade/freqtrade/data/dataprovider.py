@@ -220,12 +220,13 @@ class DataProvider:
         # CHECK FOR MISSING CANDLES
         # Convert the timeframe to a timedelta for pandas
         timeframe_delta: Timedelta = to_timedelta(timeframe)
-        local_last: Timestamp = existing_df.iloc[-1]["date"]  # We want the last date from our copy
+        local_last: Timestamp = existing_df["date"].iat[-1]  # We want the last date from our copy
         # We want the first date from the incoming
-        incoming_first: Timestamp = dataframe.iloc[0]["date"]
+        incoming_first: Timestamp = dataframe["date"].iat[0]
 
-        # Remove existing candles that are newer than the incoming first candle
-        existing_df1 = existing_df[existing_df["date"] < incoming_first]
+        # Remove existing candles that are newer than the incoming first candle.
+        # Dates are sorted, so slicing avoids copying the existing dataframe.
+        existing_df1 = existing_df.iloc[: existing_df["date"].searchsorted(incoming_first)]
 
         candle_difference = (incoming_first - local_last) / timeframe_delta
 
@@ -292,6 +293,12 @@ class DataProvider:
         """
         self._pairlists = pairlists
 
+    def historic_pairs(self) -> list[PairWithTimeframe]:
+        """
+        Pairs loaded from disk via `historic_ohlcv()`
+        """
+        return list(self.__cached_pairs_backtesting.keys())
+
     def historic_ohlcv(self, pair: str, timeframe: str, candle_type: str = "") -> DataFrame:
         """
         Get stored historical candle (OHLCV) data
@@ -0,0 +1,167 @@
+import logging
+import shutil
+from abc import abstractmethod
+from pathlib import Path
+
+from pandas import DataFrame, concat
+
+from freqtrade.configuration import TimeRange
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+from freqtrade.enums import CandleType
+
+from .arrowohlcvloader import load_ohlcv_dataset
+from .idatahandler import IDataHandler
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArrowDataHandler(IDataHandler):
+    """
+    Base class for datahandlers storing OHLCV data in Arrow based formats (feather, parquet).
+
+    Appended candles are written as segment files to a directory next to the data file
+    (`<pair>-<timeframe>.<ext>.segments/`), so appending only writes the new candles.
+    Loading combines the data file and all segments into one series.
+    Segments are merged into the data file on the next full store - or once
+    `_MAX_SEGMENTS` segments have accumulated.
+    """
+
+    _columns = DEFAULT_DATAFRAME_COLUMNS
+    _MAX_SEGMENTS = 50
+
+    @abstractmethod
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        """
+        Write ohlcv data to a single file.
+        :param filename: File to write to
+        :param data: Dataframe containing OHLCV data, with a clean index
+        """
+
+    @classmethod
+    def _segments_dir(cls, filename: Path) -> Path:
+        return filename.with_name(f"{filename.name}.segments")
+
+    @classmethod
+    def _segment_files(cls, filename: Path) -> list[Path]:
+        segments_dir = cls._segments_dir(filename)
+        if not segments_dir.is_dir():
+            return []
+        return sorted(segments_dir.glob(f"*.{cls._get_file_extension()}"))
+
+    def ohlcv_store(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Store data, replacing existing data (including appended segments).
+        :param pair: Pair - used to generate filename
+        :param timeframe: Timeframe - used to generate filename
+        :param data: Dataframe containing OHLCV data
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: None
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self.create_dir_if_needed(filename)
+
+        self._write_ohlcv_file(filename, data.reset_index(drop=True).loc[:, self._columns])
+        segments_dir = self._segments_dir(filename)
+        if segments_dir.is_dir():
+            shutil.rmtree(segments_dir)
+
+    def _ohlcv_load(
+        self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
+    ) -> DataFrame:
+        """
+        Internal method used to load data for one pair from disk.
+        Implements the loading and conversion to a Pandas dataframe.
+        Timerange trimming and dataframe validation happens outside of this method.
+        :param pair: Pair to load data
+        :param timeframe: Timeframe (e.g. "5m")
+        :param timerange: Limit data to be loaded to this timerange.
+                        Pushed down to the file reader, so data outside of the timerange
+                        (plus a small margin) is not loaded.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: DataFrame with ohlcv data, or empty DataFrame
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type=candle_type)
+        if not filename.exists():
+            # Fallback mode for 1M files
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type=candle_type, no_timeframe_modify=True
+            )
+            if not filename.exists():
+                return DataFrame(columns=self._columns)
+        try:
+            return load_ohlcv_dataset(
+                [filename, *self._segment_files(filename)],
+                self._get_file_extension(),
+                self._columns,
+                timeframe,
+                timerange,
+            )
+        except Exception as e:
+            logger.exception(
+                f"Error loading data from {filename}. Exception: {e}. Returning empty dataframe."
+            )
+            return DataFrame(columns=self._columns)
+
+    def ohlcv_append(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Append data to existing data structures.
+        Candles already present in the stored data are replaced by the appended candles.
+        :param pair: Pair
+        :param timeframe: Timeframe this ohlcv data is for
+        :param data: Data to append.
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        """
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        segments = self._segment_files(filename)
+        if not filename.exists() or len(segments) >= self._MAX_SEGMENTS:
+            if segments:
+                logger.info(f"Merging {len(segments)} appended segments into {filename}.")
+            # Also covers data stored using the fallback filename for 1M data.
+            stored = self._ohlcv_load(pair, timeframe, None, candle_type)
+            if not stored.empty:
+                data = (
+                    concat([stored, data.loc[:, self._columns]])
+                    .drop_duplicates(subset="date", keep="last")
+                    .sort_values("date")
+                )
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+            return
+
+        segments_dir = self._segments_dir(filename)
+        segments_dir.mkdir(exist_ok=True)
+        segment_no = int(segments[-1].stem) + 1 if segments else 1
+        self._write_ohlcv_file(
+            segments_dir / f"{segment_no:08d}.{self._get_file_extension()}",
+            data.reset_index(drop=True).loc[:, self._columns],
+        )
+
+    def ohlcv_purge(self, pair: str, timeframe: str, candle_type: CandleType) -> bool:
+        """
+        Remove data for this pair - including appended segments
+        :param pair: Delete data for this pair.
+        :param timeframe: Timeframe (e.g. "5m")
+        :param candle_type: Any of the enum CandleType (must match trading mode!)
+        :return: True when deleted, false if file did not exist.
+        """
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        segments_dir = self._segments_dir(filename)
+        if segments_dir.is_dir():
+            shutil.rmtree(segments_dir)
+        return super().ohlcv_purge(pair, timeframe, candle_type)
+
+    def rename_futures_data(
+        self, pair: str, new_pair: str, timeframe: str, candle_type: CandleType
+    ):
+        file_old = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        file_new = self._pair_data_filename(self._datadir, new_pair, timeframe, candle_type)
+        segments_old = self._segments_dir(file_old)
+        if not file_new.exists() and segments_old.is_dir():
+            segments_old.rename(self._segments_dir(file_new))
+        super().rename_futures_data(pair, new_pair, timeframe, candle_type)
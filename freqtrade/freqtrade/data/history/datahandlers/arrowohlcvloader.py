@@ -0,0 +1,107 @@
+"""
+Loading of OHLCV data from Arrow based file formats (feather, parquet).
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+from pandas import DataFrame
+from pyarrow import dataset
+
+from freqtrade.configuration import TimeRange
+from freqtrade.exchange import timeframe_to_seconds
+
+
+def build_ohlcv_date_filter(
+    date_field: pa.Field, timeframe: str, timerange: TimeRange | None
+) -> dataset.Expression | None:
+    """
+    Build the Arrow predicate for the date column of OHLCV data.
+    Includes 2 candles beyond both ends of the timerange, so validation and trimming of
+    the loaded data (in `IDataHandler.ohlcv_load()`) behave as if the whole file was loaded.
+    :param date_field: Schema field of the date column
+    :param timeframe: Timeframe of the data
+    :param timerange: Timerange to load - including startup candles
+    :return: Arrow filter expression or None if unbounded
+    """
+    if not timerange:
+        return None
+    slack = 2 * timeframe_to_seconds(timeframe)
+
+    def to_scalar(ts: int) -> pa.Scalar:
+        if pa.types.is_timestamp(date_field.type):
+            return pa.scalar(ts * 1000, type=pa.timestamp("ms", tz=date_field.type.tz)).cast(
+                date_field.type
+            )
+        # Dates stored as epoch milliseconds
+        return pa.scalar(ts * 1000, type=date_field.type)
+
+    date_col = dataset.field(date_field.name)
+    exprs = []
+    if timerange.starttype == "date":
+        exprs.append(date_col >= to_scalar(timerange.startts - slack))
+    if timerange.stoptype == "date":
+        exprs.append(date_col <= to_scalar(timerange.stopts + slack))
+
+    if not exprs:
+        return None
+    return exprs[0] if len(exprs) == 1 else exprs[0] & exprs[1]
+
+
+def _load_ohlcv_table(
+    filename: Path,
+    file_format: str,
+    columns: list[str],
+    timeframe: str,
+    timerange: TimeRange | None,
+) -> pa.Table:
+    ohlcv_dataset = dataset.dataset(filename, format=file_format)
+    # Column names are positional - files may have been written with different names.
+    names = ohlcv_dataset.schema.names[: len(columns)]
+    date_field = ohlcv_dataset.schema.field(names[0])
+    table = ohlcv_dataset.to_table(
+        columns=names, filter=build_ohlcv_date_filter(date_field, timeframe, timerange)
+    )
+
+    dates = table.column(0)
+    if not pa.types.is_timestamp(dates.type):
+        # Epoch milliseconds
+        dates = dates.cast(pa.int64()).cast(pa.timestamp("ms", tz="UTC"))
+    arrays = [dates.cast(pa.timestamp("ns", tz="UTC"))]
+    arrays.extend(table.column(i).cast(pa.float64()) for i in range(1, len(names)))
+    return pa.table(arrays, names=columns)
+
+
+def load_ohlcv_dataset(
+    filenames: list[Path],
+    file_format: str,
+    columns: list[str],
+    timeframe: str,
+    timerange: TimeRange | None,
+) -> DataFrame:
+    """
+    Load OHLCV data using pyarrow datasets.
+    Only the OHLCV columns are read, and the timerange is pushed down to the reader,
+    so data outside of the timerange is skipped as early as possible.
+    Type conversion happens in Arrow - the resulting dataframe has the types
+    expected by freqtrade (UTC dates, float prices and volume).
+    :param filenames: Files forming one series - later files take precedence for
+        candles present in multiple files.
+    :param file_format: "feather" or "parquet"
+    :param columns: Column names of the resulting dataframe (date first)
+    :param timeframe: Timeframe of the data
+    :param timerange: Timerange to load - None to load all data
+    :return: DataFrame with OHLCV data
+    """
+    tables = [
+        _load_ohlcv_table(filename, file_format, columns, timeframe, timerange)
+        for filename in filenames
+    ]
+    pairdata = pa.concat_tables(tables).to_pandas()
+    if len(tables) > 1:
+        pairdata = (
+            pairdata.drop_duplicates(subset="date", keep="last")
+            .sort_values("date")
+            .reset_index(drop=True)
+        )
+    return pairdata
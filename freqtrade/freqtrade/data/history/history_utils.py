@@ -1,5 +1,8 @@
 import logging
 import operator
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -33,6 +36,9 @@ from freqtrade.util.progress_tracker import CustomProgress, retrieve_progress_tr
 
 logger = logging.getLogger(__name__)
 
+# Upper limit of threads used to load pairs concurrently.
+LOAD_DATA_MAX_WORKERS = 8
+
 
 def load_pair_history(
     pair: str,
@@ -88,9 +94,12 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    progress_callback: Callable[[], None] | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
+    Pairs are loaded concurrently - reading and converting the data mostly happens
+    in pyarrow and numpy, which release the GIL.
 
     :param datadir: Path to the data storage location.
     :param timeframe: Timeframe (e.g. "5m")
@@ -101,6 +110,7 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param progress_callback: Called once for every loaded pair
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -109,8 +119,8 @@ def load_data(
 
     data_handler = get_datahandler(datadir, data_format)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load_pair(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -120,6 +130,16 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
+
+    workers = min(len(pairs), os.cpu_count() or 1, LOAD_DATA_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [executor.submit(load_pair, pair) for pair in pairs]
+        if progress_callback:
+            for _ in as_completed(futures):
+                progress_callback()
+
+    for pair, future in zip(pairs, futures, strict=True):
+        hist = future.result()
         if not hist.empty:
             result[pair] = hist
         else:
@@ -222,6 +242,41 @@ def _load_cached_data_for_updating(
     return data, start_ms, end_ms
 
 
+def _append_new_candles(
+    pair: str,
+    timeframe: str,
+    data: DataFrame,
+    new_dataframe: DataFrame,
+    data_handler: IDataHandler,
+    candle_type: CandleType,
+) -> bool:
+    """
+    Append candles newer than the stored data, without rewriting the stored data.
+    Candles at the end of the stored data are replaced by the downloaded candles.
+    :return: False if the data handler doesn't support appending.
+    """
+    new_candles = new_dataframe
+    if not new_candles.empty:
+        new_candles = clean_ohlcv_dataframe(
+            new_candles.loc[new_candles["date"] >= data.iloc[-1]["date"]],
+            timeframe,
+            pair,
+            fill_missing=False,
+            drop_incomplete=False,
+        )
+    try:
+        data_handler.ohlcv_append(pair, timeframe, data=new_candles, candle_type=candle_type)
+    except NotImplementedError:
+        return False
+    logger.debug(
+        "New End: %s",
+        f"{new_candles.iloc[-1]['date']:{DATETIME_PRINT_FORMAT}}"
+        if not new_candles.empty
+        else "None",
+    )
+    return True
+
+
 def _download_pair_history(
     pair: str,
     *,
@@ -317,6 +372,10 @@ def _download_pair_history(
 
         if data.empty:
             data = new_dataframe
+        elif not prepend and _append_new_candles(
+            pair, timeframe, data, new_dataframe, data_handler, candle_type
+        ):
+            return True
         else:
             # Run cleaning again to ensure there were no duplicate candles
             # Especially between existing and new data.
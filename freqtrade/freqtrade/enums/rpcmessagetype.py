@@ -34,6 +34,7 @@ class RPCMessageType(str, Enum):
 # Enum for parsing requests from ws consumers
 class RPCRequestType(str, Enum):
     SUBSCRIBE = "subscribe"
+    ENCODING = "encoding"
 
     WHITELIST = "whitelist"
     ANALYZED_DF = "analyzed_df"
@@ -7,6 +7,7 @@ from typing import Any, TypeVar, cast, overload
 
 from freqtrade.exceptions import DDosProtection, RetryableOrderError, TemporaryError
 from freqtrade.mixins import LoggingMixin
+from freqtrade.util.loop_metrics import loop_metrics
 
 
 logger = logging.getLogger(__name__)
@@ -110,13 +111,20 @@ def calculate_backoff(retrycount, max_retries):
 
 
 def retrier_async(f):
+    name = getattr(f, "__name__", repr(f))
+
     async def wrapper(*args, **kwargs):
+        # Measured once per call, including retries and backoff delays
+        with loop_metrics.measure("exchange", name):
+            return await retrying(*args, **kwargs)
+
+    async def retrying(*args, **kwargs):
         count = kwargs.pop("count", API_RETRY_COUNT)
         kucoin = args[0].name == "KuCoin"  # Check if the exchange is KuCoin.
         try:
             return await f(*args, **kwargs)
         except TemporaryError as ex:
-            msg = f'{f.__name__}() returned exception: "{ex}". '
+            msg = f'{name}() returned exception: "{ex}". '
             if count > 0:
                 msg += f"Retrying still for {count} times."
                 count -= 1
@@ -138,7 +146,7 @@ def retrier_async(f):
                         await asyncio.sleep(backoff_delay)
                 if msg:
                     logger.warning(msg)
-                return await wrapper(*args, **kwargs)
+                return await retrying(*args, **kwargs)
             else:
                 logger.warning(msg + "Giving up.")
                 raise ex
@@ -164,13 +172,20 @@ def retrier(*, retries=API_RETRY_COUNT) -> Callable[[F], F]: ...
 
 def retrier(_func: F | None = None, *, retries=API_RETRY_COUNT):
     def decorator(f: F) -> F:
+        name = getattr(f, "__name__", repr(f))
+
         @wraps(f)
         def wrapper(*args, **kwargs):
+            # Measured once per call, including retries and backoff delays
+            with loop_metrics.measure("exchange", name):
+                return retrying(*args, **kwargs)
+
+        def retrying(*args, **kwargs):
             count = kwargs.pop("count", retries)
             try:
                 return f(*args, **kwargs)
             except (TemporaryError, RetryableOrderError) as ex:
-                msg = f'{f.__name__}() returned exception: "{ex}". '
+                msg = f'{name}() returned exception: "{ex}". '
                 if count > 0:
                     logger.warning(msg + f"Retrying still for {count} times.")
                     count -= 1
@@ -180,7 +195,7 @@ def retrier(_func: F | None = None, *, retries=API_RETRY_COUNT):
                         backoff_delay = calculate_backoff(count + 1, retries)
                         logger.info(f"Applying DDosProtection backoff delay: {backoff_delay}")
                         time.sleep(backoff_delay)
-                    return wrapper(*args, **kwargs)
+                    return retrying(*args, **kwargs)
                 else:
                     logger.warning(msg + "Giving up.")
                     raise ex
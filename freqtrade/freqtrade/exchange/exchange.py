@@ -11,7 +11,7 @@ from collections.abc import Coroutine, Generator
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
-from threading import Lock
+from threading import Event, Lock
 from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
@@ -97,9 +97,11 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_msecs,
     timeframe_to_next_date,
     timeframe_to_prev_date,
+    timeframe_to_resample_freq,
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer, ohlcv_to_arrays
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -107,7 +109,7 @@ from freqtrade.misc import (
     file_load_json,
     safe_value_fallback2,
 )
-from freqtrade.util import dt_from_ts, dt_now
+from freqtrade.util import dt_from_ts, dt_now, loop_metrics
 from freqtrade.util.datetime_helpers import dt_humanize_delta, dt_ts, format_ms_time
 from freqtrade.util.periodic_cache import PeriodicCache
 
@@ -239,7 +241,7 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines: dict[PairWithTimeframe, OHLCVBuffer] = {}
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -288,6 +290,7 @@ class Exchange:
 
         logger.info(f'Using Exchange "{self.name}"')
         self.required_candle_call_count = 1
+        self._startup_candle_count = 0
         # Converts the interval provided in minutes in config to seconds
         self.markets_refresh_interval: int = (
             exchange_conf.get("markets_refresh_interval", 60) * 60 * 1000
@@ -336,7 +339,7 @@ class Exchange:
         return loop
 
     def _set_startup_candle_count(self, config: Config) -> None:
-        self._startup_candle_count: int = config.get("startup_candle_count", 0)
+        self._startup_candle_count = config.get("startup_candle_count", 0)
         self.required_candle_call_count = self.validate_required_startup_candles(
             self._startup_candle_count, config.get("timeframe", "")
         )
@@ -595,10 +598,18 @@ class Exchange:
 
     def klines(self, pair_interval: PairWithTimeframe, copy: bool = True) -> DataFrame:
         if pair_interval in self._klines:
-            return self._klines[pair_interval].copy() if copy else self._klines[pair_interval]
+            return self._klines[pair_interval].to_dataframe(copy=copy)
         else:
             return DataFrame()
 
+    @property
+    def candle_closed_event(self) -> Event | None:
+        """
+        Event set by the websocket connection whenever a new candle starts.
+        None if websockets are not used.
+        """
+        return self._exchange_ws.candle_closed if self._exchange_ws else None
+
     def trades(self, pair_interval: PairWithTimeframe, copy: bool = True) -> DataFrame:
         if pair_interval in self._trades:
             if copy:
@@ -1383,14 +1394,16 @@ class Exchange:
             if not reduceOnly:
                 self._lev_prep(pair, leverage, side)
 
-            order = self._api.create_order(
-                pair,
-                ordertype,
-                side,
-                amount,
-                rate_for_order,
-                params,
-            )
+            # Not wrapped in a retrier - measured separately
+            with loop_metrics.measure("exchange", "create_order"):
+                order = self._api.create_order(
+                    pair,
+                    ordertype,
+                    side,
+                    amount,
+                    rate_for_order,
+                    params,
+                )
             if order.get("status") is None:
                 # Map empty status to open.
                 order["status"] = "open"
@@ -2696,31 +2709,52 @@ class Exchange:
         if ticks and cache:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
             self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0]
-        has_cache = cache and (pair, timeframe, c_type) in self._klines
+        buffer = self._klines.get((pair, timeframe, c_type)) if cache else None
+        if buffer is not None:
+            # Add new candles to the cache without creating an intermediate dataframe
+            candles = ohlcv_to_arrays(ticks, drop_incomplete)
+            if candles is not None and buffer.update(*candles, self._fixed_interval_ns(timeframe)):
+                return buffer.to_dataframe(copy=False)
+
         # in case of existing cache, fill_missing happens after concatenation
         ohlcv_df = ohlcv_to_dataframe(
-            ticks, timeframe, pair=pair, fill_missing=not has_cache, drop_incomplete=drop_incomplete
+            ticks,
+            timeframe,
+            pair=pair,
+            fill_missing=buffer is None,
+            drop_incomplete=drop_incomplete,
         )
-        # keeping parsed dataframe in cache
-        if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
-                # Reassign so we return the updated, combined df
-                ohlcv_df = clean_ohlcv_dataframe(
-                    concat([old, ohlcv_df], axis=0),
-                    timeframe,
-                    pair,
-                    fill_missing=True,
-                    drop_incomplete=False,
-                )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
-                # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
-                ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-        return ohlcv_df
+        if not cache:
+            return ohlcv_df
+        # Age out old candles
+        capacity = (
+            self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            + self._startup_candle_count
+        )
+        if buffer is not None:
+            ohlcv_df = clean_ohlcv_dataframe(
+                concat([buffer.to_dataframe(copy=False), ohlcv_df], axis=0),
+                timeframe,
+                pair,
+                fill_missing=True,
+                drop_incomplete=False,
+            )
+        else:
+            # Keep the complete initial download
+            capacity = max(capacity, len(ohlcv_df))
+        buffer = OHLCVBuffer.from_dataframe(ohlcv_df, capacity)
+        self._klines[(pair, timeframe, c_type)] = buffer
+        return buffer.to_dataframe(copy=False)
+
+    @staticmethod
+    def _fixed_interval_ns(timeframe: str) -> int | None:
+        """
+        Candle interval in nanoseconds - None for timeframes without a fixed interval
+        (weekly, monthly).
+        """
+        if not timeframe_to_resample_freq(timeframe).endswith("s"):
+            return None
+        return timeframe_to_seconds(timeframe) * 1_000_000_000
 
     def refresh_latest_ohlcv(
         self,
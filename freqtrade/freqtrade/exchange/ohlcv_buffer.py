@@ -0,0 +1,170 @@
+"""
+In-memory candle storage for the exchange candle cache.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS
+
+
+logger = logging.getLogger(__name__)
+
+_PRICE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+
+
+def _dates_ns(dates: pd.Series) -> np.ndarray:
+    return dates.to_numpy(dtype="datetime64[ns]").view("int64")
+
+
+def ohlcv_to_arrays(ohlcv: list, drop_incomplete: bool) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Converts a list with candle (OHLCV) data (in format returned by ccxt.fetch_ohlcv)
+    to arrays, for use with `OHLCVBuffer.update()`.
+    :param ohlcv: list with candle (OHLCV) data, as returned by exchange.async_get_candle_history
+    :param drop_incomplete: Drop the last candle, assuming it's incomplete
+    :return: Tuple of (dates in nanoseconds, array of shape (candles, 5) with open, high, low,
+        close and volume) - or None if candles are not sorted or contain duplicates.
+    """
+    if drop_incomplete:
+        ohlcv = ohlcv[:-1]
+    if not ohlcv:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(_PRICE_COLUMNS)))
+    candles = np.array(ohlcv, dtype=np.float64)
+    dates = candles[:, 0].astype(np.int64) * 1_000_000
+    if (np.diff(dates) <= 0).any():
+        return None
+    return dates, candles[:, 1:]
+
+
+class OHLCVBuffer:
+    """
+    Fixed capacity, column-oriented ring buffer of candles for one pair, timeframe
+    and candle type.
+    New candles are appended (and the last candle updated) in O(new candles) -
+    once the capacity is reached, the oldest candles are overwritten.
+    The dataframe representation is built on demand, and cached until the next update.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1.")
+        self.capacity = capacity
+        self._dates = np.empty(capacity, dtype=np.int64)
+        # One row per column (open, high, low, close, volume)
+        self._values = np.empty((len(_PRICE_COLUMNS), capacity), dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self._dataframe: DataFrame | None = None
+
+    @classmethod
+    def from_dataframe(cls, dataframe: DataFrame, capacity: int) -> "OHLCVBuffer":
+        """
+        Create a buffer containing the last `capacity` candles of dataframe.
+        :param dataframe: Clean candle (OHLCV) dataframe (sorted, without duplicates)
+        :param capacity: Maximum number of candles to keep
+        """
+        buffer = cls(capacity)
+        buffer._append(
+            _dates_ns(dataframe["date"]),
+            dataframe[_PRICE_COLUMNS].to_numpy(dtype=np.float64).T,
+        )
+        return buffer
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _positions(self, start: int, count: int) -> np.ndarray:
+        return (self._start + start + np.arange(count)) % self.capacity
+
+    def _append(self, dates: np.ndarray, values: np.ndarray) -> None:
+        if len(dates) > self.capacity:
+            dates = dates[-self.capacity :]
+            values = values[:, -self.capacity :]
+        count = len(dates)
+        positions = self._positions(self._size, count)
+        self._dates[positions] = dates
+        self._values[:, positions] = values
+        overflow = max(self._size + count - self.capacity, 0)
+        self._start = (self._start + overflow) % self.capacity
+        self._size += count - overflow
+        self._dataframe = None
+
+    def update(self, dates: np.ndarray, values: np.ndarray, interval_ns: int | None) -> bool:
+        """
+        Add new candles to the buffer.
+        Candles older than the last candle in the buffer are ignored.
+        A candle with the date of the last candle in the buffer updates this candle.
+        Missing candles between the buffer and the new candles are filled up with 0 volume
+        candles, using the previous close.
+        :param dates: Candle dates in nanoseconds (sorted, without duplicates)
+        :param values: Array of shape (candles, 5) with open, high, low, close and volume
+        :param interval_ns: Candle interval in nanoseconds - None if candles are not of
+            fixed size (weekly or monthly candles)
+        :return: False if the candles can't be added and the buffer needs to be rebuilt.
+        """
+        if self._size == 0:
+            return False
+        last_pos = (self._start + self._size - 1) % self.capacity
+        last_date = self._dates[last_pos]
+        first_new = int(np.searchsorted(dates, last_date))
+        if first_new == len(dates):
+            return True
+        dates = dates[first_new:]
+        values = values[first_new:].T
+
+        if dates[0] == last_date:
+            # Update the last candle
+            open_, high, low, close, volume = self._values[:, last_pos]
+            self._values[:, last_pos] = (
+                open_,
+                max(high, values[1, 0]),
+                min(low, values[2, 0]),
+                values[3, 0],
+                max(volume, values[4, 0]),
+            )
+            self._dataframe = None
+            dates = dates[1:]
+            values = values[:, 1:]
+            if len(dates) == 0:
+                return True
+
+        if interval_ns is None:
+            return False
+        offsets = dates - last_date
+        if (offsets % interval_ns).any():
+            return False
+        positions = offsets // interval_ns - 1
+        length = int(positions[-1]) + 1
+        if length != len(dates):
+            # Fill up missing candles from the previous close.
+            logger.debug(f"Filling up {length - len(dates)} missing candles.")
+            last_existing = np.full(length, -1, dtype=np.int64)
+            last_existing[positions] = np.arange(len(dates))
+            last_existing = np.maximum.accumulate(last_existing)
+            close = np.append(values[3], self._values[3, last_pos])[last_existing]
+            filled = np.vstack([close, close, close, close, np.zeros(length)])
+            filled[:, positions] = values
+            dates = last_date + (np.arange(length, dtype=np.int64) + 1) * interval_ns
+            values = filled
+        self._append(dates, values)
+        return True
+
+    def to_dataframe(self, copy: bool = True) -> DataFrame:
+        """
+        Candles in the buffer as dataframe, sorted by date.
+        :param copy: Return a copy of the cached dataframe
+        """
+        if self._dataframe is None:
+            positions = self._positions(0, self._size)
+            values = self._values[:, positions]
+            self._dataframe = DataFrame(
+                {
+                    "date": pd.to_datetime(self._dates[positions], unit="ns", utc=True),
+                    **{col: values[i] for i, col in enumerate(_PRICE_COLUMNS)},
+                }
+            )
+        return self._dataframe.copy() if copy else self._dataframe
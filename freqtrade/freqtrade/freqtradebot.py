@@ -39,6 +39,7 @@ from freqtrade.exchange import (
     ROUND_UP,
     timeframe_to_minutes,
     timeframe_to_next_date,
+    timeframe_to_prev_date,
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_types import CcxtOrder
@@ -62,7 +63,15 @@ from freqtrade.rpc.rpc_types import (
 )
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise, MeasureTime, PeriodicCache, dt_from_ts, dt_now
+from freqtrade.util import (
+    FtPrecise,
+    MeasureTime,
+    PeriodicCache,
+    TimingStats,
+    dt_from_ts,
+    dt_now,
+    loop_metrics,
+)
 from freqtrade.util.migrations import migrate_live_content
 from freqtrade.wallets import Wallets
 
@@ -105,6 +114,9 @@ class FreqtradeBot(LoggingMixin):
         self.exchange.validate_config(self.config)
 
         init_db(self.config["db_url"])
+        Trade.check_open_trades_cache = self.config.get("internals", {}).get(
+            "check_open_trades_cache", False
+        )
 
         self.wallets = Wallets(self.config, self.exchange)
 
@@ -178,15 +190,25 @@ class FreqtradeBot(LoggingMixin):
         self.protections = ProtectionManager(self.config, self.strategy.protections)
 
         def log_took_too_long(duration: float, time_limit: float):
+            slowest = ", ".join(
+                f"{pair}: {pair_duration:.2f}s"
+                for pair, pair_duration in self.strategy.slowest_pairs(3)
+            )
             logger.warning(
                 f"Strategy analysis took {duration:.2f}s, more than 25% of the timeframe "
                 f"({time_limit:.2f}s). This can lead to delayed orders and missed signals."
                 "Consider either reducing the amount of work your strategy performs "
-                "or reduce the amount of pairs in the Pairlist."
+                "or reduce the amount of pairs in the Pairlist. "
+                f"Slowest pairs: {slowest}."
             )
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
 
+        # Latency from candle close to the start of processing / to entry order submission
+        self.candle_process_latency = TimingStats()
+        self.candle_entry_latency = TimingStats()
+        self._last_candle_close: datetime | None = None
+
     def notify_status(self, msg: str, msg_type=RPCMessageType.STATUS) -> None:
         """
         Public method for users of this class (worker, etc.) to send notifications
@@ -250,11 +272,14 @@ class FreqtradeBot(LoggingMixin):
         otherwise a new trade is created.
         :return: True if one or more trades has been created or closed, False otherwise
         """
+        self._record_candle_latency()
 
         # Check whether markets have to be reloaded and reload them when it's needed
-        self.exchange.reload_markets()
+        with loop_metrics.measure("phase", "reload_markets"):
+            self.exchange.reload_markets()
 
-        self.update_trades_without_assigned_fees()
+        with loop_metrics.measure("phase", "update_trades_without_assigned_fees"):
+            self.update_trades_without_assigned_fees()
 
         # Query trades from persistence layer
         trades: list[Trade] = Trade.get_open_trades()
@@ -262,26 +287,29 @@ class FreqtradeBot(LoggingMixin):
         self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
         # Refreshing candles
-        self.dataprovider.refresh(
-            self.pairlists.create_pair_list(self.active_pair_whitelist),
-            self.strategy.gather_informative_pairs(),
-        )
+        with loop_metrics.measure("phase", "dataprovider_refresh"):
+            self.dataprovider.refresh(
+                self.pairlists.create_pair_list(self.active_pair_whitelist),
+                self.strategy.gather_informative_pairs(),
+            )
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
             current_time=datetime.now(UTC)
         )
 
-        with self._measure_execution:
+        with self._measure_execution, loop_metrics.measure("phase", "analyze"):
             self.strategy.analyze(self.active_pair_whitelist)
+        for pair, duration in self.strategy.analyze_timings.items():
+            loop_metrics.add("analyze", pair, duration)
 
-        with self._exit_lock:
+        with self._exit_lock, loop_metrics.measure("phase", "manage_open_orders"):
             # Check for exchange cancellations, timeouts and user requested replace
             self.manage_open_orders()
 
         # Protect from collisions with force_exit.
         # Without this, freqtrade may try to recreate stoploss_on_exchange orders
         # while exiting is in process, since telegram messages arrive in an different thread.
-        with self._exit_lock:
+        with self._exit_lock, loop_metrics.measure("phase", "exit_positions"):
             trades = Trade.get_open_trades()
             # First process current opened trades (positions)
             self.exit_positions(trades)
@@ -289,17 +317,53 @@ class FreqtradeBot(LoggingMixin):
 
         # Check if we need to adjust our current positions before attempting to enter new trades.
         if self.strategy.position_adjustment_enable:
-            with self._exit_lock:
+            with self._exit_lock, loop_metrics.measure("phase", "process_open_trade_positions"):
                 self.process_open_trade_positions()
 
         # Then looking for entry opportunities
         if self.state == State.RUNNING and self.get_free_open_trades():
-            self.enter_positions()
+            with loop_metrics.measure("phase", "enter_positions"):
+                self.enter_positions()
+        self._schedule.run_pending()
+        Trade.commit()
+        with loop_metrics.measure("phase", "process_msg_queue"):
+            self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+        self.last_process = datetime.now(UTC)
+
+    def process_between_candles(self) -> None:
+        """
+        Lightweight iteration used by the candle-driven loop while waiting for the next candle.
+        Handles open orders and exits of open trades, without refreshing candles, analyzing
+        pairs or entering new trades.
+        """
+        self.exchange.reload_markets()
+
+        with self._exit_lock:
+            # Check for exchange cancellations, timeouts and user requested replace
+            self.manage_open_orders()
+
+        with self._exit_lock:
+            trades = Trade.get_open_trades()
+            self.exit_positions(trades)
+            Trade.commit()
+
         self._schedule.run_pending()
         Trade.commit()
         self.rpc.process_msg_queue(self.dataprovider._msg_queue)
         self.last_process = datetime.now(UTC)
 
+    def _record_candle_latency(self) -> None:
+        """
+        Record the delay between the close of the latest candle and the first iteration
+        processing it.
+        """
+        now = datetime.now(UTC)
+        candle_close = timeframe_to_prev_date(self.strategy.timeframe, now)
+        if self._last_candle_close != candle_close:
+            if self._last_candle_close is not None:
+                self.candle_process_latency.add((now - candle_close).total_seconds())
+            self._last_candle_close = candle_close
+
     def process_stopped(self) -> None:
         """
         Close all orders that were left open
@@ -694,19 +758,19 @@ class FreqtradeBot(LoggingMixin):
             if (bid_check_dom.get("enabled", False)) and (
                 bid_check_dom.get("bids_to_ask_delta", 0) > 0
             ):
-                if self._check_depth_of_market(pair, bid_check_dom, side=signal):
-                    return self.execute_entry(
-                        pair,
-                        stake_amount,
-                        enter_tag=enter_tag,
-                        is_short=(signal == SignalDirection.SHORT),
-                    )
-                else:
+                if not self._check_depth_of_market(pair, bid_check_dom, side=signal):
                     return False
 
-            return self.execute_entry(
+            created = self.execute_entry(
                 pair, stake_amount, enter_tag=enter_tag, is_short=(signal == SignalDirection.SHORT)
             )
+            if created:
+                latency = (
+                    dt_now() - timeframe_to_prev_date(self.strategy.timeframe)
+                ).total_seconds()
+                self.candle_entry_latency.add(latency)
+                logger.debug(f"Entry order for {pair} placed {latency:.3f}s after candle close.")
+            return created
         else:
             return False
 
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, TextIO
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 import rapidjson
 
@@ -204,6 +205,45 @@ def json_to_dataframe(data: str) -> pd.DataFrame:
     return dataframe
 
 
+def _column_to_list(column: pd.Series) -> list[Any]:
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iub":
+        return column.to_numpy().tolist()
+
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        values = column.to_numpy()
+        result = values.tolist()
+        invalid = ~np.isfinite(values)
+    else:
+        # Datetimes, objects and extension types - NaT / NaN / pd.NA and infinite values
+        result = column.astype(object).tolist()
+        invalid = column.isna().to_numpy(dtype=bool)
+        if isinstance(dtype, np.dtype) and dtype.kind == "O":
+            invalid |= column.isin([np.inf, -np.inf]).to_numpy(dtype=bool)
+
+    for idx in np.flatnonzero(invalid):
+        result[idx] = None
+    return result
+
+
+def dataframe_to_columns(dataframe: pd.DataFrame) -> list[list[Any]]:
+    """
+    Convert a DataFrame to one list of python objects per column, without creating
+    an intermediate object-dtype copy of the dataframe.
+    NaN, NaT and infinite values are converted to None, so the result is JSON compatible.
+    :param dataframe: A pandas DataFrame
+    :returns: List of column values, in the order of `dataframe.columns`
+    """
+    return [_column_to_list(dataframe.iloc[:, idx]) for idx in range(dataframe.shape[1])]
+
+
+def dataframe_to_rows(columns: list[list[Any]]) -> list[list[Any]]:
+    """
+    Transpose the result of `dataframe_to_columns()` to one list per row
+    """
+    return [list(row) for row in zip(*columns, strict=True)]
+
+
 def remove_entry_exit_signals(dataframe: pd.DataFrame):
     """
     Remove Entry and Exit signals from a DataFrame
@@ -228,8 +268,10 @@ def append_candles_to_dataframe(left: pd.DataFrame, right: pd.DataFrame) -> pd.D
     :param right: The new dataframe containing the data you want appended
     :returns: The dataframe with the right data in it
     """
-    if left.iloc[-1]["date"] != right.iloc[-1]["date"]:
-        left = pd.concat([left, right])
+    if left["date"].iat[-1] != right["date"].iat[-1]:
+        # Only copy the candles which are kept
+        keep = 1500 - len(right)
+        left = pd.concat([left.iloc[len(left) - keep :], right]) if keep > 0 else right.copy()
 
     # Only keep the last 1500 candles in memory
     left = left[-1500:] if len(left) > 1500 else left
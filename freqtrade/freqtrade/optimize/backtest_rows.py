@@ -0,0 +1,91 @@
+"""
+Columnar candle storage used by backtesting
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from pandas import DataFrame
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _datetime_to_ns(date: datetime) -> int:
+    return (date - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+class BacktestRows:
+    """
+    Read-only, columnar storage of the candles of one pair for backtesting.
+
+    Candles are kept in contiguous numpy arrays (dates as int64 nanoseconds, prices and signals
+    as float64, tags as object) instead of one python list per candle.
+    Rows are materialized as tuples (date, *value_columns, *tag_columns, *constants) on access
+    only, so candles which are never looked at don't create any python objects.
+    The date is returned as timezone-aware (UTC) python datetime.
+    """
+
+    __slots__ = ("constants", "dates", "tags", "values")
+
+    def __init__(
+        self, dates: np.ndarray, values: np.ndarray, tags: np.ndarray, constants: tuple = ()
+    ) -> None:
+        self.dates = dates
+        self.values = values
+        self.tags = tags
+        # Values appended to every row
+        self.constants = constants
+
+    @classmethod
+    def from_dataframe(
+        cls, dataframe: DataFrame, value_columns: list[str], tag_columns: list[str]
+    ) -> "BacktestRows":
+        """
+        Build the columnar storage from a dataframe.
+        :param dataframe: Dataframe containing a "date" column and all columns specified
+        :param value_columns: Numeric columns - stored as float64
+        :param tag_columns: Columns stored as python objects (strings or None)
+        """
+        if not dataframe["date"].is_monotonic_increasing:
+            dataframe = dataframe.sort_values("date")
+        return cls(
+            dates=dataframe["date"].values.astype("datetime64[ns]").view("int64"),
+            values=np.ascontiguousarray(dataframe[value_columns].to_numpy(dtype="float64")),
+            tags=dataframe[tag_columns].to_numpy(dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, index: int) -> tuple:
+        return (
+            datetime.fromtimestamp(self.dates.item(index) / 1e9, UTC),
+            *self.values[index].tolist(),
+            *self.tags[index].tolist(),
+            *self.constants,
+        )
+
+    def __iter__(self):
+        for index in range(len(self.dates)):
+            yield self[index]
+
+    def slice_by_date(
+        self, start: datetime, end: datetime, constants: tuple = ()
+    ) -> "BacktestRows":
+        """
+        Get the rows with start <= date < end, without copying the underlying arrays.
+        :param start: Start date (inclusive)
+        :param end: End date (exclusive)
+        :param constants: Values to append to every row of the slice
+        """
+        start_idx, end_idx = self.dates.searchsorted(
+            [_datetime_to_ns(start), _datetime_to_ns(end)], side="left"
+        )
+        return BacktestRows(
+            self.dates[start_idx:end_idx],
+            self.values[start_idx:end_idx],
+            self.tags[start_idx:end_idx],
+            constants,
+        )
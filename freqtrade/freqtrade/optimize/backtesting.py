@@ -49,6 +49,7 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_rows import BacktestRows
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -212,6 +213,9 @@ class Backtesting:
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
+        self.skip_idle_candles: bool = self.config.get("backtest_skip_idle_candles", False)
+        # Per pair (candle timestamps, entry candidate flags) - see _get_idle_candle_scan
+        self._idle_candle_scan: dict[str, tuple[list[int], list[bool]]] = {}
         migrate_data(config, self.exchange)
 
         self.init_backtest()
@@ -270,6 +274,8 @@ class Backtesting:
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
         self.detail_data: dict[str, DataFrame] = {}
+        # Columnar detail data per pair, keyed by the dataframe it was built from
+        self._detail_rows: dict[str, tuple[DataFrame, BacktestRows]] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -306,7 +312,8 @@ class Backtesting:
         Loads backtest data and returns the data combined with the timerange
         as tuple.
         """
-        self.progress.init_step(BacktestState.DATALOAD, 1)
+        pairs_to_load = len(self.pairlists.whitelist) * (2 if self.timeframe_detail else 1)
+        self.progress.init_step(BacktestState.DATALOAD, pairs_to_load)
 
         data = history.load_data(
             datadir=self.config["datadir"],
@@ -317,6 +324,7 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            progress_callback=self.progress.increment,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -332,8 +340,8 @@ class Backtesting:
             timeframe_to_seconds(self.timeframe), self.required_startup, min_date
         )
 
-        self.progress.set_new_value(1)
         self._load_bt_data_detail()
+        self.progress.set_new_value(pairs_to_load)
         self.price_pair_prec = {}
         for pair in self.pairlists.whitelist:
             if pair in data:
@@ -355,6 +363,7 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                progress_callback=self.progress.increment,
             )
         else:
             self.detail_data = {}
@@ -456,9 +465,10 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
-    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
+    def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, BacktestRows]:
         """
-        Helper function to convert a processed dataframes into lists for performance reasons.
+        Helper function to convert a processed dataframes into columnar row storage
+        for performance reasons.
 
         Used by backtest() - so keep this optimized for performance.
 
@@ -467,6 +477,7 @@ class Backtesting:
         """
 
         data: dict = {}
+        self._idle_candle_scan = {}
         self.progress.init_step(BacktestState.CONVERT, len(processed))
 
         # Create dict with data
@@ -508,11 +519,32 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if self.skip_idle_candles and not df_analyzed.empty:
+                self._idle_candle_scan[pair] = self._get_idle_candle_scan(df_analyzed)
+
+            # Convert from Pandas to numpy arrays for performance reasons
+            # (Looping Pandas is slow.) Rows are only materialized when accessed.
+            data[pair] = (
+                BacktestRows.from_dataframe(df_analyzed, HEADERS[1:9], HEADERS[9:])
+                if not df_analyzed.empty
+                else []
+            )
         return data
 
+    def _get_idle_candle_scan(self, df_analyzed: DataFrame) -> tuple[list[int], list[bool]]:
+        """
+        Vectorized pre-scan of the (already shifted) signal columns.
+        Used by time_pair_generator to skip candles on which a pair without open trades
+        can't open a position.
+        :param df_analyzed: Dataframe as used for backtesting (signals shifted)
+        :return: tuple of (candle open timestamps in seconds, entry candidate flag per candle)
+        """
+        dates = df_analyzed["date"].values.astype("datetime64[s]").astype("int64")
+        candidates = df_analyzed["enter_long"].to_numpy() == 1
+        if self._can_short:
+            candidates |= df_analyzed["enter_short"].to_numpy() == 1
+        return dates.tolist(), candidates.tolist()
+
     def _get_close_rate(
         self,
         row: tuple,
@@ -699,7 +731,7 @@ class Backtesting:
                     entry_tag1=order_tag,
                 )
                 if pos_trade is not None:
-                    self.wallets.update()
+                    self.wallets.update_trade_balance(trade)
                     return pos_trade
 
         if stake_amount is not None and stake_amount < 0.0:
@@ -795,7 +827,7 @@ class Backtesting:
                 trade.close(order.ft_price, show_msg=False)
 
                 LocalTrade.close_bt_trade(trade)
-            self.wallets.update()
+            self.wallets.update_trade_balance(trade)
             self.run_protections(pair, current_time, trade.trade_direction)
 
     def _get_exit_for_signal(
@@ -887,7 +919,7 @@ class Backtesting:
         exit_reason: str | None,
     ) -> LocalTrade | None:
         self.order_id_counter += 1
-        exit_candle_time = sell_row[DATE_IDX].to_pydatetime()
+        exit_candle_time = sell_row[DATE_IDX]
         order_type = self.strategy.order_types["exit"]
         # amount = amount or trade.amount
         amount = amount_to_contract_precision(
@@ -938,7 +970,7 @@ class Backtesting:
             exits = self.strategy.should_exit(
                 trade,  # type: ignore
                 row[OPEN_IDX],
-                row[DATE_IDX].to_pydatetime(),
+                row[DATE_IDX],
                 enter=enter,
                 exit_=exit_sig,
                 low=row[LOW_IDX],
@@ -1081,7 +1113,7 @@ class Backtesting:
         :param requested_stake: Stake amount for adjusted orders (`adjust_entry_price`).
         """
 
-        current_time = row[DATE_IDX].to_pydatetime()
+        current_time = row[DATE_IDX]
         entry_tag = entry_tag1 or (row[ENTER_TAG_IDX] if len(row) >= ENTER_TAG_IDX + 1 else None)
         # let's call the custom entry price, using the open price as default price
         order_type = self.strategy.order_types["entry"]
@@ -1242,7 +1274,7 @@ class Backtesting:
                 )
                 trade.exit_reason = ExitType.FORCE_EXIT.value
                 self._process_exit_order(
-                    trade.orders[-1], trade, exit_row[DATE_IDX].to_pydatetime(), exit_row, pair
+                    trade.orders[-1], trade, exit_row[DATE_IDX], exit_row, pair
                 )
 
     def trade_slot_available(self, open_trade_count: int) -> bool:
@@ -1435,6 +1467,39 @@ class Backtesting:
             return None
         return row
 
+    def _get_next_main_row(
+        self,
+        data: dict,
+        indexes: dict[str, int],
+        pair: str,
+        current_time: datetime,
+        current_ts: int,
+    ) -> tuple | None:
+        """
+        Get the main candle row for this pair and advance the pair's row index.
+        Returns None if there's no row for this candle - or if the candle is idle (no open trade
+        and no entry signal) and backtest_skip_idle_candles is enabled.
+        """
+        row_index = indexes[pair]
+        scan = None
+        if self._idle_candle_scan and not LocalTrade.bt_trades_open_pp[pair]:
+            scan = self._idle_candle_scan.get(pair)
+        if scan is not None:
+            # Equivalent to validate_row, but uses the precomputed timestamps.
+            scan_dates, scan_candidates = scan
+            if row_index >= len(scan_dates) or scan_dates[row_index] > current_ts:
+                return None
+            row = data[pair][row_index] if scan_candidates[row_index] else None
+        else:
+            row = self.validate_row(data, pair, row_index, current_time)
+            if not row:
+                return None
+
+        row_index += 1
+        indexes[pair] = row_index
+        self.dataprovider._set_dataframe_max_index(pair, self.required_startup + row_index)
+        return row
+
     def _collate_rejected(self, pair, row):
         """
         Temporarily store rejected signal information for downstream use in backtesting_analysis
@@ -1449,6 +1514,19 @@ class Backtesting:
                 self.rejected_dict[pair] = []
             self.rejected_dict[pair].append([row[DATE_IDX], row[ENTER_TAG_IDX]])
 
+    def _manage_trade_open_orders(self, trade: LocalTrade, current_time: datetime, row: tuple):
+        """
+        Manage open orders of one trade, and apply the result to the wallets.
+        """
+        had_open_orders = trade.has_open_orders
+        if self.manage_open_orders(trade, current_time, row):
+            # Remove trade (initial open order never filled)
+            LocalTrade.remove_bt_trade(trade)
+            self.wallets.update_trade_balance(trade)
+        elif had_open_orders:
+            # Apply cancelled or replaced orders
+            self.wallets.update_trade_balance(trade)
+
     def backtest_loop(
         self,
         row: tuple,
@@ -1469,10 +1547,7 @@ class Backtesting:
 
         for t in list(LocalTrade.bt_trades_open_pp[pair]):
             # 1. Manage currently open orders of active trades
-            if self.manage_open_orders(t, current_time, row):
-                # Remove trade (initial open order never filled)
-                LocalTrade.remove_bt_trade(t)
-                self.wallets.update()
+            self._manage_trade_open_orders(t, current_time, row)
 
         # 2. Process entries.
         # without positionstacking, we can only have one open trade per pair.
@@ -1488,7 +1563,7 @@ class Backtesting:
             if self.trade_slot_available(LocalTrade.bt_open_open_trade_count):
                 trade = self._enter_trade(pair, row, trade_dir)
                 if trade:
-                    self.wallets.update()
+                    self.wallets.update_trade_balance(trade)
             else:
                 self._collate_rejected(pair, row)
 
@@ -1496,11 +1571,13 @@ class Backtesting:
             # 3. Process entry orders.
             order = trade.select_order(trade.entry_side, is_open=True)
             if self._try_close_open_order(order, trade, current_time, row):
-                self.wallets.update()
+                self.wallets.update_trade_balance(trade)
 
             # 4. Create exit orders (if any)
             if trade.has_open_position:
                 self._check_trade_exit(trade, row, current_time)  # Place exit order if necessary
+                if trade.has_open_orders:
+                    self.wallets.update_trade_balance(trade)
 
             # 5. Process exit orders.
             order = trade.select_order(trade.exit_side, is_open=True)
@@ -1511,26 +1588,32 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def get_detail_data(self, pair: str, row: tuple) -> BacktestRows | None:
         """
         Spread into detail data
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
+        current_detail_time: datetime = row[DATE_IDX]
         exit_candle_end = current_detail_time + self.timeframe_td
-        detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        # Signals and tags of the main candle apply to all detail candles
+        detail_data = self._get_detail_rows(pair).slice_by_date(
+            current_detail_time, exit_candle_end, tuple(row[LONG_IDX:])
+        )
 
         if len(detail_data) == 0:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        return detail_data
+
+    def _get_detail_rows(self, pair: str) -> BacktestRows:
+        """
+        Get the columnar representation of the detail data for this pair.
+        Built once per detail dataframe and reused for all following backtests.
+        """
+        detail_df = self.detail_data[pair]
+        cached = self._detail_rows.get(pair)
+        if cached is None or cached[0] is not detail_df:
+            cached = (detail_df, BacktestRows.from_dataframe(detail_df, HEADERS[1:5], []))
+            self._detail_rows[pair] = cached
+        return cached[1]
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1585,6 +1668,7 @@ class Backtesting:
         for current_time in self._time_generator(start_date, end_date):
             # Loop for each main candle.
             self.check_abort()
+            current_ts = int(current_time.timestamp())
 
             if self.dynamic_pairlist and self.pairlists:
                 self.pairlists.refresh_pairlist()
@@ -1596,7 +1680,7 @@ class Backtesting:
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time
             )
-            pair_detail_cache: dict[str, list[tuple]] = {}
+            pair_detail_cache: dict[str, BacktestRows] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
 
@@ -1610,17 +1694,11 @@ class Backtesting:
                 trade_dir: LongShort | None = None
                 if is_first:
                     # Main candle
-                    row_index = indexes[pair]
-                    row = self.validate_row(data, pair, row_index, current_time)
+                    row = self._get_next_main_row(data, indexes, pair, current_time, current_ts)
                     if not row:
                         continue
 
-                    row_index += 1
-                    indexes[pair] = row_index
                     is_last_row = current_time == end_date
-                    self.dataprovider._set_dataframe_max_index(
-                        pair, self.required_startup + row_index
-                    )
                     trade_dir = self.check_for_trade_entry(row)
                     pair_tradedir_cache[pair] = trade_dir
 
@@ -7,7 +7,10 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime
+from itertools import chain
 from math import ceil
 from pathlib import Path
 from typing import Any
@@ -21,6 +24,7 @@ from freqtrade.enums import HyperoptState
 from freqtrade.misc import file_dump_json, plural
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import INITIAL_POINTS, HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import EpochTiming, HyperoptWorkerPool
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
@@ -47,6 +51,13 @@ class Hyperopt:
         self.config = config
 
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.async_scheduling = self.config.get("hyperopt_async_scheduling", False)
+        # Asynchronous scheduling submits single epochs - which requires the persistent workers.
+        self.persistent_workers = (
+            self.config.get("hyperopt_persistent_workers", False) or self.async_scheduling
+        )
+        self._worker_pool: HyperoptWorkerPool | None = None
+        self.epoch_timings: list[EpochTiming] = []
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         time_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -134,11 +145,133 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
+    def run_optimizer_parallel(
+        self, parallel: Parallel, asked: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
         """Start optimizer in a parallel way"""
+        if self.persistent_workers:
+            results = self._get_worker_pool(parallel._effective_n_jobs()).map(asked)
+            self.epoch_timings.extend(timing for _, timing in results)
+            return [result for result, _ in results]
 
         return parallel(self.hyperopter.generate_optimizer_wrapped(v) for v in asked)
 
+    def run_optimizer_batches(self, parallel: Parallel, jobs: int, start: int, pbar, task) -> None:
+        """
+        Evaluate epochs in batches of `jobs` epochs.
+        The optimizer is only told about the results once the whole batch has been evaluated.
+        """
+        evals = ceil((self.total_epochs - start) / jobs)
+        for i in range(evals):
+            # Correct the number of epochs to be processed for the last
+            # iteration (should not exceed self.total_epochs in total)
+            n_rest = (i + 1) * jobs - (self.total_epochs - start)
+            current_jobs = jobs - n_rest if n_rest > 0 else jobs
+
+            asked, is_random = self.get_asked_points(
+                n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+            )
+
+            f_val = self.run_optimizer_parallel(
+                parallel,
+                [asked1.params for asked1 in asked],
+            )
+
+            f_val_loss = [v["loss"] for v in f_val]
+            for o_ask, v in zip(asked, f_val_loss, strict=False):
+                self.opt.tell(o_ask, v)
+
+            for j, val in enumerate(f_val):
+                # Use human-friendly indexes here (starting from 1)
+                current = i * jobs + j + 1 + start
+
+                self.evaluate_result(val, current, is_random[j])
+                pbar.update(task, advance=1)
+            self.hyperopter.handle_mp_logging()
+            gc.collect()
+
+            if self.hyperopter.es_epochs > 0 and self.hyperopter.es_terminator.should_terminate(
+                self.opt
+            ):
+                logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
+                break
+
+    def _get_worker_pool(self, jobs: int) -> HyperoptWorkerPool:
+        if self._worker_pool is None:
+            self._worker_pool = self.hyperopter.get_worker_pool(jobs)
+        return self._worker_pool
+
+    def _submit_async_epoch(
+        self, in_flight: dict[Future, tuple[FrozenTrial, bool]], jobs: int
+    ) -> None:
+        """
+        Ask for one new point and submit it to the worker pool.
+        Points already evaluated or currently in flight are skipped.
+        """
+        asked, is_random = self.get_asked_points(
+            n_points=1,
+            dimensions=self.hyperopter.o_dimensions,
+            pending=[trial for trial, _ in in_flight.values()],
+        )
+        if asked:
+            future = self._get_worker_pool(jobs).submit(asked[0].params)
+            in_flight[future] = (asked[0], is_random[0])
+
+    def run_optimizer_async(self, jobs: int, start: int, pbar, task) -> None:
+        """
+        Evaluate epochs while keeping up to `jobs` epochs in flight.
+        Every result is told to the optimizer as soon as it arrives and a replacement point
+        is asked for right away - so a slow epoch doesn't leave the other workers idle.
+        """
+        in_flight: dict[Future, tuple[FrozenTrial, bool]] = {}
+        remaining = self.total_epochs - start
+        current = start
+        early_stop = False
+        while in_flight or (remaining > 0 and not early_stop):
+            while remaining > 0 and not early_stop and len(in_flight) < jobs:
+                remaining -= 1
+                self._submit_async_epoch(in_flight, jobs)
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                trial, is_random = in_flight.pop(future)
+                val, timing = future.result()
+                self.opt.tell(trial, val["loss"])
+                self.epoch_timings.append(timing)
+                current += 1
+                logger.debug(
+                    f"Epoch {current}: queue wait {timing.queue_wait:.3f}s, "
+                    f"compute {timing.compute:.3f}s"
+                )
+                self.evaluate_result(val, current, is_random)
+                pbar.update(task, advance=1)
+            self.hyperopter.handle_mp_logging()
+
+            if (
+                not early_stop
+                and self.hyperopter.es_epochs > 0
+                and self.hyperopter.es_terminator.should_terminate(self.opt)
+            ):
+                logger.info(f"Early stopping after {current} epochs")
+                early_stop = True
+
+    def log_epoch_timings(self, duration: float, jobs: int) -> None:
+        """
+        Log how much time epochs spent waiting for a worker vs. being evaluated.
+        :param duration: Wall clock duration of the optimization, in seconds
+        :param jobs: Number of workers
+        """
+        if not self.epoch_timings or duration <= 0:
+            return
+        queue_wait = sum(t.queue_wait for t in self.epoch_timings)
+        compute = sum(t.compute for t in self.epoch_timings)
+        count = len(self.epoch_timings)
+        logger.info(
+            f"Epoch timings: average queue wait {queue_wait / count:.3f}s, "
+            f"average compute {compute / count:.3f}s, "
+            f"worker utilization {compute / (duration * jobs):.1%}."
+        )
+
     def _set_random_state(self, random_state: int | None) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
 
@@ -148,11 +281,16 @@ class Hyperopt:
             asked.append(self.opt.ask(dimensions))
         return asked
 
-    def duplicate_optuna_asked_points(self, trial: Trial, asked_trials: list[FrozenTrial]) -> bool:
+    def duplicate_optuna_asked_points(
+        self,
+        trial: Trial,
+        asked_trials: list[FrozenTrial],
+        pending: list[FrozenTrial] | None = None,
+    ) -> bool:
         asked_trials_no_dups: list[FrozenTrial] = []
         trials_to_consider = trial.study.get_trials(deepcopy=False, states=[TrialState.COMPLETE])
-        # Check whether we already evaluated the sampled `params`.
-        for t in reversed(trials_to_consider):
+        # Check whether we already evaluated (or are currently evaluating) the sampled `params`.
+        for t in chain(reversed(trials_to_consider), pending or []):
             if trial.params == t.params:
                 return True
         # Check whether same`params` in one batch (asked_trials). Autosampler is doing this.
@@ -163,26 +301,29 @@ class Hyperopt:
             return True
         return False
 
-    def get_asked_points(self, n_points: int, dimensions: dict) -> tuple[list[Any], list[bool]]:
+    def get_asked_points(
+        self, n_points: int, dimensions: dict, pending: list[FrozenTrial] | None = None
+    ) -> tuple[list[Any], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
 
         Steps:
         1. Try to get points using `self.opt.ask` first
-        2. Discard the points that have already been evaluated
+        2. Discard the points that have already been evaluated (or are pending evaluation)
         3. Retry using `self.opt.ask` up to `n_points` times
+        :param pending: Trials which are currently being evaluated
         """
         asked_non_tried: list[FrozenTrial] = []
         optuna_asked_trials = self.get_optuna_asked_points(n_points=n_points, dimensions=dimensions)
         asked_non_tried += [
             x
             for x in optuna_asked_trials
-            if not self.duplicate_optuna_asked_points(x, optuna_asked_trials)
+            if not self.duplicate_optuna_asked_points(x, optuna_asked_trials, pending)
         ]
         i = 0
         while i < 2 * n_points and len(asked_non_tried) < n_points:
             asked_new = self.get_optuna_asked_points(n_points=1, dimensions=dimensions)[0]
-            if not self.duplicate_optuna_asked_points(asked_new, asked_non_tried):
+            if not self.duplicate_optuna_asked_points(asked_new, asked_non_tried, pending):
                 asked_non_tried.append(asked_new)
             i += 1
         if len(asked_non_tried) < n_points:
@@ -251,44 +392,19 @@ class Hyperopt:
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
-                        )
-
-                        f_val = self.run_optimizer_parallel(
-                            parallel,
-                            [asked1.params for asked1 in asked],
-                        )
-
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
-                        self.hyperopter.handle_mp_logging()
-                        gc.collect()
-
-                        if (
-                            self.hyperopter.es_epochs > 0
-                            and self.hyperopter.es_terminator.should_terminate(self.opt)
-                        ):
-                            logger.info(f"Early stopping after {(i + 1) * jobs} epochs")
-                            break
+                    optimize_start = time.time()
+                    if self.async_scheduling:
+                        self.run_optimizer_async(jobs, start, pbar, task)
+                    else:
+                        self.run_optimizer_batches(parallel, jobs, start, pbar, task)
+                    self.log_epoch_timings(time.time() - optimize_start, jobs)
 
         except KeyboardInterrupt:
             print("User interrupted..")
+        finally:
+            if self._worker_pool:
+                self._worker_pool.shutdown()
+                self._worker_pool = None
 
         if self.count_skipped_epochs > 0:
             logger.info(
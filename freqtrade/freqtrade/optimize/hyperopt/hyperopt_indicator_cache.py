@@ -0,0 +1,117 @@
+"""
+Indicator cache for hyperopt with --analyze-per-epoch.
+Reuses the result of populate_indicators() for epochs where none of the
+hyperoptable parameters read by populate_indicators() changed.
+"""
+
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from pandas import DataFrame
+
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import BaseParameter
+
+
+logger = logging.getLogger(__name__)
+
+
+class _ParameterReadRecorder:
+    """
+    Stand-in for a strategy parameter, recording that the parameter has been read.
+    """
+
+    def __init__(self, parameter: BaseParameter, reads: set[str]) -> None:
+        self._parameter = parameter
+        self._reads = reads
+
+    def __getattr__(self, name: str) -> Any:
+        self._reads.add(self._parameter.name)
+        return getattr(self._parameter, name)
+
+
+class IndicatorCache:
+    """
+    LRU cache for analyzed dataframes, bounded by an (approximate) memory budget.
+
+    Entries are keyed on the pair and the values of the parameters populate_indicators()
+    read so far. As parameters may be read conditionally, the set of tracked parameters
+    only ever grows - entries keyed on a smaller set of parameters are no longer hit,
+    and will be evicted eventually.
+    """
+
+    def __init__(self, max_memory_mb: float) -> None:
+        self.max_memory = int(max_memory_mb * 1024 * 1024)
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[DataFrame, int]] = OrderedDict()
+        self._tracked: set[str] = set()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Don't send cached dataframes to hyperopt worker processes.
+        state = self.__dict__.copy()
+        state["_entries"] = OrderedDict()
+        state["memory"] = 0
+        return state
+
+    def _get_key(self, strategy: IStrategy, pair: str) -> tuple:
+        values = {name: param.value for name, param in strategy.enumerate_parameters()}
+        return (pair, tuple((name, values[name]) for name in sorted(self._tracked)))
+
+    def _analyze(self, strategy: IStrategy, pair: str, data: DataFrame) -> DataFrame:
+        """
+        Run populate_indicators() for one pair, recording the optimized parameters it reads.
+        """
+        reads: set[str] = set()
+        shadowed: dict[str, Any] = {}
+        for name, param in strategy.enumerate_parameters():
+            if param.in_space and param.optimize:
+                shadowed[name] = strategy.__dict__.get(name)
+                setattr(strategy, name, _ParameterReadRecorder(param, reads))
+        try:
+            return strategy.advise_all_indicators({pair: data})[pair]
+        finally:
+            for name, previous in shadowed.items():
+                if previous is None:
+                    delattr(strategy, name)
+                else:
+                    setattr(strategy, name, previous)
+            self._tracked |= reads
+
+    def _store(self, key: tuple, dataframe: DataFrame) -> None:
+        size = int(dataframe.memory_usage(index=True).sum())
+        if size > self.max_memory:
+            return
+        self._entries[key] = (dataframe, size)
+        self.memory += size
+        while self.memory > self.max_memory:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.memory -= evicted_size
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Cached equivalent of `strategy.advise_all_indicators()`.
+        Returns copies of cached dataframes, so callers may modify the result.
+        """
+        res = {}
+        for pair, pair_data in data.items():
+            key = self._get_key(strategy, pair)
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                res[pair] = self._entries[key][0].copy()
+                continue
+
+            self.misses += 1
+            res[pair] = self._analyze(strategy, pair, pair_data)
+            # The set of tracked parameters may have changed while analyzing.
+            self._store(self._get_key(strategy, pair), res[pair].copy())
+        logger.debug(
+            f"Indicator cache: {self.hits} hits, {self.misses} misses, "
+            f"{self.memory / 1024 / 1024:.1f} MB used."
+        )
+        return res
@@ -30,7 +30,9 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import HyperoptWorkerPool
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -82,6 +84,12 @@ class HyperOptimizer:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        indicator_cache_mb = self.config.get("hyperopt_indicator_cache_mb", 0)
+        self.indicator_cache: IndicatorCache | None = (
+            IndicatorCache(indicator_cache_mb)
+            if self.analyze_per_epoch and indicator_cache_mb > 0
+            else None
+        )
 
         self.custom_hyperopt = HyperOptAuto(self.config)
 
@@ -95,6 +103,8 @@ class HyperOptimizer:
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
         self.data_pickle_file = data_pickle_file
+        # Memory-mapped hyperopt data - only attached in persistent worker processes.
+        self._processed: dict[str, DataFrame] | None = None
 
         self.market_change = 0.0
 
@@ -124,6 +134,34 @@ class HyperOptimizer:
         """
         logging_mp_handle(log_queue)
 
+    def get_worker_pool(self, n_workers: int) -> HyperoptWorkerPool:
+        """
+        Start persistent worker processes, evaluating epochs with a copy of this optimizer.
+        Must be called after prepare_hyperopt().
+        """
+        return HyperoptWorkerPool(
+            self,
+            n_workers,
+            log_queue,
+            logging.INFO if self.config["verbosity"] < 1 else logging.DEBUG,
+        )
+
+    def attach_processed_data(self) -> None:
+        """
+        Load the hyperopt data once and keep it for all following epochs.
+        Arrays are memory-mapped from the data pickle file, so the data is shared
+        (via the OS page cache) between all workers instead of being copied.
+        """
+        with self.data_pickle_file.open("rb") as f:
+            self._processed = load(f, mmap_mode="r")
+
+    def _load_processed_data(self) -> dict[str, DataFrame]:
+        if self._processed is None:
+            with self.data_pickle_file.open("rb") as f:
+                return load(f, mmap_mode="r")
+        # Backtesting adds columns to the dataframes - keep the attached data untouched.
+        return {pair: df.copy(deep=False) for pair, df in self._processed.items()}
+
     def prepare_hyperopt(self) -> None:
         # Initialize spaces ...
         self.init_spaces()
@@ -311,8 +349,7 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed = self._load_processed_data()
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
             processed = self.advise_and_trim(processed)
@@ -437,7 +474,12 @@ class HyperOptimizer:
         return optuna.create_study(sampler=sampler, direction="minimize")
 
     def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+        if self.indicator_cache:
+            preprocessed = self.indicator_cache.advise_all_indicators(
+                self.backtesting.strategy, data
+            )
+        else:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -0,0 +1,94 @@
+"""
+Persistent worker pool for hyperopt.
+Workers are started once per hyperopt run, receive the optimizer a single time
+and only get the parameters for every epoch afterwards.
+"""
+
+import logging
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from joblib.externals import cloudpickle
+
+from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_setup
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
+
+
+logger = logging.getLogger(__name__)
+
+
+class EpochTiming(NamedTuple):
+    # Seconds between submitting the epoch and a worker starting to evaluate it
+    queue_wait: float
+    # Seconds the worker spent evaluating the epoch
+    compute: float
+
+
+# Optimizer instance of the current worker process - set by the pool initializer.
+_worker_optimizer: "HyperOptimizer | None" = None
+
+
+def _init_worker(optimizer_payload: bytes, log_queue: Any, log_level: int) -> None:
+    """
+    Initialize a worker process.
+    Unpickles the optimizer and attaches the memory-mapped hyperopt data once,
+    so both stay warm for all epochs evaluated by this worker.
+    """
+    global _worker_optimizer
+    logging_mp_setup(log_queue, log_level)
+    _worker_optimizer = cloudpickle.loads(optimizer_payload)
+    _worker_optimizer.attach_processed_data()
+
+
+def _run_epoch(params_dict: dict[str, Any], submitted: float) -> tuple[dict[str, Any], EpochTiming]:
+    if _worker_optimizer is None:
+        raise RuntimeError("Hyperopt worker has not been initialized.")
+    # Wall clock time, as it's compared to the submission time from the main process.
+    started = time.time()
+    result = _worker_optimizer.generate_optimizer(params_dict)
+    return result, EpochTiming(started - submitted, time.time() - started)
+
+
+class HyperoptWorkerPool:
+    """
+    Pool of long-lived hyperopt worker processes.
+    The optimizer (strategy, backtesting instance, ...) is serialized once when the pool
+    is created - instead of once per batch of epochs.
+    """
+
+    def __init__(
+        self, optimizer: "HyperOptimizer", n_workers: int, log_queue: Any, log_level: int
+    ) -> None:
+        self.n_workers = n_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(cloudpickle.dumps(optimizer), log_queue, log_level),
+        )
+        logger.info(f"Started {n_workers} persistent hyperopt workers.")
+
+    def submit(self, params_dict: dict[str, Any]) -> Future:
+        """
+        Schedule evaluation of one epoch.
+        :param params_dict: Parameters to evaluate
+        :return: Future resolving to the result of `generate_optimizer()`
+            and the timing of the epoch
+        """
+        return self._executor.submit(_run_epoch, params_dict, time.time())
+
+    def map(self, asked: list[dict[str, Any]]) -> list[tuple[dict[str, Any], EpochTiming]]:
+        """
+        Evaluate a batch of epochs.
+        :param asked: List of parameter dicts to evaluate
+        :return: Results and timings, in the same order as `asked`
+        """
+        return [future.result() for future in [self.submit(params) for params in asked]]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
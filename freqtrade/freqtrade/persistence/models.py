@@ -8,7 +8,7 @@ import threading
 from contextvars import ContextVar
 from typing import Any, Final
 
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -82,9 +82,16 @@ def init_db(db_url: str) -> None:
     # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
     # Scoped sessions proxy requests to the appropriate thread-local session.
     # Since we also use fastAPI, we need to make it aware of the request id, too
-    Trade.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
-    )
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    # Keep open trades cached in sessions coherent with the database
+    for event_name in ("after_flush", "after_commit", "after_rollback"):
+        event.listen(session_factory, event_name, Trade.reset_open_trades_cache)
+    # Keep the cached count of closed trades coherent with the database
+    event.listen(session_factory, "after_flush", Trade.check_closed_trades_changed)
+    for event_name in ("after_commit", "after_rollback"):
+        event.listen(session_factory, event_name, Trade.end_closed_trades_transaction)
+    Trade.reset_closed_trades_count()
+    Trade.session = scoped_session(session_factory, scopefunc=get_request_or_thread_id)
     Order.session = Trade.session
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from collections.abc import Sequence
 from datetime import UTC, datetime
 
@@ -20,6 +21,10 @@ class PairLocks:
 
     use_db = True
     locks: list[PairLock] = []
+    # Backtesting only: locks by pair and side. Expired and inactive locks are evicted lazily.
+    _active_locks: dict[str, dict[str, list[PairLock]]] = defaultdict(lambda: defaultdict(list))
+    # Locks that expired before this date may have been evicted from _active_locks
+    _evicted_until: datetime | None = None
 
     timeframe: str = ""
 
@@ -30,6 +35,8 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._active_locks = defaultdict(lambda: defaultdict(list))
+            PairLocks._evicted_until = None
 
     @staticmethod
     def lock_pair(
@@ -63,6 +70,7 @@ class PairLocks:
             PairLock.session.commit()
         else:
             PairLocks.locks.append(lock)
+            PairLocks._active_locks[pair][side].append(lock)
         return lock
 
     @staticmethod
@@ -81,6 +89,10 @@ class PairLocks:
 
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
+        elif pair is not None and (
+            PairLocks._evicted_until is None or now >= PairLocks._evicted_until
+        ):
+            return PairLocks._get_active_pair_locks(pair, now, side)
         else:
             locks = [
                 lock
@@ -94,6 +106,30 @@ class PairLocks:
             ]
             return locks
 
+    @staticmethod
+    def _get_active_pair_locks(pair: str, now: datetime, side: str | None) -> list[PairLock]:
+        """
+        Backtesting only: Get currently active locks for this pair from the lock index.
+        Evicts expired and inactive locks - which is only valid as long as time moves forward.
+        """
+        pair_locks = PairLocks._active_locks.get(pair)
+        if not pair_locks:
+            return []
+        locks: list[PairLock] = []
+        for lock_side, side_locks in pair_locks.items():
+            if side is not None and lock_side not in ("*", side):
+                continue
+            if any(lock.lock_end_time < now or not lock.active for lock in side_locks):
+                side_locks[:] = [
+                    lock for lock in side_locks if lock.lock_end_time >= now and lock.active
+                ]
+                PairLocks._evicted_until = max(PairLocks._evicted_until or now, now)
+            locks.extend(side_locks)
+        if len(pair_locks) > 1:
+            # Keep order of creation across sides
+            locks.sort(key=lambda lock: lock.lock_time)
+        return locks
+
     @staticmethod
     def get_pair_longest_lock(
         pair: str, now: datetime | None = None, side: str = "*"
@@ -3,10 +3,12 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
+from bisect import bisect_right
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import chain
 from math import isclose
 from typing import Any, ClassVar, Optional, Self, cast
 
@@ -22,6 +24,7 @@ from sqlalchemy import (
     case,
     desc,
     func,
+    inspect,
     select,
 )
 from sqlalchemy.orm import Mapped, lazyload, mapped_column, relationship, validates
@@ -378,6 +381,49 @@ class Order(ModelBase):
         return Order.session.scalars(select(Order).filter(Order.order_id == order_id)).first()
 
 
+class ClosedTradeIndex:
+    """
+    Closed backtest trades, sorted by close date - globally and per pair.
+    Selecting trades closed after a given date is O(log n + k).
+    """
+
+    def __init__(self) -> None:
+        self._dates: list[datetime] = []
+        self._trades: list[LocalTrade] = []
+        self._pair_dates: dict[str, list[datetime]] = defaultdict(list)
+        self._pair_trades: dict[str, list[LocalTrade]] = defaultdict(list)
+
+    @staticmethod
+    def _insert(
+        dates: list[datetime], trades: list["LocalTrade"], trade: "LocalTrade", close_date: datetime
+    ) -> None:
+        # Trades close in chronological order during backtesting - so this usually appends.
+        idx = bisect_right(dates, close_date)
+        dates.insert(idx, close_date)
+        trades.insert(idx, trade)
+
+    def add(self, trade: "LocalTrade") -> None:
+        close_date = trade.close_date
+        if close_date is None:
+            return
+        self._insert(self._dates, self._trades, trade, close_date)
+        self._insert(self._pair_dates[trade.pair], self._pair_trades[trade.pair], trade, close_date)
+
+    def closed_after(self, close_date: datetime, pair: str | None = None) -> list["LocalTrade"]:
+        """
+        Trades closed after close_date (exclusive), sorted by close date.
+        :param close_date: Only return trades with close_date > close_date
+        :param pair: Optional pair to filter for
+        """
+        if pair:
+            if pair not in self._pair_dates:
+                return []
+            dates, trades = self._pair_dates[pair], self._pair_trades[pair]
+        else:
+            dates, trades = self._dates, self._trades
+        return trades[bisect_right(dates, close_date) :]
+
+
 class LocalTrade:
     """
     Trade database model.
@@ -392,6 +438,8 @@ class LocalTrade:
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
+    # Closed trades (bt_trades) indexed by close date
+    bt_trades_closed_idx: ClosedTradeIndex = ClosedTradeIndex()
     realized_profit: float = 0
 
     id: int = 0
@@ -769,6 +817,7 @@ class LocalTrade:
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
+        LocalTrade.bt_trades_closed_idx = ClosedTradeIndex()
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -1455,6 +1504,13 @@ class LocalTrade:
         """
 
         # Offline mode - without database
+        if is_open is False and close_date:
+            # Used by protections - avoid scanning all closed trades
+            sel_trades = LocalTrade.bt_trades_closed_idx.closed_after(close_date, pair)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            return sel_trades
+
         if is_open is not None:
             if is_open:
                 sel_trades = LocalTrade.bt_trades_open
@@ -1482,6 +1538,7 @@ class LocalTrade:
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
+        LocalTrade.bt_trades_closed_idx.add(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1492,6 +1549,7 @@ class LocalTrade:
             LocalTrade.bt_open_open_trade_count += 1
         else:
             LocalTrade.bt_trades.append(trade)
+            LocalTrade.bt_trades_closed_idx.add(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1512,9 +1570,7 @@ class LocalTrade:
         get open trade count
         """
         if Trade.use_db:
-            return Trade.session.execute(
-                select(func.count(Trade.id)).filter(Trade.is_open.is_(True))
-            ).scalar_one()
+            return len(Trade._get_open_trades_cached())
         else:
             return LocalTrade.bt_open_open_trade_count
 
@@ -1651,6 +1707,15 @@ class Trade(ModelBase, LocalTrade):
     session: ClassVar[SessionType]
 
     use_db: bool = True
+    # Increased whenever trades are flushed, committed or rolled back in any session.
+    # Open trades cached in a session are only valid for the version they were loaded with.
+    open_trades_version: ClassVar[int] = 0
+    # Compare cached open trades with the database on every access (debugging only)
+    check_open_trades_cache: ClassVar[bool] = False
+    # Increased whenever trades are added, deleted, closed or reopened.
+    closed_trades_version: ClassVar[int] = 0
+    # Tuple of closed_trades_version and the number of closed trades
+    _closed_trades_count: ClassVar[tuple[int, int] | None] = None
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
@@ -1767,6 +1832,85 @@ class Trade(ModelBase, LocalTrade):
     def rollback():
         Trade.session.rollback()
 
+    @staticmethod
+    def reset_open_trades_cache(*args) -> None:
+        """
+        Invalidate cached open trades of all sessions.
+        Registered as session event listener for flush, commit and rollback.
+        """
+        Trade.open_trades_version += 1
+
+    @staticmethod
+    def reset_closed_trades_count(*args) -> None:
+        """
+        Invalidate the cached count of closed trades.
+        """
+        Trade.closed_trades_version += 1
+
+    @staticmethod
+    def check_closed_trades_changed(session, flush_context) -> None:
+        """
+        Invalidate the cached count of closed trades if the flush added, deleted,
+        closed or reopened trades.
+        Registered as session event listener for flush.
+        """
+        if any(isinstance(obj, Trade) for obj in chain(session.new, session.deleted)) or any(
+            isinstance(obj, Trade) and inspect(obj).attrs.is_open.history.has_changes()
+            for obj in session.dirty
+        ):
+            Trade.reset_closed_trades_count()
+            session.info["closed_trades_changed"] = True
+
+    @staticmethod
+    def end_closed_trades_transaction(session) -> None:
+        """
+        Invalidate the cached count of closed trades again once the transaction ends,
+        as other sessions only see the changes after the commit.
+        Registered as session event listener for commit and rollback.
+        """
+        if session.info.pop("closed_trades_changed", False):
+            Trade.reset_closed_trades_count()
+
+    @staticmethod
+    def get_closed_trades_count() -> int:
+        """
+        Number of closed trades. Cached until trades are added, deleted, closed or reopened.
+        NOTE: Not supported in Backtesting.
+        """
+        version = Trade.closed_trades_version
+        cached = Trade._closed_trades_count
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        count = (
+            Trade.session.scalar(select(func.count(Trade.id)).filter(Trade.is_open.is_(False))) or 0
+        )
+        Trade._closed_trades_count = (version, count)
+        return count
+
+    @staticmethod
+    def _get_open_trades_cached() -> list["Trade"]:
+        """
+        Open trades, cached in the current session until the next flush, commit or rollback
+        of any session. Avoids repeated queries (and order loading) within one bot iteration.
+        """
+        version = Trade.open_trades_version
+        cached = Trade.session.info.get("open_trades")
+        if cached is not None and cached[0] == version:
+            trades = cached[1]
+            if Trade.check_open_trades_cache:
+                db_trades = Trade.get_trades([Trade.is_open.is_(True)]).all()
+                if sorted(t.id for t in trades) != sorted(t.id for t in db_trades):
+                    logger.warning(
+                        f"Open trades cache out of sync. Cached: {[t.id for t in trades]}, "
+                        f"database: {[t.id for t in db_trades]}."
+                    )
+                    trades = db_trades
+                    Trade.session.info["open_trades"] = (version, trades)
+        else:
+            trades = Trade.get_trades([Trade.is_open.is_(True)]).all()
+            Trade.session.info["open_trades"] = (version, trades)
+        return list(trades)
+
     @staticmethod
     def get_trades_proxy(
         *,
@@ -1788,6 +1932,11 @@ class Trade(ModelBase, LocalTrade):
         :return: unsorted List[Trade]
         """
         if Trade.use_db:
+            if is_open and not open_date and not close_date:
+                trades = Trade._get_open_trades_cached()
+                if pair:
+                    trades = [trade for trade in trades if trade.pair == pair]
+                return cast(list[LocalTrade], trades)
             trade_filter = []
             if pair:
                 trade_filter.append(Trade.pair == pair)
@@ -0,0 +1,213 @@
+"""
+Caches for the full analyzed history (/pair_history) of the webserver.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+from pandas import DataFrame
+
+from freqtrade.configuration.timerange import TimeRange
+from freqtrade.constants import Config
+from freqtrade.data.history import load_data
+from freqtrade.data.history.datahandlers.idatahandler import get_datahandlerclass
+from freqtrade.enums import CandleType
+from freqtrade.ft_types import AnnotationType
+
+
+if TYPE_CHECKING:
+    from freqtrade.data.dataprovider import DataProvider
+    from freqtrade.exchange import Exchange
+    from freqtrade.strategy import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+
+def config_hash(config: Config, exclude: tuple[str, ...] = ()) -> str:
+    """
+    Hash of the configuration, ignoring the keys in `exclude`.
+    """
+    config_str = json.dumps(
+        {k: v for k, v in config.items() if k not in exclude}, default=str, sort_keys=True
+    )
+    return hashlib.sha1(config_str.encode(), usedforsecurity=False).hexdigest()
+
+
+def _files_hash(*paths: Path) -> str:
+    file_hash = hashlib.sha1(usedforsecurity=False)
+    for path in paths:
+        if path.is_file():
+            file_hash.update(path.read_bytes())
+    return file_hash.hexdigest()
+
+
+def _cache_entry_size(value: tuple[DataFrame, ...] | DataFrame) -> int:
+    dataframe = value[0] if isinstance(value, tuple) else value
+    return max(int(dataframe.memory_usage(deep=True).sum()), 1)
+
+
+class AnalysedHistoryCache:
+    """
+    LRU caches for loaded strategies, raw OHLCV data and analyzed dataframes.
+    OHLCV data and analyzed dataframes share a memory budget.
+    Entries are keyed by file hashes / modification times, so changes to the strategy
+    or to the data on disk invalidate them.
+    Not thread-safe - use `lock` around all calls.
+    """
+
+    def __init__(self, max_size_mb: int, max_strategies: int = 5) -> None:
+        self.lock = RLock()
+        self.max_size_mb = max_size_mb
+        # Half of the budget each, as analyzed dataframes contain the OHLCV data, too.
+        max_bytes = max(max_size_mb << 19, 1)
+        self._strategies: LRUCache = LRUCache(maxsize=max_strategies if max_size_mb else 0)
+        self._ohlcv: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=_cache_entry_size)
+        self._results: LRUCache = LRUCache(maxsize=max_bytes, getsizeof=_cache_entry_size)
+
+    @staticmethod
+    def _set(cache: LRUCache, key: Any, value: Any) -> None:
+        try:
+            cache[key] = value
+        except ValueError:
+            # Value is larger than the cache
+            pass
+
+    def get_strategy(self, config: Config, exchange: "Exchange") -> tuple["IStrategy", str]:
+        """
+        Load the strategy from the config, or reuse a previously loaded instance,
+        as long as the strategy file and its parameter file didn't change.
+        The strategy gets a new DataProvider for every request, as the DataProvider caches
+        informative pairs for the timerange of the request.
+        :return: Tuple of the strategy and the hash of its files
+        """
+        from freqtrade.data.dataprovider import DataProvider
+        from freqtrade.resolvers.strategy_resolver import StrategyResolver
+
+        key = (config["strategy"], config_hash(config, exclude=("timerange",)))
+        if cached := self._strategies.get(key):
+            strategy, files_hash = cached
+            file = Path(strategy.__file__)
+            if _files_hash(file, file.with_suffix(".json")) == files_hash:
+                strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
+                return strategy, files_hash
+            logger.info(f"Strategy {config['strategy']} changed, reloading.")
+
+        strategy = StrategyResolver.load_strategy(config)
+        file = Path(strategy.__file__)
+        files_hash = _files_hash(file, file.with_suffix(".json"))
+        strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
+        strategy.ft_bot_start()
+        self._set(self._strategies, key, (strategy, files_hash))
+        return strategy, files_hash
+
+    @staticmethod
+    def _data_file_state(
+        config: Config, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[str, int | None]:
+        """
+        Path and modification time of the OHLCV data file of a pair
+        """
+        datafile = get_datahandlerclass(config["dataformat_ohlcv"])._pair_data_filename(
+            config["datadir"], pair, timeframe, candle_type
+        )
+        return str(datafile), datafile.stat().st_mtime_ns if datafile.is_file() else None
+
+    def ohlcv_key(self, config: Config, pair: str, timeframe: str, startup_candles: int) -> tuple:
+        """
+        Cache key of the OHLCV data on disk, including the modification time of the data file.
+        """
+        candle_type = config.get("candle_type_def", CandleType.SPOT)
+        return (
+            str(config["datadir"]),
+            config["dataformat_ohlcv"],
+            pair,
+            timeframe,
+            candle_type,
+            config.get("timerange"),
+            startup_candles,
+            self._data_file_state(config, pair, timeframe, candle_type)[1],
+        )
+
+    def load_ohlcv(self, config: Config, key: tuple) -> DataFrame | None:
+        """
+        Load OHLCV data from disk, or reuse previously loaded data if the data file didn't change.
+        :param key: Cache key, as returned by `ohlcv_key()`
+        :return: A copy of the dataframe, None if no data is available
+        """
+        _, _, pair, timeframe, candle_type, _, startup_candles, _ = key
+        if (data := self._ohlcv.get(key)) is None:
+            _data = load_data(
+                datadir=config["datadir"],
+                pairs=[pair],
+                timeframe=timeframe,
+                timerange=TimeRange.parse_timerange(config.get("timerange")),
+                data_format=config["dataformat_ohlcv"],
+                candle_type=candle_type,
+                startup_candles=startup_candles,
+            )
+            if pair not in _data:
+                return None
+            data = _data[pair]
+            self._set(self._ohlcv, key, data)
+        # The strategy analysis modifies the dataframe
+        return data.copy()
+
+    def get_result(
+        self, config: Config, key: tuple
+    ) -> tuple[DataFrame, list[AnnotationType]] | None:
+        """
+        Previously analyzed dataframe and annotations - if the informative data loaded
+        during the analysis didn't change.
+        """
+        if (cached := self._results.get(key)) is None:
+            return None
+        dataframe, annotations, informative_files = cached
+        for (pair, timeframe, candle_type), state in informative_files:
+            if self._data_file_state(config, pair, timeframe, candle_type) != state:
+                del self._results[key]
+                return None
+        return dataframe, annotations
+
+    def set_result(
+        self,
+        config: Config,
+        key: tuple,
+        dataframe: DataFrame,
+        annotations: list[AnnotationType],
+        dataprovider: "DataProvider | None",
+    ) -> None:
+        """
+        Cache an analyzed dataframe.
+        :param dataprovider: DataProvider used for the analysis, to track informative data files
+        """
+        informative_files = tuple(
+            (pair_tf, self._data_file_state(config, *pair_tf))
+            for pair_tf in (dataprovider.historic_pairs() if dataprovider else [])
+        )
+        self._set(self._results, key, (dataframe, annotations, informative_files))
+
+    def clear(self) -> None:
+        with self.lock:
+            self._strategies.clear()
+            self._ohlcv.clear()
+            self._results.clear()
+
+
+_cache: AnalysedHistoryCache | None = None
+
+
+def get_analysed_history_cache(config: Config) -> AnalysedHistoryCache:
+    """
+    Process wide cache, sized by `api_server.pair_history_cache_size`.
+    """
+    global _cache
+    max_size_mb = config.get("api_server", {}).get("pair_history_cache_size", 256)
+    if _cache is None or _cache.max_size_mb != max_size_mb:
+        _cache = AnalysedHistoryCache(max_size_mb)
+    return _cache
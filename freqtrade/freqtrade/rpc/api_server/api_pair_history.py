@@ -71,6 +71,7 @@ def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config
             exchange,
             payload.columns,
             payload.live_mode,
+            payload.columnar,
         )
     except Exception as e:
         logger.exception("Error in pair_history_filtered")
@@ -534,6 +534,7 @@ class PairCandlesRequest(BaseModel):
     timeframe: str
     limit: int | None = None
     columns: list[str] | None = None
+    columnar: bool = False
 
 
 class PairHistoryRequest(PairCandlesRequest, ExchangeModePayloadMixin):
@@ -551,6 +552,7 @@ class PairHistory(BaseModel):
     columns: list[str]
     all_columns: list[str] = []
     data: SerializeAsAny[list[Any]]
+    column_data: SerializeAsAny[list[Any]] | None = None
     annotations: list[AnnotationType] | None = None
     length: int
     buy_signals: int
@@ -652,6 +654,34 @@ class Health(BaseModel):
     bot_startup_ts: int | None = None
 
 
+class TimingHistogram(BaseModel):
+    count: int
+    sum: float
+    window: int
+    avg: float | None = None
+    p50: float | None = None
+    p90: float | None = None
+    p99: float | None = None
+    max: float | None = None
+    buckets: dict[str, int]
+
+
+class LoopMetrics(BaseModel):
+    phase: dict[str, TimingHistogram] = {}
+    analyze: dict[str, TimingHistogram] = {}
+    exchange: dict[str, TimingHistogram] = {}
+
+
+class WSChannelStats(BaseModel):
+    channel_id: str
+    depth: int
+    max_depth: int
+    enqueued: int
+    sent: int
+    coalesced: int
+    dropped: int
+
+
 class CustomDataEntry(BaseModel):
     key: str
     type: str
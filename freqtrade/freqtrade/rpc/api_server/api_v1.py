@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import PlainTextResponse
 
 from freqtrade import __version__
 from freqtrade.data.history import get_datahandler
@@ -33,6 +34,7 @@ from freqtrade.rpc.api_server.api_schemas import (
     Locks,
     LocksPayload,
     Logs,
+    LoopMetrics,
     MarketRequest,
     MarketResponse,
     MixTag,
@@ -53,8 +55,16 @@ from freqtrade.rpc.api_server.api_schemas import (
     SysInfo,
     Version,
     WhitelistResponse,
+    WSChannelStats,
 )
-from freqtrade.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
+from freqtrade.rpc.api_server.deps import (
+    get_config,
+    get_exchange,
+    get_message_stream,
+    get_rpc,
+    get_rpc_optional,
+)
+from freqtrade.rpc.api_server.ws.message_stream import MessageStream
 from freqtrade.rpc.rpc import RPCException
 
 
@@ -91,7 +101,11 @@ logger = logging.getLogger(__name__)
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
 # 2.43: Add /profit_all endpoint
-API_VERSION = 2.43
+# 2.44: Add /loop_metrics endpoints
+# 2.45: Add /ws_channels endpoint
+# 2.46: Add columnar option to pair_candles and pair_history
+# 2.47: Add after_id and summary options to /trades
+API_VERSION = 2.47
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -223,9 +237,15 @@ def trades(
     order_by_id: bool = Query(
         True, description="Sort trades by id (default: True). If False, sorts by latest timestamp"
     ),
+    after_id: int | None = Query(
+        None, description="Return trades following this trade id (keyset pagination)"
+    ),
+    summary: bool = Query(False, description="Return trade summaries without orders"),
     rpc: RPC = Depends(get_rpc),
 ):
-    return rpc._rpc_trade_history(limit, offset=offset, order_by_id=order_by_id)
+    return rpc._rpc_trade_history(
+        limit, offset=offset, order_by_id=order_by_id, after_id=after_id, summary=summary
+    )
 
 
 @router.get("/trade/{tradeid}", response_model=OpenTradeSchema, tags=["info", "trading"])
@@ -407,7 +427,7 @@ def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC =
 def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
     # Advanced pair_candles endpoint with column filtering
     return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+        payload.pair, payload.timeframe, payload.limit, payload.columns, payload.columnar
     )
 
 
@@ -573,3 +593,19 @@ def sysinfo():
 @router.get("/health", response_model=Health, tags=["info"])
 def health(rpc: RPC = Depends(get_rpc)):
     return rpc.health()
+
+
+@router.get("/loop_metrics", response_model=LoopMetrics, tags=["info"])
+def loop_metrics(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_loop_metrics()
+
+
+@router.get("/loop_metrics/prometheus", response_class=PlainTextResponse, tags=["info"])
+def loop_metrics_prometheus(rpc: RPC = Depends(get_rpc)):
+    return rpc._rpc_loop_metrics_prometheus()
+
+
+@router.get("/ws_channels", response_model=list[WSChannelStats], tags=["info"])
+def ws_channels(message_stream: MessageStream | None = Depends(get_message_stream)):
+    """Send queue statistics of the connected websocket channels"""
+    return message_stream.channel_stats() if message_stream else []
@@ -11,9 +11,10 @@ from freqtrade.exceptions import FreqtradeException
 from freqtrade.rpc.api_server.api_auth import validate_ws_token
 from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
-from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.message_stream import ChannelMessageQueue, MessageStream
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
+    WSEncodingRequest,
     WSErrorMessage,
     WSMessageSchema,
     WSRequestSchema,
@@ -42,23 +43,36 @@ async def channel_reader(channel: WebSocketChannel, rpc: RPC):
             await channel.send(response.dict(exclude_none=True))
 
 
-async def channel_broadcaster(channel: WebSocketChannel, message_stream: MessageStream):
+async def channel_broadcaster(
+    channel: WebSocketChannel, message_stream: MessageStream, queue: ChannelMessageQueue
+):
     """
-    Iterate over messages in the message stream and send them
+    Iterate over messages in the message stream and queue the subscribed ones.
+    Never waits for the channel, so slow channels don't fall behind the message stream.
     """
     async for message, ts in message_stream:
-        if channel.subscribed_to(message.get("type")):
-            # Log a warning if this channel is behind
-            # on the message stream by a lot
-            if (time.time() - ts) > 60:
-                logger.warning(
-                    f"Channel {channel} is behind MessageStream by 1 minute,"
-                    " this can cause a memory leak if you see this message"
-                    " often, consider reducing pair list size or amount of"
-                    " consumers."
-                )
+        if channel.subscribed_to(message.type):
+            queue.put(message, ts)
+
+
+async def channel_sender(channel: WebSocketChannel, queue: ChannelMessageQueue):
+    """
+    Send the queued messages to the channel
+    """
+    while True:
+        message, ts = await queue.get()
+        # Log a warning if this channel is behind
+        # on the message stream by a lot
+        if (time.time() - ts) > 60:
+            logger.warning(
+                f"Channel {channel} is behind MessageStream by 1 minute,"
+                " older messages will be dropped if you see this message"
+                " often, consider reducing pair list size or amount of"
+                " consumers."
+            )
 
-            await channel.send(message, use_timeout=True)
+        await channel.send(message, use_timeout=True)
+        queue.sent += 1
 
 
 async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
@@ -90,6 +104,17 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # We don't send a response for subscriptions
         return
 
+    elif type_ == RPCRequestType.ENCODING:
+        try:
+            encoding = WSEncodingRequest.model_validate(request).data
+        except ValidationError as e:
+            logger.error(f"Invalid encoding request from {channel}: {e}")
+            return
+        if not channel.set_encoding(encoding):
+            logger.warning(f"Encoding {encoding} requested by {channel} is not available.")
+        # The consumer handles both encodings, so no response is needed
+        return
+
     elif type_ == RPCRequestType.WHITELIST:
         # Get whitelist
         whitelist = rpc._ws_request_whitelist()
@@ -119,6 +144,12 @@ async def message_endpoint(
 ):
     if token:
         async with create_channel(websocket) as channel:
-            await channel.run_channel_tasks(
-                channel_reader(channel, rpc), channel_broadcaster(channel, message_stream)
-            )
+            queue = message_stream.add_channel_queue(channel.channel_id)
+            try:
+                await channel.run_channel_tasks(
+                    channel_reader(channel, rpc),
+                    channel_broadcaster(channel, message_stream, queue),
+                    channel_sender(channel, queue),
+                )
+            finally:
+                message_stream.remove_channel_queue(channel.channel_id)
@@ -12,7 +12,9 @@ from websockets.exceptions import ConnectionClosed
 
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws.serializer import (
+    ArrowWebSocketSerializer,
     HybridJSONWebSocketSerializer,
+    SerializedMessage,
     WebSocketSerializer,
 )
 from freqtrade.rpc.api_server.ws.ws_types import WebSocketType
@@ -80,7 +82,11 @@ class WebSocketChannel:
             # maximum of 3 seconds per message
             self._send_high_limit = min(max(self.avg_send_time * 2, 1), 3)
 
-    async def send(self, message: WSMessageSchemaType | dict[str, Any], use_timeout: bool = False):
+    async def send(
+        self,
+        message: WSMessageSchemaType | dict[str, Any] | SerializedMessage,
+        use_timeout: bool = False,
+    ):
         """
         Send a message on the wrapped websocket. If the sending
         takes too long, it will raise a TimeoutError and
@@ -160,6 +166,22 @@ class WebSocketChannel:
         """
         self._subscriptions = subscriptions
 
+    def set_encoding(self, encoding: str) -> bool:
+        """
+        Set the encoding of the messages sent to this channel.
+        With "arrow", messages containing a dataframe are sent as binary Arrow IPC frames.
+
+        :param encoding: "json" or "arrow"
+        :returns: True if the encoding is supported
+        """
+        if encoding == "arrow":
+            if not ArrowWebSocketSerializer.is_available():
+                return False
+            self._wrapped_ws = ArrowWebSocketSerializer(self._websocket)
+        else:
+            self._wrapped_ws = HybridJSONWebSocketSerializer(self._websocket)
+        return True
+
     def subscribed_to(self, message_type: str) -> bool:
         """
         Check if this channel is subscribed to the message_type
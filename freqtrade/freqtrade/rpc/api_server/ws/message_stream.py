@@ -1,5 +1,95 @@
 import asyncio
+import logging
 import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from itertools import count
+from typing import Any
+
+from freqtrade.enums import RPCMessageType
+from freqtrade.rpc.api_server.ws.serializer import SerializedMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelMessageQueue:
+    """
+    Bounded queue of messages waiting to be sent to one channel.
+    Analyzed dataframe messages are coalesced per pair and timeframe, so only the
+    latest one is sent. If the queue is full, the oldest message is dropped.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self._maxsize = maxsize
+        self._messages: OrderedDict[Hashable, tuple[SerializedMessage, float]] = OrderedDict()
+        self._ids = count()
+        self._event = asyncio.Event()
+
+        self.enqueued = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @staticmethod
+    def _coalesce_key(message: SerializedMessage) -> Hashable | None:
+        if message.type == RPCMessageType.ANALYZED_DF:
+            data = message.message.get("data")
+            if isinstance(data, dict) and (key := data.get("key")):
+                return tuple(key)
+        return None
+
+    def put(self, message: SerializedMessage, ts: float) -> None:
+        """
+        Add a message to the queue, without waiting.
+
+        :param message: The message to send
+        :param ts: Timestamp of the message
+        """
+        self.enqueued += 1
+        key = self._coalesce_key(message)
+        if key is not None and key in self._messages:
+            # Replace the older message, keeping its position in the queue
+            self._messages[key] = (message, ts)
+            self.coalesced += 1
+            return
+
+        if len(self._messages) >= self._maxsize:
+            self._messages.popitem(last=False)
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 100 == 0:
+                logger.warning(
+                    f"Message queue is full, dropped {self.dropped} messages so far. "
+                    "Consider reducing pair list size or amount of consumers."
+                )
+
+        self._messages[key if key is not None else next(self._ids)] = (message, ts)
+        self.max_depth = max(self.max_depth, len(self._messages))
+        self._event.set()
+
+    async def get(self) -> tuple[SerializedMessage, float]:
+        """
+        Wait for and remove the oldest message of the queue
+        """
+        while not self._messages:
+            self._event.clear()
+            await self._event.wait()
+        _, item = self._messages.popitem(last=False)
+        return item
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "depth": len(self._messages),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
 
 
 class MessageStream:
@@ -11,15 +101,38 @@ class MessageStream:
     def __init__(self):
         self._loop = asyncio.get_running_loop()
         self._waiter = self._loop.create_future()
+        # Send queues of the connected channels, by channel id
+        self._channel_queues: dict[str, ChannelMessageQueue] = {}
 
     def publish(self, message):
         """
-        Publish a message to this MessageStream
+        Publish a message to this MessageStream.
+        The message is serialized once, and shared by all channels.
 
         :param message: The message to publish
         """
         waiter, self._waiter = self._waiter, self._loop.create_future()
-        waiter.set_result((message, time.time(), self._waiter))
+        waiter.set_result((SerializedMessage(message), time.time(), self._waiter))
+
+    def add_channel_queue(self, channel_id: str, maxsize: int = 1000) -> ChannelMessageQueue:
+        """
+        Create the send queue for a channel
+        """
+        queue = ChannelMessageQueue(maxsize)
+        self._channel_queues[channel_id] = queue
+        return queue
+
+    def remove_channel_queue(self, channel_id: str) -> None:
+        self._channel_queues.pop(channel_id, None)
+
+    def channel_stats(self) -> list[dict[str, Any]]:
+        """
+        Backpressure and drop counters of all channel queues
+        """
+        return [
+            {"channel_id": channel_id, **queue.stats()}
+            for channel_id, queue in self._channel_queues.items()
+        ]
 
     async def __aiter__(self):
         """
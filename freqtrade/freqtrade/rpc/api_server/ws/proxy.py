@@ -33,7 +33,9 @@ class WebSocketProxy:
         """
         Send data on the wrapped websocket
         """
-        if hasattr(self._websocket, "send_text"):
+        if isinstance(data, bytes) and hasattr(self._websocket, "send_bytes"):
+            await self._websocket.send_bytes(data)
+        elif hasattr(self._websocket, "send_text"):
             await self._websocket.send_text(data)
         else:
             await self._websocket.send(data)
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from importlib.util import find_spec
 from typing import Any
 
 import orjson
@@ -13,6 +14,35 @@ from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
 logger = logging.getLogger(__name__)
 
+# Schema metadata key of the message (without dataframe) in binary Arrow IPC frames
+ARROW_MESSAGE_KEY = b"freqtrade_message"
+
+
+class SerializedMessage:
+    """
+    A message sent to multiple channels.
+    It's serialized once per serializer class, and the result is shared by all channels.
+    """
+
+    __slots__ = ("_serialized", "message")
+
+    def __init__(self, message: dict[str, Any]):
+        self.message = message
+        self._serialized: dict[type, Any] = {}
+
+    def __repr__(self):
+        return f"SerializedMessage({self.message})"
+
+    @property
+    def type(self) -> str | None:
+        return self.message.get("type")
+
+    def serialize(self, serializer: "WebSocketSerializer"):
+        serializer_cls = type(serializer)
+        if serializer_cls not in self._serialized:
+            self._serialized[serializer_cls] = serializer._serialize(self.message)
+        return self._serialized[serializer_cls]
+
 
 class WebSocketSerializer(ABC):
     def __init__(self, websocket: WebSocketProxy):
@@ -26,8 +56,11 @@ class WebSocketSerializer(ABC):
     def _deserialize(self, data):
         raise NotImplementedError()
 
-    async def send(self, data: WSMessageSchemaType | dict[str, Any]):
-        await self._websocket.send(self._serialize(data))
+    async def send(self, data: WSMessageSchemaType | dict[str, Any] | SerializedMessage):
+        if isinstance(data, SerializedMessage):
+            await self._websocket.send(data.serialize(self))
+        else:
+            await self._websocket.send(self._serialize(data))
 
     async def recv(self) -> bytes:
         data = await self._websocket.recv()
@@ -43,6 +76,63 @@ class HybridJSONWebSocketSerializer(WebSocketSerializer):
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+class ArrowWebSocketSerializer(HybridJSONWebSocketSerializer):
+    """
+    Sends messages containing a dataframe (analyzed_df) as binary Arrow IPC stream,
+    with the remainder of the message as JSON in the schema metadata.
+    All other messages are sent as JSON.
+    """
+
+    @staticmethod
+    def is_available() -> bool:
+        return find_spec("pyarrow") is not None
+
+    def _serialize(self, data):
+        df = _get_message_dataframe(data)
+        if df is None:
+            return super()._serialize(data)
+
+        import pyarrow as pa
+
+        envelope = {**data, "data": {k: v for k, v in data["data"].items() if k != "df"}}
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except pa.ArrowException as e:
+            # E.g. object columns with mixed types
+            logger.debug(f"Dataframe can't be converted to Arrow, sending JSON: {e}")
+            return super()._serialize(data)
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                ARROW_MESSAGE_KEY: orjson.dumps(envelope, default=_json_default),
+            }
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def _deserialize(self, data: str | bytes):
+        if isinstance(data, str):
+            return super()._deserialize(data)
+
+        import pyarrow as pa
+
+        with pa.ipc.open_stream(data) as reader:
+            table = reader.read_all()
+        message = rapidjson.loads(table.schema.metadata[ARROW_MESSAGE_KEY])
+        message["data"]["df"] = table.to_pandas()
+        return message
+
+
+def _get_message_dataframe(data) -> DataFrame | None:
+    if isinstance(data, dict) and isinstance(message_data := data.get("data"), dict):
+        df = message_data.get("df")
+        if isinstance(df, DataFrame):
+            return df
+    return None
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
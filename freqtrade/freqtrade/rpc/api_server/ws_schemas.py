@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, TypedDict
+from typing import Any, Literal, TypedDict
 
 from pandas import DataFrame
 from pydantic import BaseModel, ConfigDict
@@ -37,6 +37,11 @@ class WSSubscribeRequest(WSRequestSchema):
     data: list[RPCMessageType]
 
 
+class WSEncodingRequest(WSRequestSchema):
+    type: RPCRequestType = RPCRequestType.ENCODING
+    data: Literal["json", "arrow"] = "json"
+
+
 class WSWhitelistRequest(WSRequestSchema):
     type: RPCRequestType = RPCRequestType.WHITELIST
     data: None = None
@@ -21,9 +21,14 @@ from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import (
+    ArrowWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSAnalyzedDFRequest,
+    WSEncodingRequest,
     WSMessageSchema,
     WSRequestSchema,
     WSSubscribeRequest,
@@ -84,12 +89,22 @@ class ExternalMessageConsumer:
         # callbacks for the messages
         self.topics = [RPCMessageType.WHITELIST, RPCMessageType.ANALYZED_DF]
 
+        # Receive dataframes as binary Arrow IPC frames instead of JSON.
+        # Producers not supporting this keep sending JSON.
+        self.dataframe_encoding = self._emc_config.get("dataframe_encoding", "json")
+        if self.dataframe_encoding == "arrow" and not ArrowWebSocketSerializer.is_available():
+            logger.warning("pyarrow is not available, falling back to JSON dataframe encoding.")
+            self.dataframe_encoding = "json"
+
         # Allow setting data for each initial request
         self._initial_requests: list[WSRequestSchema] = [
             WSSubscribeRequest(data=self.topics),
             WSWhitelistRequest(),
             WSAnalyzedDFRequest(),
         ]
+        if self.dataframe_encoding == "arrow":
+            # Must be sent first, so the initial dataframes are sent binary, too
+            self._initial_requests.insert(0, WSEncodingRequest(data="arrow"))
 
         # Specify which function to use for which RPCMessageType
         self._message_handlers: dict[str, Callable[[str, WSMessageSchema], None]] = {
@@ -196,7 +211,16 @@ class ExternalMessageConsumer:
                 async with websockets.connect(
                     ws_url, max_size=self.message_size_limit, ping_interval=None
                 ) as ws:
-                    async with create_channel(ws, channel_id=name, send_throttle=0.5) as channel:
+                    async with create_channel(
+                        ws,
+                        channel_id=name,
+                        send_throttle=0.5,
+                        serializer_cls=(
+                            ArrowWebSocketSerializer
+                            if self.dataframe_encoding == "arrow"
+                            else HybridJSONWebSocketSerializer
+                        ),
+                    ) as channel:
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
 
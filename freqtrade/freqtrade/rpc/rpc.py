@@ -11,14 +11,18 @@ from typing import TYPE_CHECKING, Any
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
-from pandas import DataFrame, NaT
-from sqlalchemy import func, select
+from numpy import int64, isnan, mean, nan
+from pandas import DataFrame
+from sqlalchemy import Select, and_, case, func, or_, select
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.constants import CANCEL_REASON, DEFAULT_DATAFRAME_COLUMNS, Config
-from freqtrade.data.history import load_data
+from freqtrade.constants import (
+    CANCEL_REASON,
+    DATETIME_PRINT_FORMAT,
+    DEFAULT_DATAFRAME_COLUMNS,
+    Config,
+)
 from freqtrade.data.metrics import DrawDownResult, calculate_expectancy, calculate_max_drawdown
 from freqtrade.enums import (
     CandleType,
@@ -34,6 +38,7 @@ from freqtrade.exchange import Exchange, timeframe_to_minutes, timeframe_to_msec
 from freqtrade.exchange.exchange_utils import price_to_precision
 from freqtrade.ft_types import AnnotationType
 from freqtrade.loggers import bufferHandler
+from freqtrade.misc import dataframe_to_columns, dataframe_to_rows
 from freqtrade.persistence import CustomDataWrapper, KeyValueStore, Order, PairLocks, Trade
 from freqtrade.persistence.models import PairLock, custom_data_rpc_wrapper
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
@@ -46,7 +51,9 @@ from freqtrade.util import (
     dt_now,
     dt_ts,
     dt_ts_def,
+    dt_ts_none,
     format_date,
+    loop_metrics,
     shorten_date,
 )
 from freqtrade.wallets import PositionWallet, Wallet
@@ -54,6 +61,32 @@ from freqtrade.wallets import PositionWallet, Wallet
 
 logger = logging.getLogger(__name__)
 
+# Columns loaded for trade history summaries
+TRADE_SUMMARY_COLUMNS = (
+    Trade.id,
+    Trade.pair,
+    Trade.base_currency,
+    Trade.stake_currency,
+    Trade.is_open,
+    Trade.is_short,
+    Trade.exchange,
+    Trade.amount,
+    Trade.stake_amount,
+    Trade.strategy,
+    Trade.enter_tag,
+    Trade.timeframe,
+    Trade.open_date,
+    Trade.open_rate,
+    Trade.close_date,
+    Trade.close_rate,
+    Trade.realized_profit,
+    Trade.close_profit,
+    Trade.close_profit_abs,
+    Trade.exit_reason,
+    Trade.leverage,
+    Trade.trading_mode,
+)
+
 
 class RPCException(Exception):
     """
@@ -394,29 +427,45 @@ class RPC:
         profit_units: dict[date, dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.session.execute(
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
+        # Start of each period, most recent first
+        period_starts = [start_date - time_offset(step) for step in range(0, timescale)]
+        # Aggregate all periods in one query - the period index is derived from the close date.
+        # Comparisons against the period boundaries work on every supported database.
+        period_trades = (
+            select(
+                case(
+                    *[(Trade.close_date >= start, idx) for idx, start in enumerate(period_starts)]
+                ).label("period"),
+                Trade.close_profit_abs,
+            )
+            .filter(
+                Trade.is_open.is_(False),
+                Trade.close_date >= period_starts[-1],
+                Trade.close_date < (start_date + time_offset(1)),
+            )
+            .subquery()
+        )
+        period_results = {
+            row.period: row
+            for row in Trade.session.execute(
+                select(
+                    period_trades.c.period,
+                    func.sum(period_trades.c.close_profit_abs).label("profit_abs"),
+                    func.count().label("trade_count"),
+                ).group_by(period_trades.c.period)
             ).all()
+        }
 
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+        for idx, profitday in enumerate(period_starts):
+            period_result = period_results.get(idx)
+            curdayprofit = (period_result.profit_abs or 0) if period_result else 0
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": period_result.trade_count if period_result else 0,
             }
 
         data = [
@@ -442,25 +491,97 @@ class RPC:
             "data": data,
         }
 
-    def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> dict:
-        """Returns the X last trades"""
-        order_by: Any = Trade.id if order_by_id else Trade.close_date.desc()
-        if limit:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)])
-                .order_by(order_by)
-                .limit(limit)
-                .offset(offset)
-            )
+    @staticmethod
+    def _trade_summary_to_json(row: Any) -> dict[str, Any]:
+        """
+        Trade history entry from a row of TRADE_SUMMARY_COLUMNS.
+        Returns a subset of the keys of `Trade.to_json()` - without orders, fees, funding fees,
+        stoploss values, min / max rates and durations.
+        """
+        open_date = row.open_date.replace(tzinfo=UTC)
+        close_date = row.close_date.replace(tzinfo=UTC) if row.close_date else None
+        try:
+            base_currency = row.base_currency or row.pair.split("/")[0]
+            quote_currency = row.stake_currency or row.pair.split("/")[1].split(":")[0]
+        except IndexError:
+            base_currency = quote_currency = ""
+        return {
+            "trade_id": row.id,
+            "pair": row.pair,
+            "base_currency": base_currency,
+            "quote_currency": quote_currency,
+            "is_open": row.is_open,
+            "is_short": row.is_short,
+            "exchange": row.exchange,
+            "amount": round(row.amount, 8),
+            "stake_amount": round(row.stake_amount, 8),
+            "strategy": row.strategy,
+            "enter_tag": row.enter_tag,
+            "timeframe": row.timeframe,
+            "open_date": open_date.strftime(DATETIME_PRINT_FORMAT),
+            "open_timestamp": dt_ts(open_date),
+            "open_rate": row.open_rate,
+            "close_date": close_date.strftime(DATETIME_PRINT_FORMAT) if close_date else None,
+            "close_timestamp": dt_ts_none(close_date),
+            "close_rate": row.close_rate,
+            "realized_profit": row.realized_profit or 0.0,
+            "profit_ratio": row.close_profit,
+            "profit_pct": round(row.close_profit * 100, 2) if row.close_profit else None,
+            "profit_abs": row.close_profit_abs,
+            "exit_reason": row.exit_reason,
+            "leverage": row.leverage,
+            "trading_mode": row.trading_mode,
+        }
+
+    def _rpc_trade_history(
+        self,
+        limit: int,
+        offset: int = 0,
+        order_by_id: bool = False,
+        after_id: int | None = None,
+        summary: bool = False,
+    ) -> dict:
+        """
+        Returns the X last trades
+        :param after_id: Keyset pagination - only return trades following the trade with
+            this id in the selected sort order. Unlike offset, this stays fast for deep pages.
+        :param summary: Only query the columns needed for a trade history, without orders.
+        """
+        trade_filter: list[Any] = [Trade.is_open.is_(False)]
+        if limit and order_by_id:
+            order_by: list[Any] = [Trade.id]
+            if after_id is not None:
+                trade_filter.append(Trade.id > after_id)
         else:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)]).order_by(Trade.close_date.desc())
-            )
+            # Trade id as tie-breaker, so trades closed at the same time are paginated correctly
+            order_by = [Trade.close_date.desc(), Trade.id.desc()]
+            if after_id is not None:
+                after_close_date = Trade.session.scalar(
+                    select(Trade.close_date).filter(Trade.id == after_id, *trade_filter)
+                )
+                if after_close_date is None:
+                    raise RPCException(f"Closed trade {after_id} not found.")
+                trade_filter.append(
+                    or_(
+                        Trade.close_date < after_close_date,
+                        and_(Trade.close_date == after_close_date, Trade.id < after_id),
+                    )
+                )
 
-        output = [trade.to_json() for trade in trades]
-        total_trades = Trade.session.scalar(
-            select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
-        )
+        query: Select
+        if summary:
+            query = select(*TRADE_SUMMARY_COLUMNS).filter(*trade_filter)
+        else:
+            query = Trade.get_trades_query(trade_filter)
+        query = query.order_by(*order_by)
+        if limit:
+            query = query.limit(limit).offset(offset)
+
+        if summary:
+            output = [self._trade_summary_to_json(row) for row in Trade.session.execute(query)]
+        else:
+            output = [trade.to_json() for trade in Trade.session.scalars(query)]
+        total_trades = Trade.get_closed_trades_count()
 
         return {
             "trades": output,
@@ -482,7 +603,15 @@ class RPC:
             else:
                 return "draws"
 
-        trades = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
+        # Only query for necessary columns - avoids loading every closed trade object.
+        trades = Trade.session.execute(
+            select(
+                Trade.exit_reason,
+                Trade.close_profit,
+                Trade.open_date,
+                Trade.close_date,
+            ).filter(Trade.is_open.is_(False))
+        ).all()
         # Duration
         dur: dict[str, list[float]] = {"wins": [], "draws": [], "losses": []}
         # Exit reason
@@ -505,11 +634,14 @@ class RPC:
 
     def _collect_trade_statistics_data(
         self,
-        trades: Sequence["Trade"],
+        trades: Sequence[Any],
         stake_currency: str,
         fiat_display_currency: str,
     ) -> dict[str, Any]:
-        """Iterate trades, calculate various statistics, and return intermediate results."""
+        """
+        Iterate trades, calculate various statistics, and return intermediate results.
+        Closed trades can be passed as rows of the necessary columns.
+        """
         profit_all_coin = []
         profit_all_ratio = []
         profit_closed_coin = []
@@ -582,20 +714,33 @@ class RPC:
         """
         start_date = datetime.fromtimestamp(0) if start_date is None else start_date
 
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
+        closed_filter = Trade.is_open.is_(False) & (Trade.close_date >= start_date)
 
         if direction == "long":
             dir_filter = Trade.is_short.is_(False)
-            trade_filter = trade_filter & dir_filter
+            closed_filter = closed_filter & dir_filter
         elif direction == "short":
             dir_filter = Trade.is_short.is_(True)
-            trade_filter = trade_filter & dir_filter
-
-        trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
+            closed_filter = closed_filter & dir_filter
+
+        # Closed trades are only loaded as rows of the necessary columns, open trades
+        # (requiring the current rate) come from the open trades cache.
+        closed_trades = Trade.session.execute(
+            select(
+                Trade.id,
+                Trade.is_open,
+                Trade.open_date,
+                Trade.close_date,
+                Trade.close_profit,
+                Trade.close_profit_abs,
+            ).filter(closed_filter)
         ).all()
+        open_trades = [
+            trade
+            for trade in Trade.get_open_trades()
+            if direction is None or trade.is_short == (direction == "short")
+        ]
+        trades: list[Any] = sorted([*closed_trades, *open_trades], key=lambda t: t.id)
 
         stats = self._collect_trade_statistics_data(trades, stake_currency, fiat_display_currency)
 
@@ -684,8 +829,8 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
+        first_date = trades[0].open_date.replace(tzinfo=UTC) if trades else None
+        last_date = trades[-1].open_date.replace(tzinfo=UTC) if trades else None
         num = float(len(durations) or 1)
         bot_start = KeyValueStore.get_datetime_value("bot_start_time")
         return {
@@ -1417,7 +1562,13 @@ class RPC:
         last_analyzed: datetime,
         selected_cols: list[str] | None,
         annotations: list[AnnotationType],
+        columnar: bool = False,
     ) -> dict[str, Any]:
+        """
+        Convert an analyzed dataframe to the pair_candles / pair_history response.
+        :param columnar: Return the data as one list per column (`column_data`),
+            instead of one list per row (`data`).
+        """
         has_content = len(dataframe) != 0
         dataframe_columns = list(dataframe.columns)
         signals = {
@@ -1441,15 +1592,8 @@ class RPC:
                     signals[sig_type] = int(mask.sum())
                     dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
 
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
-
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+        # NaN, NaT and inf are converted to None while encoding the columns
+        column_data = dataframe_to_columns(dataframe)
 
         res = {
             "pair": pair,
@@ -1458,7 +1602,7 @@ class RPC:
             "strategy": strategy,
             "all_columns": dataframe_columns,
             "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
+            "data": [] if columnar else dataframe_to_rows(column_data),
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1474,6 +1618,8 @@ class RPC:
             "data_stop_ts": 0,
             "annotations": annotations,
         }
+        if columnar:
+            res["column_data"] = column_data
         if has_content:
             res.update(
                 {
@@ -1486,7 +1632,12 @@ class RPC:
         return res
 
     def _rpc_analysed_dataframe(
-        self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """Analyzed dataframe in Dict form"""
 
@@ -1501,6 +1652,7 @@ class RPC:
             last_analyzed,
             selected_cols,
             annotations,
+            columnar,
         )
 
     def __rpc_analysed_dataframe_raw(
@@ -1560,6 +1712,7 @@ class RPC:
         exchange: Exchange,
         selected_cols: list[str] | None,
         live: bool,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Analyzed dataframe in Dict form, with full history loading and strategy analysis.
@@ -1569,15 +1722,19 @@ class RPC:
         timerange_parsed = TimeRange.parse_timerange(config.get("timerange"))
 
         from freqtrade.data.converter import trim_dataframe
-        from freqtrade.data.dataprovider import DataProvider
         from freqtrade.persistence.usedb_context import FtNoDBContext
-        from freqtrade.resolvers.strategy_resolver import StrategyResolver
+        from freqtrade.rpc.analysed_history_cache import config_hash, get_analysed_history_cache
 
-        with FtNoDBContext():
+        # Strategies, OHLCV data and analyzed results are reused across requests.
+        history_cache = get_analysed_history_cache(config)
+        # Loading the strategy updates the config - so the hash must be calculated upfront.
+        request_hash = config_hash(config)
+        with FtNoDBContext(), history_cache.lock:
             strategy_name = ""
             startup_candles = 0
+            strategy_hash = ""
             if config.get("strategy"):
-                strategy = StrategyResolver.load_strategy(config)
+                strategy, strategy_hash = history_cache.get_strategy(config, exchange)
                 startup_candles = strategy.startup_candle_count
                 strategy_name = strategy.get_strategy_name()
 
@@ -1592,35 +1749,40 @@ class RPC:
                     candle_type=config.get("candle_type_def", CandleType.SPOT),
                     until_ms=timerange_parsed.stopts,
                 )
+                result_key = None
             else:
-                _data = load_data(
-                    datadir=config["datadir"],
-                    pairs=[pair],
-                    timeframe=timeframe,
-                    timerange=timerange_parsed,
-                    data_format=config["dataformat_ohlcv"],
-                    candle_type=config.get("candle_type_def", CandleType.SPOT),
-                    startup_candles=startup_candles,
-                )
-                if pair not in _data:
-                    raise RPCException(
-                        f"No data for {pair}, {timeframe} in {config.get('timerange')} found."
-                    )
-                data = _data[pair]
-
-            annotations = []
-            if config.get("strategy"):
-                strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
-                strategy.ft_bot_start()
-
-                df_analyzed = strategy.analyze_ticker(data, {"pair": pair})
-                df_analyzed = trim_dataframe(
-                    df_analyzed, timerange_parsed, startup_candles=startup_candles
-                )
-                annotations = strategy.ft_plot_annotations(pair=pair, dataframe=df_analyzed)
+                ohlcv_key = history_cache.ohlcv_key(config, pair, timeframe, startup_candles)
+                result_key = (strategy_hash, request_hash, ohlcv_key)
 
+            cached = history_cache.get_result(config, result_key) if result_key else None
+            if cached is not None:
+                df_analyzed, annotations = cached
             else:
-                df_analyzed = data
+                if not live:
+                    _data = history_cache.load_ohlcv(config, ohlcv_key)
+                    if _data is None:
+                        raise RPCException(
+                            f"No data for {pair}, {timeframe} in {config.get('timerange')} found."
+                        )
+                    data = _data
+
+                annotations = []
+                if config.get("strategy"):
+                    df_analyzed = strategy.analyze_ticker(data, {"pair": pair})
+                    df_analyzed = trim_dataframe(
+                        df_analyzed, timerange_parsed, startup_candles=startup_candles
+                    )
+                    annotations = strategy.ft_plot_annotations(pair=pair, dataframe=df_analyzed)
+                else:
+                    df_analyzed = data
+                if result_key:
+                    history_cache.set_result(
+                        config,
+                        result_key,
+                        df_analyzed,
+                        annotations,
+                        strategy.dp if config.get("strategy") else None,
+                    )
 
             return RPC._convert_dataframe_to_dict(
                 strategy_name,
@@ -1630,6 +1792,7 @@ class RPC:
                 dt_now(),
                 selected_cols,
                 annotations,
+                columnar,
             )
 
     def _rpc_plot_config(self) -> dict[str, Any]:
@@ -1701,6 +1864,14 @@ class RPC:
 
         return res
 
+    @staticmethod
+    def _rpc_loop_metrics() -> dict[str, Any]:
+        return loop_metrics.to_dict()
+
+    @staticmethod
+    def _rpc_loop_metrics_prometheus() -> str:
+        return loop_metrics.to_prometheus()
+
     def _update_market_direction(self, direction: MarketDirection) -> None:
         self._freqtrade.strategy.market_direction = direction
 
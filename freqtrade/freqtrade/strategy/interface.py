@@ -4,15 +4,24 @@ This module defines the interface to apply for strategies
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from math import isinf, isnan
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, concat
 from pydantic import ValidationError
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH, Config, IntOrInf, ListPairsWithTimeframes
+from freqtrade.constants import (
+    CUSTOM_TAG_MAX_LENGTH,
+    DEFAULT_DATAFRAME_COLUMNS,
+    Config,
+    IntOrInf,
+    ListPairsWithTimeframes,
+)
 from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
@@ -108,6 +117,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # run "populate_indicators" only for new candle
     process_only_new_candles: bool = True
 
+    # Number of candles analyzed using populate_indicators_incremental() before
+    # the indicators are fully recalculated (and compared) using populate_indicators()
+    incremental_recompute_candles: int = 100
+
     use_exit_signal: bool
     exit_profit_only: bool
     exit_profit_offset: float
@@ -153,6 +166,12 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self.__last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Duration of the last analysis per pair, in seconds
+        self.analyze_timings: dict[str, float] = {}
+        # Analyzed dataframes which have not been stored in the dataprovider yet
+        self.__analyzed_dataframes: dict[str, tuple[DataFrame, bool]] = {}
+        # Last analyzed dataframe and number of incrementally analyzed candles per pair
+        self.__incremental_state: dict[str, tuple[DataFrame, int]] = {}
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -271,6 +290,26 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return self.populate_sell_trend(dataframe, metadata)
 
+    def populate_indicators_incremental(
+        self, dataframe: DataFrame, metadata: dict, new_candles: int
+    ) -> DataFrame | None:
+        """
+        Populate indicators for new candles only - optional.
+        Used instead of populate_indicators() in dry/live mode when new candles arrive,
+        if `process_only_new_candles` is enabled.
+        The dataframe contains the indicators calculated during the previous analysis -
+        only the last `new_candles` rows contain just candle data.
+        Streaming indicators (`freqtrade.strategy.streaming_indicators`) initialized
+        in populate_indicators() allow calculating these rows without processing the whole
+        dataframe again.
+        :param dataframe: DataFrame with previously calculated indicators and new candles
+        :param metadata: Additional information, like the currently traded pair
+        :param new_candles: Number of new candles at the end of the dataframe
+        :return: a Dataframe with all mandatory indicators for the strategies,
+            or None to use populate_indicators() instead.
+        """
+        return None
+
     def bot_start(self, **kwargs) -> None:
         """
         Called only once after bot instantiation.
@@ -1198,13 +1237,17 @@ class IStrategy(ABC, HyperStrategyMixin):
         logger.debug("TA Analysis Ended")
         return dataframe
 
-    def _analyze_ticker_internal(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+    def _analyze_ticker_internal(
+        self, dataframe: DataFrame, metadata: dict, publish: bool = True
+    ) -> DataFrame:
         """
         Parses the given candle (OHLCV) data and returns a populated DataFrame
         add several TA indicators and buy signal to it
         WARNING: Used internally only, may skip analysis if `process_only_new_candles` is set.
         :param dataframe: Dataframe containing data from exchange
         :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :param publish: Store the analyzed dataframe in the dataprovider.
+            If False, the dataframe is kept until `_publish_analyzed_dataframes()` is called.
         :return: DataFrame of candle (OHLCV) data with indicator data and signals added
         """
         pair = str(metadata.get("pair"))
@@ -1214,13 +1257,15 @@ class IStrategy(ABC, HyperStrategyMixin):
         # always run if process_only_new_candles is set to false
         if not self.process_only_new_candles or new_candle:
             # Defs that only make change on new candle data.
-            dataframe = self.analyze_ticker(dataframe, metadata)
+            if self._incremental_analysis_supported():
+                dataframe = self._analyze_ticker_incremental(dataframe, metadata)
+            else:
+                dataframe = self.analyze_ticker(dataframe, metadata)
 
             self.__last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
-
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self.__analyzed_dataframes[pair] = (dataframe, new_candle)
+            if publish:
+                self._publish_analyzed_dataframes([pair])
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1230,13 +1275,147 @@ class IStrategy(ABC, HyperStrategyMixin):
 
         return dataframe
 
-    def analyze_pair(self, pair: str) -> None:
+    def _incremental_analysis_supported(self) -> bool:
+        return (
+            type(self).populate_indicators_incremental
+            is not IStrategy.populate_indicators_incremental
+            and self.process_only_new_candles
+            and not self._ft_informative
+            and not self.config.get("exchange", {}).get("use_public_trades", False)
+        )
+
+    def _analyze_ticker_incremental(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Analyze new candles using populate_indicators_incremental(), based on the previously
+        analyzed dataframe.
+        Falls back to analyze_ticker() if the previous dataframe doesn't match the candle data.
+        Every `incremental_recompute_candles` candles, indicators are fully recalculated -
+        and compared to the incremental result to detect drift.
+        :param dataframe: Dataframe containing data from exchange
+        :param metadata: Metadata dictionary with additional data (e.g. 'pair')
+        :return: DataFrame of candle (OHLCV) data with indicator data and signals added
+        """
+        pair = metadata["pair"]
+        previous, candles = self.__incremental_state.pop(pair, (None, 0))
+        analyzed = None
+        if previous is not None:
+            analyzed, new_candles = self._populate_new_candles(previous, dataframe, metadata)
+            candles += new_candles
+
+        if analyzed is None or candles >= self.incremental_recompute_candles:
+            full = self.analyze_ticker(dataframe, metadata)
+            if analyzed is not None:
+                self._check_incremental_drift(pair, analyzed, full, candles)
+            analyzed, candles = full, 0
+
+        self.__incremental_state[pair] = (analyzed, candles)
+        return analyzed
+
+    def _populate_new_candles(
+        self, previous: DataFrame, dataframe: DataFrame, metadata: dict
+    ) -> tuple[DataFrame | None, int]:
+        """
+        Append the new candles of dataframe to the previously analyzed dataframe
+        and analyze them using populate_indicators_incremental().
+        :return: Tuple of (analyzed dataframe or None if not possible, number of new candles)
+        """
+        dates = dataframe["date"]
+        last_idx = int(dates.searchsorted(previous["date"].iloc[-1]))
+        if last_idx >= len(dataframe) or dates.iloc[last_idx] != previous["date"].iloc[-1]:
+            return None, 0
+        overlap = last_idx + 1
+        new_candles = len(dataframe) - overlap
+        if new_candles == 0 or overlap > len(previous):
+            return None, new_candles
+
+        old = previous.iloc[-overlap:]
+        # Indicators of previous candles are only valid if their candle data didn't change.
+        if not np.array_equal(
+            old["date"].values, dates.iloc[:overlap].values
+        ) or not np.array_equal(
+            old[DEFAULT_DATAFRAME_COLUMNS[1:]].to_numpy(dtype="float64"),
+            dataframe[DEFAULT_DATAFRAME_COLUMNS[1:]].iloc[:overlap].to_numpy(dtype="float64"),
+            equal_nan=True,
+        ):
+            return None, new_candles
+
+        signal_columns = [s.value for s in SignalType] + [s.value for s in SignalTagType]
+        combined = concat(
+            [old.drop(columns=signal_columns, errors="ignore"), dataframe.iloc[overlap:]],
+            ignore_index=True,
+        )
+        logger.debug(f"Populating indicators incrementally for pair {metadata.get('pair')}.")
+        result = self.populate_indicators_incremental(combined, metadata, new_candles)
+        if result is None:
+            return None, new_candles
+        result = self.advise_entry(result, metadata)
+        result = self.advise_exit(result, metadata)
+        return result, new_candles
+
+    def _check_incremental_drift(
+        self, pair: str, incremental: DataFrame, full: DataFrame, candles: int
+    ) -> None:
+        """
+        Warn if incrementally calculated indicators differ from the full calculation.
+        Only the incrementally analyzed candles are compared - excluding startup candles,
+        which depend on the start of the dataframe.
+        """
+        if len(incremental) != len(full):
+            logger.warning(
+                f"Incremental analysis for {pair} returned {len(incremental)} candles, "
+                f"populate_indicators() returned {len(full)} candles."
+            )
+            return
+        rows = min(candles, len(full) - self.startup_candle_count)
+        if rows <= 0:
+            return
+        incremental = incremental.iloc[-rows:]
+        full = full.iloc[-rows:]
+        drifted = []
+        for col in full.columns.intersection(incremental.columns):
+            if col in DEFAULT_DATAFRAME_COLUMNS or full[col].dtype.kind not in "fiub":
+                continue
+            if not np.allclose(
+                incremental[col].to_numpy(dtype="float64"),
+                full[col].to_numpy(dtype="float64"),
+                rtol=1e-6,
+                equal_nan=True,
+            ):
+                drifted.append(col)
+        if drifted:
+            logger.warning(
+                f"Incrementally calculated indicators for {pair} differ from "
+                f"populate_indicators(): {', '.join(drifted)}. Using recalculated indicators."
+            )
+
+    def _publish_analyzed_dataframes(self, pairs: list[str]) -> None:
+        """
+        Store analyzed dataframes in the dataprovider (and emit them to consumers),
+        in the order of pairs.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        for pair in pairs:
+            if pair not in self.__analyzed_dataframes:
+                continue
+            dataframe, new_candle = self.__analyzed_dataframes.pop(pair)
+            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+    def analyze_pair(self, pair: str, publish: bool = True) -> None:
         """
         Fetch data for this pair from dataprovider and analyze.
         Stores the dataframe into the dataprovider.
         The analyzed dataframe is then accessible via `dp.get_analyzed_dataframe()`.
         :param pair: Pair to analyze.
+        :param publish: Store the analyzed dataframe in the dataprovider right away.
         """
+        start = time.perf_counter()
+        try:
+            self._analyze_pair(pair, publish)
+        finally:
+            self.analyze_timings[pair] = time.perf_counter() - start
+
+    def _analyze_pair(self, pair: str, publish: bool) -> None:
         dataframe = self.dp.ohlcv(
             pair, self.timeframe, candle_type=self.config.get("candle_type_def", CandleType.SPOT)
         )
@@ -1250,7 +1429,7 @@ class IStrategy(ABC, HyperStrategyMixin):
             )
 
             dataframe = strategy_safe_wrapper(self._analyze_ticker_internal, message="")(
-                dataframe, {"pair": pair}
+                dataframe, {"pair": pair}, publish=publish
             )
 
             validator.assert_df(dataframe)
@@ -1265,10 +1444,33 @@ class IStrategy(ABC, HyperStrategyMixin):
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `analyze_workers` > 1, pairs are analyzed concurrently in a thread pool.
+        Analyzed dataframes are stored in the dataprovider in the order of pairs.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        self.analyze_timings = {}
+        workers = min(self.config.get("analyze_workers", 1), len(pairs))
+        if workers <= 1:
+            for pair in pairs:
+                self.analyze_pair(pair)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analyze") as executor:
+            # Exceptions are handled within analyze_pair - consume results to surface others.
+            list(executor.map(lambda pair: self.analyze_pair(pair, publish=False), pairs))
+        self._publish_analyzed_dataframes(pairs)
+        logger.debug(
+            f"Analyzed {len(pairs)} pairs using {workers} threads - slowest pairs: "
+            + ", ".join(f"{pair}: {duration:.2f}s" for pair, duration in self.slowest_pairs(3))
+        )
+
+    def slowest_pairs(self, count: int) -> list[tuple[str, float]]:
+        """
+        Pairs which took the longest to analyze during the last analysis.
+        :param count: Number of pairs to return
+        :return: List of (pair, duration in seconds), slowest first
+        """
+        return sorted(self.analyze_timings.items(), key=lambda x: x[1], reverse=True)[:count]
 
     def get_latest_candle(
         self,
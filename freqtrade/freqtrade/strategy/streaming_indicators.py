@@ -0,0 +1,222 @@
+"""
+Streaming (stateful) versions of common indicators.
+
+Each indicator keeps the state required to calculate the next value, so new candles can be
+processed without recalculating the whole series.
+Results match the corresponding TA-Lib functions when fed the same series from the start.
+Missing values (NaN) are skipped - they result in NaN output and don't change the state.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from math import isnan, sqrt
+
+import numpy as np
+
+
+def _values(values: Iterable[float] | float) -> list[float]:
+    if np.isscalar(values):
+        return [float(values)]  # type: ignore[arg-type]
+    return np.asarray(values, dtype="float64").tolist()
+
+
+class StreamingEMA:
+    """
+    Exponential moving average, seeded with the simple moving average of the first
+    `period` values (like `ta.EMA()`).
+    """
+
+    def __init__(self, period: int = 30) -> None:
+        if period < 1:
+            raise ValueError("period must be >= 1.")
+        self.period = period
+        self._k = 2.0 / (period + 1)
+        self._seed: list[float] = []
+        self.value: float | None = None
+
+    def update_one(self, value: float) -> float:
+        if isnan(value):
+            return np.nan
+        if self.value is None:
+            self._seed.append(value)
+            if len(self._seed) < self.period:
+                return np.nan
+            self.value = sum(self._seed) / self.period
+            self._seed = []
+        else:
+            self.value += self._k * (value - self.value)
+        return self.value
+
+    def update(self, values: Iterable[float] | float) -> np.ndarray:
+        """
+        Process new values.
+        :param values: New values (e.g. closes of the new candles), oldest first
+        :return: Indicator values for the new values
+        """
+        return np.array([self.update_one(value) for value in _values(values)])
+
+
+class StreamingRSI:
+    """
+    Relative strength index using Wilder's smoothing (like `ta.RSI()`).
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        if period < 1:
+            raise ValueError("period must be >= 1.")
+        self.period = period
+        self._prev: float | None = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    def _rsi(self) -> float:
+        total = self._avg_gain + self._avg_loss
+        return 100.0 * self._avg_gain / total if total != 0 else 0.0
+
+    def update_one(self, value: float) -> float:
+        if isnan(value):
+            return np.nan
+        prev, self._prev = self._prev, value
+        if prev is None:
+            return np.nan
+        change = value - prev
+        gain = max(change, 0.0)
+        loss = max(-change, 0.0)
+        if self._count < self.period:
+            # Seed with the average of the first `period` changes
+            self._count += 1
+            self._avg_gain += gain / self.period
+            self._avg_loss += loss / self.period
+            return self._rsi() if self._count == self.period else np.nan
+        self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+        self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+        return self._rsi()
+
+    def update(self, values: Iterable[float] | float) -> np.ndarray:
+        """
+        Process new values.
+        :param values: New values (e.g. closes of the new candles), oldest first
+        :return: Indicator values for the new values
+        """
+        return np.array([self.update_one(value) for value in _values(values)])
+
+
+class StreamingATR:
+    """
+    Average true range using Wilder's smoothing (like `ta.ATR()`).
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        if period < 1:
+            raise ValueError("period must be >= 1.")
+        self.period = period
+        self._prev_close: float | None = None
+        self._seed: list[float] = []
+        self.value: float | None = None
+
+    def update_one(self, high: float, low: float, close: float) -> float:
+        if isnan(high) or isnan(low) or isnan(close):
+            return np.nan
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return np.nan
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        if self.value is None:
+            self._seed.append(true_range)
+            if len(self._seed) < self.period:
+                return np.nan
+            self.value = sum(self._seed) / self.period
+            self._seed = []
+        else:
+            self.value = (self.value * (self.period - 1) + true_range) / self.period
+        return self.value
+
+    def update(
+        self,
+        high: Iterable[float] | float,
+        low: Iterable[float] | float,
+        close: Iterable[float] | float,
+    ) -> np.ndarray:
+        """
+        Process new candles.
+        :return: Indicator values for the new candles
+        """
+        return np.array(
+            [
+                self.update_one(*hlc)
+                for hlc in zip(_values(high), _values(low), _values(close), strict=True)
+            ]
+        )
+
+
+class StreamingBollinger:
+    """
+    Bollinger bands based on the simple moving average and the population standard deviation
+    (like `ta.BBANDS()`).
+    """
+
+    def __init__(self, period: int = 20, stds: float = 2.0) -> None:
+        if period < 1:
+            raise ValueError("period must be >= 1.")
+        self.period = period
+        self.stds = stds
+        self._window: deque[float] = deque(maxlen=period)
+
+    def update_one(self, value: float) -> tuple[float, float, float]:
+        if isnan(value):
+            return np.nan, np.nan, np.nan
+        self._window.append(value)
+        if len(self._window) < self.period:
+            return np.nan, np.nan, np.nan
+        # Recalculated from the window (instead of running sums) to avoid accumulating
+        # floating point errors.
+        mid = sum(self._window) / self.period
+        std = sqrt(sum((x - mid) ** 2 for x in self._window) / self.period)
+        return mid + self.stds * std, mid, mid - self.stds * std
+
+    def update(self, values: Iterable[float] | float) -> np.ndarray:
+        """
+        Process new values.
+        :param values: New values (e.g. closes of the new candles), oldest first
+        :return: Array of shape (len(values), 3) with the upper, middle and lower band
+        """
+        return np.array([self.update_one(value) for value in _values(values)]).reshape(-1, 3)
+
+
+class StreamingMACD:
+    """
+    Moving average convergence divergence (like `ta.MACD()`).
+    The fast EMA starts so its first value aligns with the first value of the slow EMA.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        if slow < fast:
+            fast, slow = slow, fast
+        self._fast = StreamingEMA(fast)
+        self._slow = StreamingEMA(slow)
+        self._signal = StreamingEMA(signal)
+        self._skip_fast = slow - fast
+
+    def update_one(self, value: float) -> tuple[float, float, float]:
+        if isnan(value):
+            return np.nan, np.nan, np.nan
+        slow = self._slow.update_one(value)
+        if self._skip_fast > 0:
+            self._skip_fast -= 1
+            return np.nan, np.nan, np.nan
+        macd = self._fast.update_one(value) - slow
+        if isnan(macd):
+            return np.nan, np.nan, np.nan
+        signal = self._signal.update_one(macd)
+        if isnan(signal):
+            return np.nan, np.nan, np.nan
+        return macd, signal, macd - signal
+
+    def update(self, values: Iterable[float] | float) -> np.ndarray:
+        """
+        Process new values.
+        :param values: New values (e.g. closes of the new candles), oldest first
+        :return: Array of shape (len(values), 3) with macd, signal and histogram
+        """
+        return np.array([self.update_one(value) for value in _values(values)]).reshape(-1, 3)
@@ -21,7 +21,8 @@ from freqtrade.util.formatters import (
     round_value,
 )
 from freqtrade.util.ft_precise import FtPrecise
-from freqtrade.util.measure_time import MeasureTime
+from freqtrade.util.loop_metrics import LoopMetrics, loop_metrics
+from freqtrade.util.measure_time import MeasureTime, TimingStats
 from freqtrade.util.periodic_cache import PeriodicCache
 from freqtrade.util.progress_tracker import (  # noqa F401
     get_progress_tracker,
@@ -53,7 +54,10 @@ __all__ = [
     "format_duration",
     "fmt_coin",
     "fmt_coin2",
+    "LoopMetrics",
+    "loop_metrics",
     "MeasureTime",
+    "TimingStats",
     "print_rich_table",
     "print_df_rich_table",
     "CustomProgress",
@@ -0,0 +1,127 @@
+import time
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any
+
+
+# Upper bounds (in seconds) of the histogram buckets
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class RollingHistogram:
+    """
+    Durations (in seconds) of the last `window` measurements, summarized as percentiles.
+    Additionally keeps lifetime count, sum and histogram bucket counts.
+    """
+
+    def __init__(self, window: int = 500) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._bucket_counts = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, duration: float) -> None:
+        self._samples.append(duration)
+        self._bucket_counts[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+
+    def buckets(self) -> dict[str, int]:
+        """
+        Cumulative lifetime bucket counts, keyed by upper bound ("+Inf" last).
+        """
+        res: dict[str, int] = {}
+        cumulative = 0
+        for bound, count in zip(
+            HISTOGRAM_BUCKETS + (float("inf"),), self._bucket_counts, strict=True
+        ):
+            cumulative += count
+            res["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return res
+
+    def to_dict(self) -> dict[str, Any]:
+        samples = sorted(self._samples)
+        window = len(samples)
+
+        def percentile(pct: float) -> float | None:
+            if not samples:
+                return None
+            return samples[min(window - 1, int(pct * window))]
+
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "window": window,
+            "avg": sum(samples) / window if window else None,
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "p99": percentile(0.99),
+            "max": samples[-1] if samples else None,
+            "buckets": self.buckets(),
+        }
+
+
+class LoopMetrics:
+    """
+    Registry of rolling timing histograms, grouped by category
+    (bot loop phases, analysis per pair, exchange endpoints).
+    Thread-safe, as exchange calls and pair analysis can happen from multiple threads.
+    """
+
+    def __init__(self, window: int = 500) -> None:
+        self._window = window
+        self._lock = Lock()
+        self._metrics: dict[str, dict[str, RollingHistogram]] = {}
+
+    def add(self, group: str, name: str, duration: float) -> None:
+        with self._lock:
+            group_metrics = self._metrics.setdefault(group, {})
+            if name not in group_metrics:
+                group_metrics[name] = RollingHistogram(self._window)
+            group_metrics[name].add(duration)
+
+    @contextmanager
+    def measure(self, group: str, name: str) -> Iterator[None]:
+        """
+        Measure the duration of a block of code. Failing blocks are measured, too.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(group, name, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics = {}
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        with self._lock:
+            return {
+                group: {name: hist.to_dict() for name, hist in sorted(entries.items())}
+                for group, entries in sorted(self._metrics.items())
+            }
+
+    def to_prometheus(self) -> str:
+        """
+        Render all histograms in the prometheus text exposition format.
+        """
+        lines: list[str] = []
+        for group, entries in self.to_dict().items():
+            metric = f"freqtrade_{group}_duration_seconds"
+            lines.append(f"# HELP {metric} Duration of {group} calls in seconds.")
+            lines.append(f"# TYPE {metric} histogram")
+            for name, values in entries.items():
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                for bound, count in values["buckets"].items():
+                    lines.append(f'{metric}_bucket{{name="{label}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_sum{{name="{label}"}} {values["sum"]}')
+                lines.append(f'{metric}_count{{name="{label}"}} {values["count"]}')
+        return "\n".join(lines) + "\n"
+
+
+# Process wide registry, shared by the bot loop and the exchange retrier.
+loop_metrics = LoopMetrics()
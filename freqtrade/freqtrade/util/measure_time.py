@@ -43,3 +43,28 @@ class MeasureTime:
         self._callback(duration, self._time_limit)
 
         self.__cache["value"] = True
+
+
+class TimingStats:
+    """
+    Running statistics of durations (in seconds).
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.last: float | None = None
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        self.max = max(self.max, duration)
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        return {"count": self.count, "last": self.last, "avg": self.avg, "max": self.max}
@@ -3,6 +3,7 @@
 
 import logging
 from datetime import datetime, timedelta
+from math import isclose
 from typing import Literal, NamedTuple
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
@@ -33,6 +34,15 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class TradeBalance(NamedTuple):
+    stake_amount: float
+    realized_profit: float
+    used_stake: float
+    # Base currency (spot) or pair (futures) of the trade
+    key: str
+    balance: Wallet | PositionWallet
+
+
 class Wallets:
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
@@ -42,6 +52,16 @@ class Wallets:
         self._positions: dict[str, PositionWallet] = {}
         self._start_cap: dict[str, float] = {}
 
+        # Balances of open trades in dry-run mode
+        self._trade_balances: dict[LocalTrade, TradeBalance] = {}
+        self._balances_by_key: dict[str, dict[LocalTrade, Wallet | PositionWallet]] = {}
+        self._tot_in_trades = 0.0
+        self._tot_realized_profit = 0.0
+        self._used_stake = 0.0
+        self._cross_margin = 0.0
+        self._check_interval: int = config.get("backtest_wallets_check_interval", 0)
+        self._updates_since_check = 0
+
         self._stake_currency = self._exchange.get_proxy_coin()
 
         if isinstance(_start_cap := config["dry_run_wallet"], float | int):
@@ -96,59 +116,96 @@ class Wallets:
             return pos.position
         return 0
 
-    def _update_dry(self) -> None:
+    def _get_trade_balance(self, trade: LocalTrade) -> TradeBalance:
         """
-        Update from database in dry-run mode
-        - Apply profits of closed trades on top of stake amount
-        - Subtract currently tied up stake_amount in open trades
-        - update balances for currencies currently in trades
+        Contribution of one open trade to the dry-run wallets
         """
-        # Recreate _wallets to reset closed trade balances
-        _wallets = {}
-        _positions = {}
-        open_trades = Trade.get_trades_proxy(is_open=True)
-        if not self._is_backtest:
-            # Live / Dry-run mode
-            tot_profit = Trade.get_total_closed_profit()
-        else:
-            # Backtest mode
-            tot_profit = LocalTrade.bt_total_profit
-        tot_profit += sum(trade.realized_profit for trade in open_trades)
-        tot_in_trades = sum(trade.stake_amount for trade in open_trades)
-        used_stake = 0.0
-
         if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
-            for trade in open_trades:
-                curr = self._exchange.get_pair_base_currency(trade.pair)
-                used_stake += sum(
-                    o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
-                )
-                pending = sum(
-                    o.amount
-                    for o in trade.open_orders
-                    if o.amount and o.ft_order_side == trade.exit_side
-                )
-                curr_wallet_bal = self._start_cap.get(curr, 0)
-
-                _wallets[curr] = Wallet(
+            curr = self._exchange.get_pair_base_currency(trade.pair)
+            used_stake = sum(
+                o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
+            )
+            pending = sum(
+                o.amount
+                for o in trade.open_orders
+                if o.amount and o.ft_order_side == trade.exit_side
+            )
+            curr_wallet_bal = self._start_cap.get(curr, 0)
+            return TradeBalance(
+                stake_amount=trade.stake_amount,
+                realized_profit=trade.realized_profit,
+                used_stake=used_stake,
+                key=curr,
+                balance=Wallet(
                     curr,
                     curr_wallet_bal + trade.amount - pending,
                     pending,
                     trade.amount + curr_wallet_bal,
-                )
-        else:
-            for position in open_trades:
-                _positions[position.pair] = PositionWallet(
-                    position.pair,
-                    position=position.amount,
-                    leverage=position.leverage,
-                    collateral=position.stake_amount,
-                    side=position.trade_direction,
-                )
+                ),
+            )
+        return TradeBalance(
+            stake_amount=trade.stake_amount,
+            realized_profit=trade.realized_profit,
+            used_stake=trade.stake_amount,
+            key=trade.pair,
+            balance=PositionWallet(
+                trade.pair,
+                position=trade.amount,
+                leverage=trade.leverage,
+                collateral=trade.stake_amount,
+                side=trade.trade_direction,
+            ),
+        )
 
-            used_stake = tot_in_trades
+    def _update_dry(self) -> None:
+        """
+        Update from database in dry-run mode
+        - Apply profits of closed trades on top of stake amount
+        - Subtract currently tied up stake_amount in open trades
+        - update balances for currencies currently in trades
+        """
+        # Recreate balances to reset closed trade balances
+        self._trade_balances = {}
+        self._balances_by_key = {}
+        self._tot_in_trades = 0.0
+        self._tot_realized_profit = 0.0
+        self._used_stake = 0.0
+        for trade in Trade.get_trades_proxy(is_open=True):
+            self._add_trade_balance(trade, self._get_trade_balance(trade))
+        self._apply_dry_balances()
+
+    def _add_trade_balance(self, trade: LocalTrade, balance: TradeBalance) -> None:
+        self._trade_balances[trade] = balance
+        self._balances_by_key.setdefault(balance.key, {})[trade] = balance.balance
+        self._tot_in_trades += balance.stake_amount
+        self._tot_realized_profit += balance.realized_profit
+        self._used_stake += balance.used_stake
+
+    def _remove_trade_balance(self, trade: LocalTrade) -> None:
+        balance = self._trade_balances.pop(trade)
+        key_balances = self._balances_by_key[balance.key]
+        del key_balances[trade]
+        if not key_balances:
+            del self._balances_by_key[balance.key]
+        self._tot_in_trades -= balance.stake_amount
+        self._tot_realized_profit -= balance.realized_profit
+        self._used_stake -= balance.used_stake
+        if not self._trade_balances:
+            # Avoid accumulating float errors
+            self._tot_in_trades = 0.0
+            self._tot_realized_profit = 0.0
+            self._used_stake = 0.0
+
+    def _apply_dry_balances(self) -> None:
+        """
+        Build wallets and positions from the balances of all open trades.
+        """
+        self._wallets = {}
+        self._positions = {}
+        for key in self._balances_by_key:
+            self._apply_key_balance(key)
 
-        cross_margin = 0.0
+        self._cross_margin = 0.0
         if self._config.get("margin_mode") == "cross":
             # In cross-margin mode, the total balance is used as collateral.
             # This is moved as "free" into the stake currency balance.
@@ -158,23 +215,109 @@ class Wallets:
                     continue
                 rate = self._exchange.get_conversion_rate(curr, self._stake_currency)
                 if rate:
-                    cross_margin += bal * rate
+                    self._cross_margin += bal * rate
+
+        self._apply_stake_balance()
+        for currency, bal in self._start_cap.items():
+            if currency not in self._wallets:
+                self._wallets[currency] = Wallet(currency, bal, 0, bal)
 
-        current_stake = self._start_cap.get(self._stake_currency, 0) + tot_profit - tot_in_trades
-        total_stake = current_stake + used_stake
+    def _apply_key_balance(self, key: str) -> None:
+        """
+        Update the wallet (spot) or position (futures) of one currency / pair.
+        With multiple trades for the same currency / pair, the latest trade wins.
+        """
+        if key_balances := self._balances_by_key.get(key):
+            balance = next(reversed(key_balances.values()))
+            if isinstance(balance, PositionWallet):
+                self._positions[key] = balance
+            else:
+                self._wallets[key] = balance
+        else:
+            self._positions.pop(key, None)
+            if key in self._start_cap:
+                bal = self._start_cap[key]
+                self._wallets[key] = Wallet(key, bal, 0, bal)
+            else:
+                self._wallets.pop(key, None)
 
-        _wallets[self._stake_currency] = Wallet(
+    def _apply_stake_balance(self) -> None:
+        if not self._is_backtest:
+            # Live / Dry-run mode
+            tot_profit = Trade.get_total_closed_profit()
+        else:
+            # Backtest mode
+            tot_profit = LocalTrade.bt_total_profit
+        tot_profit += self._tot_realized_profit
+
+        current_stake = (
+            self._start_cap.get(self._stake_currency, 0) + tot_profit - self._tot_in_trades
+        )
+        total_stake = current_stake + self._used_stake
+
+        self._wallets[self._stake_currency] = Wallet(
             currency=self._stake_currency,
-            free=current_stake + cross_margin,
-            used=used_stake,
+            free=current_stake + self._cross_margin,
+            used=self._used_stake,
             total=total_stake,
         )
-        for currency, bal in self._start_cap.items():
-            if currency not in _wallets:
-                _wallets[currency] = Wallet(currency, bal, 0, bal)
 
-        self._wallets = _wallets
-        self._positions = _positions
+    def update_trade_balance(self, trade: LocalTrade) -> None:
+        """
+        Backtesting only: Apply the changes of one trade (order fill, order cancel, trade close
+        or removal) to the wallets - instead of recalculating the balances of all open trades.
+        With backtest_wallets_check_interval, the result is periodically compared to a full update.
+        """
+        if not self._is_backtest:
+            self.update()
+            return
+        is_open = trade in LocalTrade.bt_trades_open_pp.get(trade.pair, [])
+        old_balance = self._trade_balances.get(trade)
+        if old_balance is not None:
+            if is_open:
+                # Replace in place to keep the order of trades
+                balance = self._get_trade_balance(trade)
+                self._trade_balances[trade] = balance
+                self._balances_by_key[balance.key][trade] = balance.balance
+                self._tot_in_trades += balance.stake_amount - old_balance.stake_amount
+                self._tot_realized_profit += balance.realized_profit - old_balance.realized_profit
+                self._used_stake += balance.used_stake - old_balance.used_stake
+            else:
+                self._remove_trade_balance(trade)
+            self._apply_key_balance(old_balance.key)
+        elif is_open:
+            balance = self._get_trade_balance(trade)
+            self._add_trade_balance(trade, balance)
+            self._apply_key_balance(balance.key)
+        self._apply_stake_balance()
+
+        self._updates_since_check += 1
+        if self._check_interval and self._updates_since_check >= self._check_interval:
+            self._check_trade_balances()
+
+    def _check_trade_balances(self) -> None:
+        """
+        Compare the incrementally updated wallets with a full update.
+        Keeps the result of the full update.
+        """
+        self._updates_since_check = 0
+        wallets, positions = self._wallets, self._positions
+        self._update_dry()
+
+        def differs(current: dict, expected: dict) -> bool:
+            return current.keys() != expected.keys() or any(
+                not isclose(value, expected_value, rel_tol=1e-9, abs_tol=1e-9)
+                if isinstance(value, float | int) and isinstance(expected_value, float | int)
+                else value != expected_value
+                for key, entry in current.items()
+                for value, expected_value in zip(entry, expected[key], strict=True)
+            )
+
+        if differs(wallets, self._wallets) or differs(positions, self._positions):
+            logger.warning(
+                "Incrementally updated wallets differ from full update. "
+                f"Incremental: {wallets}, {positions}. Full: {self._wallets}, {self._positions}."
+            )
 
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
@@ -57,6 +57,10 @@ class Worker:
         internals_config = self._config.get("internals", {})
         self._throttle_secs = internals_config.get("process_throttle_secs", PROCESS_THROTTLE_SECS)
         self._heartbeat_interval = internals_config.get("heartbeat_interval", 60)
+        self._candle_driven = internals_config.get("candle_driven_loop", False)
+        # Close time (timestamp) of the next candle of any active timeframe
+        self._next_candle_close: float = 0
+        self._candle_closed = False
 
         self._sd_notify = (
             sdnotify.SystemdNotifier()
@@ -120,13 +124,16 @@ class Worker:
             # Ping systemd watchdog before throttling
             self._notify(f"WATCHDOG=1\nSTATUS=State: {state_str}.")
 
-            # Use an offset of 1s to ensure a new candle has been issued
-            self._throttle(
-                func=self._process_running,
-                throttle_secs=self._throttle_secs,
-                timeframe=self._config["timeframe"] if self._config else None,
-                timeframe_offset=1,
-            )
+            if self._candle_driven:
+                self._process_candle_driven()
+            else:
+                # Use an offset of 1s to ensure a new candle has been issued
+                self._throttle(
+                    func=self._process_running,
+                    throttle_secs=self._throttle_secs,
+                    timeframe=self._config["timeframe"] if self._config else None,
+                    timeframe_offset=1,
+                )
 
         if self._heartbeat_interval:
             now = time.time()
@@ -135,8 +142,16 @@ class Worker:
                 strategy_version = self.freqtrade.strategy.version()
                 if strategy_version is not None:
                     version += ", strategy_version: " + strategy_version
+                latency = ""
+                if self.freqtrade.candle_process_latency.count:
+                    stats = self.freqtrade.candle_process_latency
+                    latency = (
+                        f", candle latency: last={stats.last:.2f}s, avg={stats.avg:.2f}s, "
+                        f"max={stats.max:.2f}s"
+                    )
                 logger.info(
-                    f"Bot heartbeat. PID={getpid()}, version='{version}', state='{state.name}'"
+                    f"Bot heartbeat. PID={getpid()}, version='{version}', "
+                    f"state='{state.name}'{latency}"
                 )
                 self._heartbeat_msg = now
 
@@ -186,6 +201,58 @@ class Worker:
         self._sleep(sleep_duration)
         return result
 
+    def _process_candle_driven(self) -> None:
+        """
+        One iteration of the candle-driven loop.
+        Runs the full iteration (refresh, analyze, exit and entry) once a candle of any active
+        timeframe closed - and only manages open orders and trades in between.
+        Sleeps until the next candle close, at most for `process_throttle_secs`, waking up
+        early when the websocket connection delivers a new candle.
+        """
+        start = time.time()
+        logger.debug("========================================")
+        # Without websocket confirmation, use an offset of 1s to ensure
+        # a new candle has been issued.
+        offset = 0 if self._candle_closed else 1
+        if start >= self._next_candle_close + offset:
+            self._process_running()
+            self._next_candle_close = self._get_next_candle_close()
+            func_name = "process"
+        else:
+            self._process_between_candles()
+            func_name = "process_between_candles"
+
+        now = time.time()
+        time_passed = now - start
+        sleep_duration = min(self._throttle_secs - time_passed, self._next_candle_close + 1 - now)
+        sleep_duration = max(sleep_duration, 0.0)
+        logger.debug(
+            f"Candle-driven loop after '{func_name}()': sleep for up to {sleep_duration:.2f} s, "
+            f"last iteration took {time_passed:.2f} s."
+        )
+        self._candle_closed = self._wait_for_candle(sleep_duration)
+
+    def _get_next_candle_close(self) -> float:
+        """
+        Timestamp of the next candle close of the strategy timeframe or any informative timeframe.
+        """
+        timeframes = {self.freqtrade.strategy.timeframe}
+        timeframes.update(tf for _, tf, _ in self.freqtrade.strategy.gather_informative_pairs())
+        return min(timeframe_to_next_date(tf).timestamp() for tf in timeframes)
+
+    def _wait_for_candle(self, timeout: float) -> bool:
+        """
+        Sleep for up to `timeout` seconds.
+        Returns early (with True) if the websocket connection delivers a new candle.
+        """
+        event = self.freqtrade.exchange.candle_closed_event
+        if event is None:
+            self._sleep(timeout)
+            return False
+        candle_closed = event.wait(timeout)
+        event.clear()
+        return candle_closed
+
     @staticmethod
     def _sleep(sleep_duration: float) -> None:
         """Local sleep method - to improve testability"""
@@ -195,8 +262,14 @@ class Worker:
         self.freqtrade.process_stopped()
 
     def _process_running(self) -> None:
+        self._process_safe(self.freqtrade.process)
+
+    def _process_between_candles(self) -> None:
+        self._process_safe(self.freqtrade.process_between_candles)
+
+    def _process_safe(self, func: Callable[[], None]) -> None:
         try:
-            self.freqtrade.process()
+            func()
         except TemporaryError as error:
             logger.warning(f"Error: {error}, retrying in {RETRY_TIMEOUT} seconds...")
             time.sleep(RETRY_TIMEOUT)
@@ -248,12 +248,14 @@ class FtRestClient:
         """
         return self._get("logs", params={"limit": limit} if limit else {})
 
-    def trades(self, limit=None, offset=None, order_by_id=True):
+    def trades(self, limit=None, offset=None, order_by_id=True, after_id=None, summary=False):
         """Return trades history, sorted by id (or by latest timestamp if order_by_id=False)
 
         :param limit: Limits trades to the X last trades. Max 500 trades.
         :param offset: Offset by this amount of trades.
         :param order_by_id: Sort trades by id (default: True). If False, sorts by latest timestamp.
+        :param after_id: Return trades following this trade id (for pagination).
+        :param summary: Return trade summaries without orders.
         :return: json object
         """
         params = {}
@@ -263,6 +265,10 @@ class FtRestClient:
             params["offset"] = offset
         if not order_by_id:
             params["order_by_id"] = False
+        if after_id is not None:
+            params["after_id"] = after_id
+        if summary:
+            params["summary"] = True
         return self._get("trades", params)
 
     def list_open_trades_custom_data(self, key=None, limit=100, offset=0):
@@ -454,13 +460,14 @@ class FtRestClient:
             },
         )
 
-    def pair_candles(self, pair, timeframe, limit=None, columns=None):
+    def pair_candles(self, pair, timeframe, limit=None, columns=None, columnar=False):
         """Return live dataframe for <pair><timeframe>.
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param limit: Limit result to the last n candles.
         :param columns: List of dataframe columns to return. Empty list will return OHLCV.
+        :param columnar: Return the data as one list per column (in `column_data`).
         :return: json object
         """
         params = {
@@ -470,8 +477,9 @@ class FtRestClient:
         if limit:
             params["limit"] = limit
 
-        if columns is not None:
+        if columns is not None or columnar:
             params["columns"] = columns
+            params["columnar"] = columnar
             return self._post("pair_candles", data=params)
 
         return self._get("pair_candles", params=params)
@@ -510,3 +518,17 @@ class FtRestClient:
         :return: json object
         """
         return self._get("health")
+
+    def loop_metrics(self):
+        """Provides timing histograms of the bot loop phases, pair analysis and exchange calls.
+
+        :return: json object
+        """
+        return self._get("loop_metrics")
+
+    def ws_channels(self):
+        """Provides send queue statistics of the connected websocket channels.
+
+        :return: json object
+        """
+        return self._get("ws_channels")
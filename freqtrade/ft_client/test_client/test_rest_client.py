@@ -126,14 +126,18 @@ def test_FtRestClient_call_invalid(caplog):
         ("pair_candles", ["XRP/USDT", "5m"], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {}),
         ("pair_candles", ["XRP/USDT", "5m", 500], {"columns": ["close_time,close"]}),
+        ("pair_candles", ["XRP/USDT", "5m"], {"columnar": True}),
         ("pair_history", ["XRP/USDT", "5m", "SampleStrategy"], {}),
         ("pair_history", ["XRP/USDT", "5m"], {"strategy": "SampleStrategy"}),
         ("trades", [], {"order_by_id": True}),
         ("trades", [], {"order_by_id": False}),
         ("trades", [5], {"order_by_id": False}),
         ("trades", [5, 5], {"order_by_id": True}),
+        ("trades", [5], {"after_id": 3, "summary": True}),
         ("sysinfo", [], {}),
         ("health", [], {}),
+        ("loop_metrics", [], {}),
+        ("ws_channels", [], {}),
     ],
 )
 def test_FtRestClient_call_explicit_methods(method, args, kwargs):
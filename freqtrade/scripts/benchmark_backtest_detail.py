@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Runtime benchmark for spreading main candles into detail candles (--timeframe-detail).
+
+Compares the former boolean-mask based slicing of the detail dataframe
+with the searchsorted based slicing of the columnar `BacktestRows` storage.
+
+Usage:
+    python scripts/benchmark_backtest_detail.py --days 365 --candles 2000
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.optimize.backtest_rows import BacktestRows
+from freqtrade.optimize.backtesting import HEADERS
+
+
+COMBINATIONS = [("1h", "1min"), ("4h", "5min")]
+
+
+def generate_detail(days: int, timeframe: str) -> pd.DataFrame:
+    dates = pd.date_range(
+        "2024-01-01",
+        periods=int(pd.Timedelta(days=days) / pd.Timedelta(timeframe)),
+        freq=timeframe,
+        tz="UTC",
+    )
+    close = 100 + np.cumsum(np.random.default_rng(42).normal(0, 0.1, len(dates)))
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": close,
+            "high": close + 0.1,
+            "low": close - 0.1,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+def spread_mask(detail_data: pd.DataFrame, row: tuple, timeframe_td: timedelta) -> list:
+    # Implementation prior to the columnar detail storage
+    current_detail_time = row[0]
+    exit_candle_end = current_detail_time + timeframe_td
+    detail_data = detail_data.loc[
+        (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
+    ].copy()
+    detail_data.loc[:, "enter_long"] = row[5]
+    detail_data.loc[:, "exit_long"] = row[6]
+    detail_data.loc[:, "enter_short"] = row[7]
+    detail_data.loc[:, "exit_short"] = row[8]
+    detail_data.loc[:, "enter_tag"] = row[9]
+    detail_data.loc[:, "exit_tag"] = row[10]
+    return detail_data[HEADERS].values.tolist()
+
+
+def spread_columnar(detail_rows: BacktestRows, row: tuple, timeframe_td: timedelta) -> list:
+    return list(detail_rows.slice_by_date(row[0], row[0] + timeframe_td, tuple(row[5:])))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument(
+        "--candles", type=int, default=2000, help="Number of main candles to spread."
+    )
+    args = parser.parse_args()
+
+    for timeframe, timeframe_detail in COMBINATIONS:
+        detail_data = generate_detail(args.days, timeframe_detail)
+        timeframe_td = pd.Timedelta(timeframe).to_pytimedelta()
+        main_dates = pd.date_range(
+            detail_data["date"].iloc[0], detail_data["date"].iloc[-1], freq=timeframe
+        )
+        rng = np.random.default_rng(1)
+        picks = rng.choice(len(main_dates), min(args.candles, len(main_dates)), replace=False)
+        rows = [
+            (main_dates[i].to_pydatetime(), 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0, 0.0, "tag", None)
+            for i in sorted(picks)
+        ]
+
+        start = time.perf_counter()
+        for row in rows:
+            spread_mask(detail_data, row, timeframe_td)
+        mask_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        detail_rows = BacktestRows.from_dataframe(detail_data, HEADERS[1:5], [])
+        build_duration = time.perf_counter() - start
+        start = time.perf_counter()
+        for row in rows:
+            spread_columnar(detail_rows, row, timeframe_td)
+        columnar_duration = time.perf_counter() - start
+
+        print(
+            f"{timeframe}/{timeframe_detail}: {len(detail_data)} detail candles, "
+            f"{len(rows)} spreads - mask: {mask_duration:7.3f}s, "
+            f"columnar: {columnar_duration:7.3f}s (+{build_duration:.3f}s index build)"
+        )
+
+
+if __name__ == "__main__":
+    main()
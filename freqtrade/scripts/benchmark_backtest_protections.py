@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Runtime benchmark for protections in backtesting.
+
+Evaluates CooldownPeriod, StoplossGuard, LowProfitPairs and MaxDrawdown while closed
+trades accumulate - comparing the former list scan of all closed trades in
+`LocalTrade.get_trades_proxy` with the close-date index (`ClosedTradeIndex`).
+
+Usage:
+    python scripts/benchmark_backtest_protections.py --trades 50000 --pairs 50 --checks 2000
+"""
+
+import argparse
+import time
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from freqtrade.enums import ExitType
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.resolvers import ProtectionResolver
+
+
+PROTECTIONS = [
+    {"method": "CooldownPeriod", "stop_duration_candles": 2},
+    {
+        "method": "StoplossGuard",
+        "lookback_period_candles": 24,
+        "trade_limit": 4,
+        "stop_duration_candles": 4,
+        "only_per_pair": False,
+    },
+    {
+        "method": "LowProfitPairs",
+        "lookback_period_candles": 6,
+        "trade_limit": 2,
+        "stop_duration_candles": 60,
+        "required_profit": 0.02,
+    },
+    {
+        "method": "MaxDrawdown",
+        "lookback_period_candles": 48,
+        "trade_limit": 20,
+        "stop_duration_candles": 12,
+        "max_allowed_drawdown": 0.2,
+    },
+]
+
+
+def get_trades_proxy_scan(
+    *,
+    pair: str | None = None,
+    is_open: bool | None = None,
+    open_date: datetime | None = None,
+    close_date: datetime | None = None,
+) -> list[LocalTrade]:
+    # Implementation prior to the close-date index
+    if is_open is not None:
+        sel_trades = LocalTrade.bt_trades_open if is_open else LocalTrade.bt_trades
+    else:
+        sel_trades = list(LocalTrade.bt_trades + LocalTrade.bt_trades_open)
+
+    if pair:
+        sel_trades = [trade for trade in sel_trades if trade.pair == pair]
+    if open_date:
+        sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+    if close_date:
+        sel_trades = [
+            trade for trade in sel_trades if trade.close_date and trade.close_date > close_date
+        ]
+    return sel_trades
+
+
+def generate_trades(count: int, pairs: list[str]) -> list[LocalTrade]:
+    rng = np.random.default_rng(42)
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    profits = rng.normal(0.002, 0.02, count)
+    trades = []
+    for idx in range(count):
+        close_date = start + timedelta(minutes=5 * idx)
+        close_profit = float(profits[idx])
+        trades.append(
+            LocalTrade(
+                pair=pairs[idx % len(pairs)],
+                stake_amount=100,
+                amount=1,
+                open_rate=100,
+                close_rate=100 * (1 + close_profit),
+                fee_open=0.001,
+                fee_close=0.001,
+                is_open=False,
+                open_date=close_date - timedelta(hours=2),
+                close_date=close_date,
+                close_profit=close_profit,
+                close_profit_abs=100 * close_profit,
+                exit_reason=(
+                    ExitType.STOP_LOSS.value if close_profit < -0.02 else ExitType.ROI.value
+                ),
+                exchange="binance",
+            )
+        )
+    return trades
+
+
+def run(trades: list[LocalTrade], protections: list, checks: int) -> float:
+    LocalTrade.reset_trades()
+    check_every = max(len(trades) // checks, 1)
+    start = time.perf_counter()
+    for idx, trade in enumerate(trades):
+        LocalTrade.add_bt_trade(trade)
+        if idx % check_every == 0:
+            for protection in protections:
+                if protection.has_global_stop:
+                    protection.global_stop(date_now=trade.close_date, side="long")
+                if protection.has_local_stop:
+                    protection.stop_per_pair(
+                        pair=trade.pair, date_now=trade.close_date, side="long"
+                    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=50000)
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--checks", type=int, default=2000, help="Number of protection checks.")
+    args = parser.parse_args()
+
+    config = {"timeframe": "5m", "stake_currency": "USDT"}
+    protections = [
+        ProtectionResolver.load_protection(prot["method"], config=config, protection_config=prot)
+        for prot in PROTECTIONS
+    ]
+    trades = generate_trades(args.trades, [f"PAIR{idx}/USDT" for idx in range(args.pairs)])
+    Trade.use_db = False
+
+    indexed_duration = run(trades, protections, args.checks)
+
+    get_trades_proxy = LocalTrade.__dict__["get_trades_proxy"]
+    LocalTrade.get_trades_proxy = staticmethod(get_trades_proxy_scan)
+    try:
+        scan_duration = run(trades, protections, args.checks)
+    finally:
+        LocalTrade.get_trades_proxy = get_trades_proxy
+        LocalTrade.reset_trades()
+
+    print(
+        f"{args.trades} trades, {args.pairs} pairs, {args.checks} checks of "
+        f"{len(protections)} protections - scan: {scan_duration:7.3f}s, "
+        f"indexed: {indexed_duration:7.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark for the per-pair candle storage used by backtesting.
+
+Compares peak RSS of the former list-of-lists conversion (`df.values.tolist()`)
+with the columnar `BacktestRows` storage for synthetic, already analyzed data.
+Each variant runs in a separate process, so peak RSS values don't influence each other.
+
+Usage:
+    python scripts/benchmark_backtest_rows.py --pairs 100 --days 365 --timeframe 1min
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+
+HEADERS = [
+    "date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "enter_long",
+    "exit_long",
+    "enter_short",
+    "exit_short",
+    "enter_tag",
+    "exit_tag",
+]
+
+
+def generate_pair(candles: int, timeframe: str, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.1, candles))
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=candles, freq=timeframe, tz="UTC"),
+            "open": close + rng.normal(0, 0.05, candles),
+            "high": close + 0.1,
+            "low": close - 0.1,
+            "close": close,
+            "enter_long": (rng.random(candles) > 0.99).astype("float64"),
+            "exit_long": (rng.random(candles) > 0.99).astype("float64"),
+            "enter_short": 0.0,
+            "exit_short": 0.0,
+            "enter_tag": None,
+            "exit_tag": None,
+        }
+    )
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_variant(variant: str, pairs: int, candles: int, timeframe: str) -> None:
+    from freqtrade.optimize.backtest_rows import BacktestRows
+
+    data = {}
+    baseline = 0.0
+    start = time.perf_counter()
+    for i in range(pairs):
+        df = generate_pair(candles, timeframe, i)
+        if i == 0:
+            baseline = max_rss_mb()
+        if variant == "lists":
+            data[f"PAIR{i}/USDT"] = df[HEADERS].values.tolist()
+        else:
+            data[f"PAIR{i}/USDT"] = BacktestRows.from_dataframe(df, HEADERS[1:9], HEADERS[9:])
+        del df
+    duration = time.perf_counter() - start
+    # Touch every row once - as the backtest loop would.
+    start = time.perf_counter()
+    for rows in data.values():
+        for row in rows:
+            pass
+    iteration = time.perf_counter() - start
+    print(
+        f"{variant:>8}: peak RSS {max_rss_mb():10.1f} MB "
+        f"(+{max_rss_mb() - baseline:10.1f} MB), build {duration:7.2f}s, "
+        f"iterate {iteration:7.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=100)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--timeframe", default="1min", help="pandas frequency string")
+    parser.add_argument("--variant", choices=["lists", "columnar"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    candles = int(args.days * pd.Timedelta("1D") / pd.Timedelta(args.timeframe))
+    if args.variant:
+        run_variant(args.variant, args.pairs, candles, args.timeframe)
+        return
+
+    print(f"{args.pairs} pairs, {candles} candles per pair ({args.timeframe})")
+    for variant in ("lists", "columnar"):
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--pairs",
+                str(args.pairs),
+                "--days",
+                str(args.days),
+                "--timeframe",
+                args.timeframe,
+                "--variant",
+                variant,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
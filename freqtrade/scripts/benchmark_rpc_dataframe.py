@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Runtime benchmark for the conversion of analyzed dataframes in /pair_candles and /pair_history.
+
+Compares the former pandas based conversion (object-dtype copies, `replace()` of NaN / inf / NaT
+and `values.tolist()`) with the per-column encoding (`dataframe_to_columns`), in row and
+column-oriented format - each with and without JSON serialization.
+
+Usage:
+    python scripts/benchmark_rpc_dataframe.py --rows 5000 --columns 60 --runs 20
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import rapidjson
+
+from freqtrade.misc import dataframe_to_columns, dataframe_to_rows
+
+
+def generate_dataframe(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=rows, freq="5min", tz="UTC"),
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.uniform(0, 1000, rows),
+            "enter_long": (rng.uniform(0, 1, rows) > 0.98).astype(int),
+            "exit_long": (rng.uniform(0, 1, rows) > 0.98).astype(int),
+            "enter_tag": ["tag" if v > 0.98 else None for v in rng.uniform(0, 1, rows)],
+        }
+    )
+    # Indicators, with a startup period of NaN values and some infinite values
+    indicators = {}
+    for idx in range(columns - len(df.columns)):
+        values = pd.Series(close).rolling(idx % 50 + 2).mean().to_numpy()
+        values[rng.integers(0, rows, 5)] = np.inf
+        indicators[f"indicator_{idx}"] = values
+    return pd.concat([df, pd.DataFrame(indicators)], axis=1)
+
+
+def convert_legacy(dataframe: pd.DataFrame) -> list[list[Any]]:
+    # Implementation prior to the per-column encoding
+    datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
+    for date_column in dataframe.select_dtypes(include=datetime_types):
+        dataframe[date_column] = dataframe[date_column].astype(object).replace({pd.NaT: None})
+    dataframe = dataframe.replace({np.inf: None, -np.inf: None, np.nan: None})
+    return dataframe.values.tolist()
+
+
+def convert_rows(dataframe: pd.DataFrame) -> list[list[Any]]:
+    return dataframe_to_rows(dataframe_to_columns(dataframe))
+
+
+def convert_columns(dataframe: pd.DataFrame) -> list[list[Any]]:
+    return dataframe_to_columns(dataframe)
+
+
+def run(func: Callable[[pd.DataFrame], Any], dataframe: pd.DataFrame, runs: int, serialize: bool):
+    start = time.perf_counter()
+    for _ in range(runs):
+        # The API works on a copy of the cached dataframe as well
+        data = func(dataframe.copy())
+        if serialize:
+            rapidjson.dumps(data, default=str)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    dataframe = generate_dataframe(args.rows, args.columns)
+    if convert_legacy(dataframe.copy()) != convert_rows(dataframe.copy()):
+        raise RuntimeError("Legacy and per-column conversion results differ.")
+
+    print(f"{args.rows} rows x {len(dataframe.columns)} columns, average of {args.runs} runs")
+    for name, func in (
+        ("legacy", convert_legacy),
+        ("rows", convert_rows),
+        ("columns", convert_columns),
+    ):
+        convert = run(func, dataframe, args.runs, serialize=False)
+        serialized = run(func, dataframe, args.runs, serialize=True)
+        print(
+            f"{name:>8} - convert: {convert * 1000:8.2f}ms, "
+            f"convert + json: {serialized * 1000:8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
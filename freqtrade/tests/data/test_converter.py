@@ -192,6 +192,24 @@ def test_ohlcv_fill_up_missing_data2(caplog):
     )
 
 
+@pytest.mark.parametrize("timeframe", ["1m", "5m", "1h", "4h", "1d", "3d", "1w", "1M"])
+@pytest.mark.parametrize("offset", ["0s", "1min"])
+def test_ohlcv_fill_up_missing_data_fast_path(mocker, timeframe, offset):
+    data = generate_test_data(timeframe, 200)
+    data["date"] += pd.Timedelta(offset)
+    data = data.drop([0, 1, 50, 51, 52, 100, 199]).reset_index(drop=True)
+
+    filled = ohlcv_fill_up_missing_data(data, timeframe, "UNITTEST/BTC")
+    # Identical to resampling
+    fast_path = mocker.patch(
+        "freqtrade.data.converter.converter._fill_up_fixed_interval", return_value=None
+    )
+    expected = ohlcv_fill_up_missing_data(data, timeframe, "UNITTEST/BTC")
+    assert fast_path.call_count == 1
+    assert_frame_equal(filled, expected, check_freq=False)
+    assert len(filled) == len(data) + 4
+
+
 @pytest.mark.parametrize(
     "timeframe",
     ["1s", "1m", "5m", "15m", "1h", "2h", "4h", "8h", "12h", "1d", "7d", "1w", "1M", "3M", "1y"],
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
+from pandas.testing import assert_series_equal
 
 from freqtrade.constants import DEFAULT_TRADES_COLUMNS
 from freqtrade.data.converter import populate_dataframe_with_trades
@@ -7,6 +9,7 @@ from freqtrade.data.converter.orderflow import (
     ORDERFLOW_ADDED_COLUMNS,
     stacked_imbalance,
     timeframe_to_DateOffset,
+    trades_orderflow_to_imbalances,
     trades_to_volumeprofile_with_total_delta_bid_ask,
 )
 from freqtrade.data.converter.trade_converter import trades_list_to_df
@@ -602,6 +605,82 @@ def test_stacked_imbalances_multiple_prices():
     assert bid_prices_higher == [234.95]
 
 
+def test_populate_dataframe_with_trades_per_candle():
+    rng = np.random.default_rng(42)
+    dataframe = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=20, freq="5min", tz="UTC"),
+            "open": 1.0,
+            "high": 1.0,
+            "low": 1.0,
+            "close": 1.0,
+            "volume": 1.0,
+        }
+    )
+    start = int(dataframe["date"].iat[0].timestamp() * 1000)
+    # Trades before and after the candles are ignored
+    timestamps = np.sort(rng.integers(start - 600_000, start + 21 * 300_000, 2000))
+    trades = trades_list_to_df(
+        [
+            [int(ts), str(idx), None, side, round(100 + rng.normal(0, 0.1), 3), amount, 1.0]
+            for idx, (ts, side, amount) in enumerate(
+                zip(
+                    timestamps,
+                    rng.choice(["buy", "sell"], len(timestamps)),
+                    rng.exponential(1.0, len(timestamps)).round(3),
+                    strict=True,
+                )
+            )
+        ]
+    )
+    config = {
+        "timeframe": "5m",
+        "orderflow": {
+            "cache_size": 10,
+            "max_candles": 15,
+            "scale": 0.05,
+            "imbalance_volume": 0.5,
+            "imbalance_ratio": 1.2,
+            "stacked_imbalance_range": 2,
+        },
+    }
+    df, cached = populate_dataframe_with_trades(None, config, dataframe.copy(), trades.copy())
+    assert df["delta"].count() == 15
+    assert len(cached) == 10
+
+    # Identical to calculating the orderflow of every candle on its own
+    for _, row in df.tail(15).iterrows():
+        candle_trades = trades.loc[
+            (trades["date"] >= row["date"]) & (trades["date"] < row["date"] + pd.Timedelta("5m"))
+        ]
+        assert [t["id"] for t in row["trades"]] == candle_trades["id"].tolist()
+        orderflow = trades_to_volumeprofile_with_total_delta_bid_ask(candle_trades, scale=0.05)
+        assert list(row["orderflow"]) == orderflow.index.tolist()
+        for level, values in orderflow.to_dict(orient="index").items():
+            assert row["orderflow"][level] == pytest.approx(values)
+        imbalances = trades_orderflow_to_imbalances(
+            orderflow, imbalance_ratio=1.2, imbalance_volume=0.5
+        )
+        assert row["imbalances"] == imbalances.to_dict(orient="index")
+        for label in ("bid", "ask"):
+            assert row[f"stacked_imbalances_{label}"] == stacked_imbalance(
+                imbalances, label=label, stacked_imbalance_range=2
+            )
+        deltas = np.where(candle_trades["side"] == "buy", 1, -1) * candle_trades["amount"]
+        assert row["delta"] == pytest.approx(deltas.sum())
+        assert row["max_delta"] == pytest.approx(deltas.cumsum().max())
+        assert row["min_delta"] == pytest.approx(deltas.cumsum().min())
+        assert row["total_trades"] == len(candle_trades)
+    assert any(df["stacked_imbalances_bid"].tail(15).map(len))
+
+    # Cached candles are reused - others are calculated
+    cached["delta"] = 1234.0
+    df2, _ = populate_dataframe_with_trades(cached, config, dataframe.copy(), trades.copy())
+    assert (df2["delta"].tail(10) == 1234.0).all()
+    assert_series_equal(df2["delta"].iloc[5:10], df["delta"].iloc[5:10])
+    assert df2["orderflow"].iloc[-1] == df["orderflow"].iloc[-1]
+
+
 def test_timeframe_to_DateOffset():
     assert timeframe_to_DateOffset("1s") == pd.DateOffset(seconds=1)
     assert timeframe_to_DateOffset("1m") == pd.DateOffset(minutes=1)
@@ -5,12 +5,14 @@ from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pyarrow as pa
 import pytest
 from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import AVAILABLE_DATAHANDLERS
+from freqtrade.data.history.datahandlers.arrowohlcvloader import build_ohlcv_date_filter
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -290,7 +292,7 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
@@ -302,6 +304,72 @@ def test_datahandler_ohlcv_append(
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_append_arrow(datahandler, testdatadir, tmp_path, caplog):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/BTC", "5m", CandleType.SPOT)
+    segments_dir = dh._segments_dir(filename)
+
+    # No existing data - stores the data
+    dh.ohlcv_append("UNITTEST/BTC", "5m", ohlcv.iloc[:100], CandleType.SPOT)
+    assert filename.is_file()
+    assert not segments_dir.exists()
+
+    # Appending writes only the new candles - the last stored candle is replaced.
+    mtime = filename.stat().st_mtime_ns
+    dh.ohlcv_append("UNITTEST/BTC", "5m", DataFrame(), CandleType.SPOT)
+    changed = ohlcv.iloc[99:200].copy()
+    changed.loc[99, "close"] = 1.0
+    dh.ohlcv_append("UNITTEST/BTC", "5m", changed, CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/BTC", "5m", ohlcv.iloc[200:300], CandleType.SPOT)
+    assert filename.stat().st_mtime_ns == mtime
+    assert len(dh._segment_files(filename)) == 2
+
+    expected = ohlcv.iloc[:300].copy()
+    expected.loc[99, "close"] = 1.0
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected)
+    # Timerange is applied to segments, too
+    tr = TimeRange.parse_timerange("20180110-20180110")
+    tr.startts = int(ohlcv.iloc[150]["date"].timestamp())
+    tr.stopts = int(ohlcv.iloc[250]["date"].timestamp())
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", tr, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected.iloc[148:253].reset_index(drop=True))
+
+    # Rename moves segments with the data file
+    dh.rename_futures_data("UNITTEST/BTC", "UNITTEST/USDT", "5m", CandleType.SPOT)
+    assert not segments_dir.exists()
+    loaded = dh._ohlcv_load("UNITTEST/USDT", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected)
+
+    # Segments are merged once the limit is reached
+    dh._MAX_SEGMENTS = 2
+    dh.ohlcv_append("UNITTEST/USDT", "5m", ohlcv.iloc[300:400], CandleType.SPOT)
+    assert log_has_re(r"Merging 2 appended segments into .*", caplog)
+    filename = dh._pair_data_filename(tmp_path, "UNITTEST/USDT", "5m", CandleType.SPOT)
+    assert not dh._segments_dir(filename).exists()
+    expected = ohlcv.iloc[:400].copy()
+    expected.loc[99, "close"] = 1.0
+    loaded = dh._ohlcv_load("UNITTEST/USDT", "5m", None, candle_type=CandleType.SPOT)
+    assert_frame_equal(loaded, expected)
+
+    # Storing replaces segments
+    dh.ohlcv_append("UNITTEST/USDT", "5m", ohlcv.iloc[400:500], CandleType.SPOT)
+    assert dh._segments_dir(filename).is_dir()
+    dh.ohlcv_store("UNITTEST/USDT", "5m", ohlcv.iloc[:10], CandleType.SPOT)
+    assert not dh._segments_dir(filename).exists()
+    assert len(dh._ohlcv_load("UNITTEST/USDT", "5m", None, candle_type=CandleType.SPOT)) == 10
+
+    # Purge removes segments
+    dh.ohlcv_append("UNITTEST/USDT", "5m", ohlcv.iloc[10:20], CandleType.SPOT)
+    assert dh.ohlcv_purge("UNITTEST/USDT", "5m", CandleType.SPOT)
+    assert not filename.exists()
+    assert not dh._segments_dir(filename).exists()
+
+
 @pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
@@ -391,11 +459,7 @@ def test_generic_datahandler_ohlcv_load_and_resave(
 
     # Try loading a file that exists but errors
     mocker.patch(
-        "freqtrade.data.history.datahandlers.featherdatahandler.read_feather",
-        side_effect=Exception("Test"),
-    )
-    mocker.patch(
-        "freqtrade.data.history.datahandlers.parquetdatahandler.read_parquet",
+        "freqtrade.data.history.datahandlers.arrowdatahandler.load_ohlcv_dataset",
         side_effect=Exception("Test"),
     )
     ohlcv_e = dh1.ohlcv_load("UNITTEST/NEW", timeframe, candle_type=candle_type)
@@ -403,6 +467,93 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize(
+    "timerange",
+    [
+        # Aligned to candles
+        "20180115-20180119",
+        # Not aligned to candles
+        "1515998130-1516357170",
+        "20180115-",
+        "-20180119",
+        # Outside of the available data
+        "20180125-20180205",
+    ],
+)
+@pytest.mark.parametrize("startup_candles", [0, 20])
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_pushdown(
+    datahandler, testdatadir, tmp_path, timerange, startup_candles, caplog
+):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/BTC", "5m", ohlcv, candle_type=CandleType.SPOT)
+    tr = TimeRange.parse_timerange(timerange)
+
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", tr, candle_type=CandleType.SPOT)
+    assert 0 < len(loaded) < len(ohlcv)
+    assert loaded["date"].dtype == ohlcv["date"].dtype
+    assert loaded["volume"].dtype == "float64"
+
+    # Result identical to trimming the full dataset - including startup candles and warnings
+    result = dh.ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=tr, startup_candles=startup_candles
+    )
+    logs = caplog.text
+    caplog.clear()
+    full_load = get_datahandler(tmp_path, datahandler)
+    full_load._ohlcv_load = lambda *args, **kwargs: ohlcv.copy()
+    expected = full_load.ohlcv_load(
+        "UNITTEST/BTC", "5m", CandleType.SPOT, timerange=tr, startup_candles=startup_candles
+    )
+    assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+    assert logs == caplog.text
+
+
+def test_build_ohlcv_date_filter():
+    field = pa.field("date", pa.timestamp("ns", tz="UTC"))
+    assert build_ohlcv_date_filter(field, "5m", None) is None
+    assert build_ohlcv_date_filter(field, "5m", TimeRange()) is None
+
+    tr = TimeRange.parse_timerange("20180115-20180119")
+    expr = build_ohlcv_date_filter(field, "5m", tr)
+    # 2 candles margin on both sides
+    assert "2018-01-14 23:50:00" in str(expr)
+    assert "2018-01-19 00:10:00" in str(expr)
+
+    expr = build_ohlcv_date_filter(pa.field("date", pa.int64()), "1h", tr)
+    assert str(expr) == (
+        f"((date >= {(tr.startts - 7200) * 1000}) and (date <= {(tr.stopts + 7200) * 1000}))"
+    )
+    expr = build_ohlcv_date_filter(field, "1h", TimeRange.parse_timerange("20180115-"))
+    assert "<=" not in str(expr)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_load_int_dates(datahandler, testdatadir, tmp_path):
+    ohlcv = get_datahandler(testdatadir, "feather")._ohlcv_load(
+        "UNITTEST/BTC", "5m", None, candle_type=CandleType.SPOT
+    )
+    dh = get_datahandler(tmp_path, datahandler)
+    # Dates stored as epoch milliseconds, prices as integer
+    stored = ohlcv.copy()
+    stored["date"] = stored["date"].astype("int64") // 1_000_000
+    stored["volume"] = stored["volume"].astype("int64")
+    dh.ohlcv_store("UNITTEST/BTC", "5m", stored, candle_type=CandleType.SPOT)
+
+    tr = TimeRange.parse_timerange("20180115-20180119")
+    loaded = dh._ohlcv_load("UNITTEST/BTC", "5m", tr, candle_type=CandleType.SPOT)
+    assert loaded["date"].dtype == ohlcv["date"].dtype
+    assert loaded["volume"].dtype == "float64"
+    assert loaded["date"].min() < tr.startdt
+    assert loaded["date"].max() > tr.stopdt
+    expected = ohlcv[ohlcv["date"].isin(loaded["date"])].reset_index(drop=True)
+    expected["volume"] = expected["volume"].astype("int64").astype("float64")
+    assert_frame_equal(loaded, expected)
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
@@ -7,6 +7,7 @@ from pandas import DataFrame, Timestamp
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.util import dt_utc
 from tests.conftest import EXMS, generate_test_data, get_patched_exchange
@@ -24,15 +25,18 @@ def test_dp_ohlcv(mocker, default_conf, ohlcv_history, candle_type):
     timeframe = default_conf["timeframe"]
     exchange = get_patched_exchange(mocker, default_conf)
     candletype = CandleType.from_string(candle_type)
-    exchange._klines[("XRP/BTC", timeframe, candletype)] = ohlcv_history
-    exchange._klines[("UNITTEST/BTC", timeframe, candletype)] = ohlcv_history
+    klines = OHLCVBuffer.from_dataframe(ohlcv_history, 100)
+    exchange._klines[("XRP/BTC", timeframe, candletype)] = klines
+    exchange._klines[("UNITTEST/BTC", timeframe, candletype)] = klines
 
     dp = DataProvider(default_conf, exchange)
     assert dp.runmode == RunMode.DRY_RUN
     assert ohlcv_history.equals(dp.ohlcv("UNITTEST/BTC", timeframe, candle_type=candletype))
     assert isinstance(dp.ohlcv("UNITTEST/BTC", timeframe, candle_type=candletype), DataFrame)
     assert dp.ohlcv("UNITTEST/BTC", timeframe, candle_type=candletype) is not ohlcv_history
-    assert dp.ohlcv("UNITTEST/BTC", timeframe, copy=False, candle_type=candletype) is ohlcv_history
+    assert dp.ohlcv("UNITTEST/BTC", timeframe, copy=False, candle_type=candletype) is dp.ohlcv(
+        "UNITTEST/BTC", timeframe, copy=False, candle_type=candletype
+    )
     assert not dp.ohlcv("UNITTEST/BTC", timeframe, candle_type=candletype).empty
     assert dp.ohlcv("NONSENSE/AAA", timeframe, candle_type=candletype).empty
 
@@ -61,6 +65,7 @@ def test_historic_ohlcv(mocker, default_conf, ohlcv_history):
     assert isinstance(data, DataFrame)
     assert historymock.call_count == 1
     assert historymock.call_args_list[0][1]["timeframe"] == "5m"
+    assert dp.historic_pairs() == [("UNITTEST/BTC", "5m", CandleType.SPOT)]
 
 
 def test_historic_trades(mocker, default_conf, trades_history_df):
@@ -136,8 +141,9 @@ def test_get_pair_dataframe(mocker, default_conf, ohlcv_history, candle_type):
     timeframe = default_conf["timeframe"]
     exchange = get_patched_exchange(mocker, default_conf)
     candletype = CandleType.from_string(candle_type)
-    exchange._klines[("XRP/BTC", timeframe, candletype)] = ohlcv_history
-    exchange._klines[("UNITTEST/BTC", timeframe, candletype)] = ohlcv_history
+    klines = OHLCVBuffer.from_dataframe(ohlcv_history, 100)
+    exchange._klines[("XRP/BTC", timeframe, candletype)] = klines
+    exchange._klines[("UNITTEST/BTC", timeframe, candletype)] = klines
 
     dp = DataProvider(default_conf, exchange)
     assert dp.runmode == RunMode.DRY_RUN
@@ -188,8 +194,9 @@ def test_get_pair_dataframe(mocker, default_conf, ohlcv_history, candle_type):
 def test_available_pairs(mocker, default_conf, ohlcv_history):
     exchange = get_patched_exchange(mocker, default_conf)
     timeframe = default_conf["timeframe"]
-    exchange._klines[("XRP/BTC", timeframe)] = ohlcv_history
-    exchange._klines[("UNITTEST/BTC", timeframe)] = ohlcv_history
+    klines = OHLCVBuffer.from_dataframe(ohlcv_history, 100)
+    exchange._klines[("XRP/BTC", timeframe)] = klines
+    exchange._klines[("UNITTEST/BTC", timeframe)] = klines
 
     dp = DataProvider(default_conf, exchange)
     assert len(dp.available_pairs) == 2
@@ -3,13 +3,14 @@
 import json
 import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from shutil import copyfile
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
-from pandas import DataFrame
+from pandas import DataFrame, concat
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
@@ -358,6 +359,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -381,7 +386,9 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing 1m data is appended to
+    assert append_mock.call_count == 1
+    assert json_dump_mock.call_count == 2
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
@@ -394,6 +401,22 @@ def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_p
     assert log_has('Failed to download history data for pair: "MEME/BTC", timeframe: 1m.', caplog)
 
 
+def test_load_data_concurrent(mocker, testdatadir) -> None:
+    mocker.patch("freqtrade.data.history.history_utils.os.cpu_count", return_value=4)
+    pool_mock = mocker.patch(
+        "freqtrade.data.history.history_utils.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    )
+    pairs = ["XLM/BTC", "UNITTEST/BTC", "NOPAIR/BTC", "ETH/BTC", "ADA/BTC"]
+    progress = MagicMock()
+    data = load_data(testdatadir, "5m", pairs, progress_callback=progress)
+    assert pool_mock.call_args[1]["max_workers"] == 4
+    assert progress.call_count == len(pairs)
+    # Order of pairs is retained
+    assert list(data.keys()) == ["XLM/BTC", "UNITTEST/BTC", "ETH/BTC", "ADA/BTC"]
+    for pair in data:
+        assert_frame_equal(data[pair], load_pair_history(pair, "5m", testdatadir))
+
+
 def test_load_partial_missing(testdatadir, caplog) -> None:
     # Make sure we start fresh - test missing data at start
     start = dt_utc(2018, 1, 1)
@@ -830,6 +853,8 @@ def test_download_pair_history_with_pair_candles(mocker, default_conf, tmp_path,
     data_handler_mock = MagicMock()
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
+    # Data handler without append support
+    data_handler_mock.ohlcv_append.side_effect = NotImplementedError
     mocker.patch(
         "freqtrade.data.history.history_utils.get_datahandler", return_value=data_handler_mock
     )
@@ -925,6 +950,8 @@ def test_download_pair_history_with_pair_candles_no_overlap(
     data_handler_mock = MagicMock()
     data_handler_mock.ohlcv_load.return_value = existing_data
     data_handler_mock.ohlcv_store = MagicMock()
+    # Data handler without append support
+    data_handler_mock.ohlcv_append.side_effect = NotImplementedError
     mocker.patch(
         "freqtrade.data.history.history_utils.get_datahandler", return_value=data_handler_mock
     )
@@ -963,3 +990,56 @@ def test_download_pair_history_with_pair_candles_no_overlap(
     stored_data = data_handler_mock.ohlcv_store.call_args_list[0][1]["data"]
     assert stored_data.equals(existing_data)
     assert len(stored_data) == 2
+
+
+def test_download_pair_history_append(mocker, default_conf, tmp_path, caplog) -> None:
+    exchange = get_patched_exchange(mocker, default_conf)
+    dh = get_datahandler(tmp_path, "feather")
+    existing_data = DataFrame(
+        {
+            "date": [
+                dt_utc(2018, 1, 10, 10, 0),
+                dt_utc(2018, 1, 10, 10, 5),
+                dt_utc(2018, 1, 10, 10, 10),
+            ],
+            "open": [1.0, 1.1, 1.15],
+            "high": [1.1, 1.2, 1.2],
+            "low": [0.9, 1.0, 1.1],
+            "close": [1.05, 1.15, 1.1],
+            "volume": [100.0, 150.0, 10.0],
+        }
+    )
+    dh.ohlcv_store("TEST/BTC", "5m", existing_data, CandleType.SPOT)
+    # The last stored candle is incomplete - and is downloaded again.
+    new_data = DataFrame(
+        {
+            "date": [dt_utc(2018, 1, 10, 10, 10), dt_utc(2018, 1, 10, 10, 15)],
+            "open": [1.15, 1.2],
+            "high": [1.3, 1.35],
+            "low": [1.1, 1.2],
+            "close": [1.25, 1.3],
+            "volume": [250.0, 300.0],
+        }
+    )
+    get_historic_ohlcv_mock = mocker.patch.object(
+        exchange, "get_historic_ohlcv", return_value=new_data
+    )
+    store_mock = mocker.spy(dh, "ohlcv_store")
+
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        data_handler=dh,
+        pair="TEST/BTC",
+        timeframe="5m",
+        candle_type=CandleType.SPOT,
+    )
+    assert get_historic_ohlcv_mock.call_args[1]["since_ms"] == dt_ts(dt_utc(2018, 1, 10, 10, 5))
+    # Only the new candles have been written
+    assert store_mock.call_count == 0
+    filename = dh._pair_data_filename(tmp_path, "TEST/BTC", "5m", CandleType.SPOT)
+    assert len(dh._segment_files(filename)) == 1
+
+    expected = concat([existing_data.iloc[:2], new_data]).reset_index(drop=True)
+    loaded = dh.ohlcv_load("TEST/BTC", "5m", CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(loaded, expected)
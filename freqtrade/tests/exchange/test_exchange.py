@@ -37,8 +37,9 @@ from freqtrade.exchange.common import (
     API_RETRY_COUNT,
     calculate_backoff,
 )
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer
 from freqtrade.resolvers.exchange_resolver import ExchangeResolver
-from freqtrade.util import dt_now, dt_ts
+from freqtrade.util import dt_now, dt_ts, loop_metrics
 from tests.conftest import (
     EXMS,
     generate_test_data_raw,
@@ -1260,6 +1261,7 @@ def test_create_order(default_conf, mocker, side, ordertype, rate, marketprice,
     exchange = get_patched_exchange(mocker, default_conf, api_mock, exchange=exchange_name)
     exchange._set_leverage = MagicMock()
     exchange.set_margin_mode = MagicMock()
+    metrics_mock = mocker.spy(loop_metrics, "add")
 
     # Only applies to gate
     price_req = exchange._ft_has.get("marketOrderRequiresPrice", False)
@@ -1281,6 +1283,8 @@ def test_create_order(default_conf, mocker, side, ordertype, rate, marketprice,
     )
     assert exchange._set_leverage.call_count == 0
     assert exchange.set_margin_mode.call_count == 0
+    # Order placement is not retried, but measured nonetheless
+    assert [c[0][:2] for c in metrics_mock.call_args_list].count(("exchange", "create_order")) == 1
 
     api_mock.create_order = MagicMock(
         return_value={
@@ -2438,7 +2442,7 @@ def test_refresh_latest_trades(
 
         trades_df["date"] = to_datetime(trades_df["date"], unit="ms", utc=True)
         trades_df["date"] = trades_df["date"].apply(lambda date: timeframe_to_prev_date("5m", date))
-        exchange._klines[pair] = trades_df
+        exchange._klines[pair] = OHLCVBuffer.from_dataframe(trades_df, 100)
     res = exchange.refresh_latest_trades(
         [("IOTA/USDT:USDT", "5m", candle_type), ("XRP/USDT:USDT", "5m", candle_type)]
     )
@@ -2452,7 +2456,7 @@ def test_refresh_latest_trades(
         trades = [
             {
                 # unix timestamp ms
-                "timestamp": dt_ts(exchange._klines[pair].iloc[-1].date - timedelta(minutes=5)),
+                "timestamp": dt_ts(exchange.klines(pair).iloc[-1].date - timedelta(minutes=5)),
                 "amount": 16.512,
                 "cost": 10134.07488,
                 "fee": None,
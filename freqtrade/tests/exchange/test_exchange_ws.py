@@ -64,6 +64,29 @@ def patch_eventloop_threading(exchange):
         raise RuntimeError("Failed to initialize event loop thread")
 
 
+def test_exchangews_candle_closed(mocker):
+    mocker.patch("freqtrade.exchange.exchange_ws.ExchangeWS._start_forever", MagicMock())
+    exchange_ws = ExchangeWS(MagicMock(), MagicMock())
+    try:
+        paircomb = ("ETH/BTC", "1m", CandleType.SPOT)
+        exchange_ws._check_candle_closed(paircomb, [])
+        # First data received - no candle closed yet
+        exchange_ws._check_candle_closed(paircomb, [[1730422800000, 1, 1, 1, 1, 1]])
+        assert not exchange_ws.candle_closed.is_set()
+        # Update of the current candle
+        exchange_ws._check_candle_closed(paircomb, [[1730422800000, 1, 2, 1, 2, 2]])
+        assert not exchange_ws.candle_closed.is_set()
+
+        exchange_ws._check_candle_closed(paircomb, [[1730422860000, 2, 2, 2, 2, 1]])
+        assert exchange_ws.candle_closed.is_set()
+        assert exchange_ws._klines_last_candle[paircomb] == 1730422860000
+
+        exchange_ws._pop_history(paircomb)
+        assert paircomb not in exchange_ws._klines_last_candle
+    finally:
+        exchange_ws.cleanup()
+
+
 async def test_exchangews_ohlcv(mocker, time_machine, caplog):
     config = MagicMock()
     ccxt_object = MagicMock()
@@ -72,7 +95,7 @@ async def test_exchangews_ohlcv(mocker, time_machine, caplog):
     async def controlled_sleeper(*args, **kwargs):
         # Sleep to pass control back to the event loop
         await asyncio.sleep(0.1)
-        return MagicMock()
+        return [[1730422800000, 1.0, 1.0, 1.0, 1.0, 1.0]]
 
     async def wait_for_condition(condition_func, timeout_=5.0, check_interval=0.01):
         """Wait for a condition to be true with timeout."""
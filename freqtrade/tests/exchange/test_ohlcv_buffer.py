@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from pandas import concat
+from pandas.testing import assert_frame_equal
+
+from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_to_dataframe
+from freqtrade.exchange.ohlcv_buffer import OHLCVBuffer, ohlcv_to_arrays
+from tests.conftest import generate_test_data, generate_test_data_raw
+
+
+INTERVAL_5M = 300 * 1_000_000_000
+
+
+def _combine(old, ticks, capacity, drop_incomplete=True):
+    # Reference implementation - combining dataframes.
+    new = ohlcv_to_dataframe(
+        ticks, "5m", "UNITTEST/USDT", fill_missing=False, drop_incomplete=drop_incomplete
+    )
+    combined = clean_ohlcv_dataframe(
+        concat([old, new]), "5m", "UNITTEST/USDT", fill_missing=True, drop_incomplete=False
+    )
+    return combined.tail(capacity).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("capacity", [50, 120, 500])
+def test_ohlcv_buffer_update(capacity):
+    raw = generate_test_data_raw("5m", 400, "2020-07-05")
+    data = ohlcv_to_dataframe(raw[:60], "5m", "UNITTEST/USDT", drop_incomplete=False)
+    buffer = OHLCVBuffer.from_dataframe(data, capacity)
+    expected = data.tail(capacity).reset_index(drop=True)
+    assert_frame_equal(buffer.to_dataframe(), expected)
+
+    end = 60
+    for step in [1, 1, 3, 50, 1, 100, 2]:
+        # Overlapping candles, the last candle is incomplete
+        ticks = [list(c) for c in raw[end - 5 : end + step + 1]]
+        ticks[-2][2] -= 0.1
+        ticks[-2][4] -= 0.5
+        ticks[-2][5] -= 1
+        assert buffer.update(*ohlcv_to_arrays(ticks, drop_incomplete=True), INTERVAL_5M)
+        expected = _combine(expected, ticks, capacity)
+        assert len(buffer) == len(expected)
+        assert_frame_equal(buffer.to_dataframe(), expected)
+        end += step
+
+    # Missing candles are filled up
+    ticks = [raw[end + 3], raw[end + 5]]
+    assert buffer.update(*ohlcv_to_arrays(ticks, drop_incomplete=False), INTERVAL_5M)
+    expected = _combine(expected, ticks, capacity, drop_incomplete=False)
+    assert_frame_equal(buffer.to_dataframe(), expected)
+    assert (buffer.to_dataframe()["volume"].iloc[-6:-1:2] == 0).all()
+
+    # No new candles
+    assert buffer.update(*ohlcv_to_arrays(raw[:5], drop_incomplete=False), INTERVAL_5M)
+    assert buffer.update(*ohlcv_to_arrays([], drop_incomplete=True), INTERVAL_5M)
+    assert_frame_equal(buffer.to_dataframe(), expected)
+
+
+def test_ohlcv_to_arrays():
+    raw = generate_test_data_raw("5m", 10, "2020-07-05")
+    dates, values = ohlcv_to_arrays(raw, drop_incomplete=True)
+    assert len(dates) == 9
+    assert dates[0] == raw[0][0] * 1_000_000
+    assert values.shape == (9, 5)
+    assert (values[:, 3] == [c[4] for c in raw[:9]]).all()
+    # Unsorted or duplicate candles
+    assert ohlcv_to_arrays(raw[:3] + raw[2:5], drop_incomplete=False) is None
+    assert ohlcv_to_arrays(raw[3:5] + raw[:3], drop_incomplete=False) is None
+
+
+def test_ohlcv_buffer_rebuild_required():
+    raw = generate_test_data_raw("5m", 100, "2020-07-05")
+    data = ohlcv_to_dataframe(raw[:50], "5m", "UNITTEST/USDT", drop_incomplete=False)
+    buffer = OHLCVBuffer.from_dataframe(data, 100)
+    # Updating the last candle works without fixed interval
+    assert buffer.update(*ohlcv_to_arrays(raw[49:50], drop_incomplete=False), None)
+    # Appending requires a fixed interval
+    assert not buffer.update(*ohlcv_to_arrays(raw[49:60], drop_incomplete=False), None)
+    # Candles not aligned to the interval
+    dates, values = ohlcv_to_arrays(raw[50:51], drop_incomplete=False)
+    assert not buffer.update(dates + 60 * 1_000_000_000, values, INTERVAL_5M)
+    assert len(buffer) == 50
+
+    assert not OHLCVBuffer(10).update(*ohlcv_to_arrays(raw, drop_incomplete=False), INTERVAL_5M)
+    with pytest.raises(ValueError, match=r"capacity must be >= 1\."):
+        OHLCVBuffer(0)
+
+
+def test_ohlcv_buffer_to_dataframe():
+    data = generate_test_data("5m", 30)
+    buffer = OHLCVBuffer.from_dataframe(data, 20)
+    df = buffer.to_dataframe(copy=False)
+    assert buffer.to_dataframe(copy=False) is df
+    assert buffer.to_dataframe() is not df
+    assert_frame_equal(df, data.tail(20).reset_index(drop=True))
+    assert np.array_equal(df.dtypes, data.dtypes)
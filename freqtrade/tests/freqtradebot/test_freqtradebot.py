@@ -8,6 +8,7 @@ from datetime import timedelta
 from unittest.mock import ANY, MagicMock, PropertyMock, patch
 
 import pytest
+import time_machine
 from pandas import DataFrame
 from sqlalchemy import select
 
@@ -635,6 +636,45 @@ def test_process_trade_creation(
     assert pytest.approx(trade.amount) == limit_order[entry_side(is_short)]["filled"]
 
 
+def test_process_candle_latency(
+    default_conf_usdt, ticker_usdt, limit_order_open, fee, mocker
+) -> None:
+    patch_RPCManager(mocker)
+    patch_exchange(mocker)
+    mocker.patch.multiple(
+        EXMS,
+        fetch_ticker=ticker_usdt,
+        create_order=MagicMock(return_value=limit_order_open["buy"]),
+        get_fee=fee,
+    )
+    freqtrade = FreqtradeBot(default_conf_usdt)
+    patch_get_signal(freqtrade)
+    # No dataframes - avoid analysis.
+    analyze = mocker.patch("freqtrade.strategy.interface.IStrategy.analyze")
+    latency = freqtrade.candle_process_latency
+
+    with time_machine.travel("2022-09-01 05:00:03 +00:00", tick=False) as t:
+        freqtrade.process()
+        # Startup is not measured
+        assert latency.count == 0
+        assert freqtrade.candle_entry_latency.count == 1
+        assert freqtrade.candle_entry_latency.last == 3
+
+        t.move_to("2022-09-01 05:02:00 +00:00")
+        freqtrade.process_between_candles()
+        freqtrade.process()
+        assert latency.count == 0
+
+        t.move_to("2022-09-01 05:05:01.5 +00:00")
+        freqtrade.process_between_candles()
+        assert analyze.call_count == 2
+        freqtrade.process()
+        assert latency.count == 1
+        assert latency.last == 1.5
+        assert analyze.call_count == 3
+        assert freqtrade.last_process == dt_utc(2022, 9, 1, 5, 5, 1, 500000)
+
+
 def test_process_exchange_failures(default_conf_usdt, ticker_usdt, mocker) -> None:
     # TODO: Move this test to test_worker
     patch_RPCManager(mocker)
@@ -200,6 +200,60 @@ def test_throttle_sleep_time(mocker, default_conf, caplog) -> None:
         assert 11.1 < sleep_mock.call_args[0][0] < 13.2
 
 
+def test_worker_candle_driven(mocker, default_conf, caplog) -> None:
+    caplog.set_level(logging.DEBUG)
+    default_conf["internals"] = {"process_throttle_secs": 5, "candle_driven_loop": True}
+    worker = get_patched_worker(mocker, default_conf)
+    process = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process")
+    between = mocker.patch("freqtrade.freqtradebot.FreqtradeBot.process_between_candles")
+    mocker.patch(
+        "freqtrade.strategy.interface.IStrategy.gather_informative_pairs",
+        return_value=[("ETH/BTC", "3m", "spot")],
+    )
+    sleep_mock = mocker.patch("freqtrade.worker.Worker._sleep")
+    with time_machine.travel("2022-09-01 05:00:03 +00:00", tick=False) as t:
+        # First iteration runs the full process
+        assert worker._worker(old_state=State.RUNNING) is State.RUNNING
+        assert process.call_count == 1
+        assert between.call_count == 0
+        assert sleep_mock.call_args[0][0] == 5
+
+        # Between candles, only open orders and trades are managed
+        t.move_to("2022-09-01 05:01:00 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert process.call_count == 1
+        assert between.call_count == 1
+        assert log_has_re(r"Candle-driven loop after 'process_between_candles\(\)'.*", caplog)
+        # Sleep until the informative candle closes (05:03:00 + 1s offset)
+        t.move_to("2022-09-01 05:02:58 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert between.call_count == 2
+        assert sleep_mock.call_args[0][0] == 3
+
+        t.move_to("2022-09-01 05:03:01 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert process.call_count == 2
+        assert between.call_count == 2
+        # Next candle close is 05:05:00 (5m timeframe)
+        assert worker._next_candle_close == 1662008700
+
+        # Websocket delivers the new candle - process without offset
+        event = MagicMock(wait=MagicMock(side_effect=[True, False]))
+        mocker.patch(f"{EXMS}.candle_closed_event", PropertyMock(return_value=event))
+        t.move_to("2022-09-01 05:04:58 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert between.call_count == 3
+        assert worker._candle_closed is True
+        assert event.wait.call_args[0][0] == 3
+        assert event.clear.call_count == 1
+
+        t.move_to("2022-09-01 05:05:00 +00:00")
+        worker._worker(old_state=State.RUNNING)
+        assert process.call_count == 3
+        assert worker._candle_closed is False
+        assert sleep_mock.call_count == 4
+
+
 def test_throttle_with_assets(mocker, default_conf) -> None:
     def throttled_func(nb_assets=-1):
         return nb_assets
@@ -0,0 +1,67 @@
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from freqtrade.optimize.backtest_rows import BacktestRows
+from freqtrade.optimize.backtesting import HEADERS
+from tests.conftest import generate_test_data
+
+
+def test_backtest_rows_from_dataframe():
+    df = generate_test_data("5m", 50, "2022-01-03 12:00:00+00:00")
+    df["enter_long"] = np.where(df.index % 5 == 0, 1, 0)
+    df["exit_long"] = 0
+    df["enter_short"] = 0.0
+    df["exit_short"] = np.nan
+    df["enter_tag"] = None
+    df.loc[5, "enter_tag"] = "tag_5"
+    df["exit_tag"] = None
+
+    rows = BacktestRows.from_dataframe(df, HEADERS[1:9], HEADERS[9:])
+    assert len(rows) == 50
+    assert rows.dates.dtype == np.int64
+    assert rows.values.dtype == np.float64
+    assert rows.values.flags["C_CONTIGUOUS"]
+
+    expected = df[HEADERS].values.tolist()
+    for idx in (0, 5, 49, -1):
+        row = rows[idx]
+        assert isinstance(row, tuple)
+        assert len(row) == len(HEADERS)
+        assert type(row[0]) is datetime
+        assert row[0].tzinfo == UTC
+        assert row[0] == expected[idx][0]
+        assert list(row[1:5]) == expected[idx][1:5]
+        assert row[5] == expected[idx][5]
+        assert row[9] == expected[idx][9]
+    assert rows[5][9] == "tag_5"
+    assert np.isnan(rows[0][8])
+
+    assert len(list(rows)) == 50
+    with pytest.raises(IndexError):
+        rows[50]
+
+
+def test_backtest_rows_slice_by_date():
+    df = generate_test_data("1m", 120, "2022-01-03 12:00:00+00:00")
+    rows = BacktestRows.from_dataframe(df, HEADERS[1:5], [])
+    start = datetime(2022, 1, 3, 12, 5, tzinfo=UTC)
+    end = datetime(2022, 1, 3, 12, 10, tzinfo=UTC)
+    signals = (1.0, 0.0, 0.0, 0.0, "enter", None)
+
+    detail = rows.slice_by_date(start, end, signals)
+    assert len(detail) == 5
+    # Slices are views on the original arrays
+    assert np.shares_memory(detail.values, rows.values)
+    assert detail[0][0] == start
+    assert detail[-1][0] == datetime(2022, 1, 3, 12, 9, tzinfo=UTC)
+    assert len(detail[0]) == len(HEADERS)
+    assert detail[2][5:] == signals
+    assert list(detail[3][1:5]) == df.loc[8, ["open", "high", "low", "close"]].tolist()
+
+    assert len(rows.slice_by_date(end + timedelta(hours=5), end + timedelta(hours=6))) == 0
+
+    # Unsorted dataframes are sorted before indexing
+    rows = BacktestRows.from_dataframe(df.iloc[::-1], HEADERS[1:5], [])
+    assert len(rows.slice_by_date(start, end)) == 5
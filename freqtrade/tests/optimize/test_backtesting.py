@@ -1840,6 +1840,71 @@ def test_backtest_multi_pair_detail_simplified(
     assert len(evaluate_result_multi(results["results"], "1m", 1)) == 0
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+@pytest.mark.parametrize("tres", [0, 20])
+def test_backtest_skip_idle_candles(default_conf_usdt, fee, mocker, tres, use_detail):
+    def _trend_sparse(dataframe=None, metadata=None):
+        multi = 20 if metadata["pair"] in ("ETH/USDT", "LTC/USDT") else 18
+        dataframe["enter_long"] = np.where(dataframe.index % multi == 0, 1, 0)
+        dataframe["exit_long"] = np.where((dataframe.index + multi - 2) % multi == 0, 1, 0)
+        dataframe["enter_short"] = 0
+        dataframe["exit_short"] = 0
+        return dataframe
+
+    default_conf_usdt.update(
+        {
+            "runmode": "backtest",
+            "timeframe": "5m",
+            "max_open_trades": 3,
+            "minimal_roi": {"0": 0.01},
+        }
+    )
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+
+    raw_candles_1m = generate_test_data("1m", 1000, "2022-01-03 12:00:00+00:00")
+    raw_candles = ohlcv_fill_up_missing_data(raw_candles_1m, "5m", "dummy")
+    pairs = ["ADA/USDT", "DASH/USDT", "ETH/USDT", "LTC/USDT", "NXT/USDT"]
+    data = trim_dictlist({pair: raw_candles for pair in pairs}, -200)
+    if tres > 0:
+        data["LTC/USDT"] = data["LTC/USDT"][tres:].reset_index()
+
+    results = {}
+    loop_calls = {}
+    for skip_idle in (False, True):
+        default_conf_usdt["backtest_skip_idle_candles"] = skip_idle
+        backtesting = Backtesting(default_conf_usdt)
+        bl_spy = mocker.spy(backtesting, "backtest_loop")
+        backtesting.detail_data = {pair: raw_candles_1m for pair in pairs} if use_detail else {}
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.advise_entry = _trend_sparse
+        backtesting.strategy.advise_exit = _trend_sparse
+
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[skip_idle] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        loop_calls[skip_idle] = bl_spy.call_count
+        assert len(backtesting._idle_candle_scan) == (len(pairs) if skip_idle else 0)
+        # Dataprovider slicing must not be affected by skipped candles
+        assert (
+            len(backtesting.dataprovider.get_analyzed_dataframe("LTC/USDT", "5m")[0])
+            == len(data["LTC/USDT"]) - 1
+        )
+
+    assert len(results[False]["results"]) > 0
+    pd.testing.assert_frame_equal(results[False]["results"], results[True]["results"])
+    assert results[False]["rejected_signals"] == results[True]["rejected_signals"]
+    assert results[False]["final_balance"] == results[True]["final_balance"]
+    assert loop_calls[True] < loop_calls[False]
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_multi_pair_long_short_switch(
     default_conf_usdt,
@@ -1,4 +1,5 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from functools import partial, wraps
 from pathlib import Path
@@ -7,6 +8,8 @@ from unittest.mock import ANY, MagicMock, PropertyMock
 import pandas as pd
 import pytest
 from filelock import Timeout
+from joblib import dump
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
@@ -14,6 +17,7 @@ from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_worker_pool import EpochTiming
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
@@ -22,6 +26,7 @@ from freqtrade.util import dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_args,
     get_markets,
     log_has,
@@ -1189,6 +1194,159 @@ def test_in_strategy_auto_hyperopt_with_parallel(
     assert log_has("Test: Bot loop started", caplog)
 
 
+def test_in_strategy_auto_hyperopt_persistent_workers(
+    mocker, hyperopt_conf, tmp_path, fee, caplog
+) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 4,
+            "hyperopt_jobs": 2,
+            "hyperopt_persistent_workers": True,
+            "fee": fee.return_value,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+
+    hyperopt.start()
+    assert hyperopt._worker_pool is None
+    assert hyperopt.num_epochs_saved == 4
+    # Workers are only started once for all batches
+    assert [r.message for r in caplog.records].count("Started 2 persistent hyperopt workers.") == 1
+    # Test logs from persistent workers are shown.
+    assert log_has("Test: Bot loop started", caplog)
+
+
+def test_run_optimizer_async(mocker, hyperopt_conf, tmp_path, caplog) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "epochs": 5})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.init_spaces()
+    hyperopt.opt = hyperopt.hyperopter.get_optimizer(42)
+    evaluate_result = mocker.patch.object(hyperopt, "evaluate_result")
+
+    def submit(params):
+        future = Future()
+        future.set_result(({"loss": 1.0, "params_dict": params}, EpochTiming(0.5, 2.0)))
+        return future
+
+    pool = MagicMock(submit=MagicMock(side_effect=submit))
+    hyperopt._worker_pool = pool
+    pbar = MagicMock()
+
+    hyperopt.run_optimizer_async(2, 0, pbar, "task")
+    assert pool.submit.call_count == 5
+    assert evaluate_result.call_count == 5
+    assert [c[0][1] for c in evaluate_result.call_args_list] == [1, 2, 3, 4, 5]
+    assert pbar.update.call_count == 5
+    assert len(hyperopt.epoch_timings) == 5
+    assert len(hyperopt.opt.get_trials(states=[TrialState.COMPLETE])) == 5
+
+    hyperopt.log_epoch_timings(10.0, 2)
+    assert log_has(
+        "Epoch timings: average queue wait 0.500s, average compute 2.000s, "
+        "worker utilization 50.0%.",
+        caplog,
+    )
+
+    # Early stopping - stop asking, but evaluate epochs in flight
+    evaluate_result.reset_mock()
+    pool.submit.reset_mock()
+    hyperopt.total_epochs = 10
+    hyperopt.hyperopter.es_epochs = 1
+    hyperopt.hyperopter.es_terminator = MagicMock(should_terminate=MagicMock(return_value=True))
+    hyperopt.run_optimizer_async(2, 0, pbar, "task")
+    assert pool.submit.call_count == 2
+    assert evaluate_result.call_count == 2
+    assert log_has("Early stopping after 2 epochs", caplog)
+
+
+def test_get_asked_points_pending(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    pending = MagicMock(params={"buy_rsi": 30})
+    duplicate = MagicMock(params={"buy_rsi": 30})
+    duplicate.study.get_trials.return_value = []
+    mocker.patch.object(hyperopt, "get_optuna_asked_points", return_value=[duplicate])
+
+    asked, _ = hyperopt.get_asked_points(n_points=1, dimensions={})
+    assert asked == [duplicate]
+    # Points currently being evaluated are not asked again
+    asked, _ = hyperopt.get_asked_points(n_points=1, dimensions={}, pending=[pending])
+    assert asked == []
+    assert hyperopt.count_skipped_epochs == 1
+
+
+def test_in_strategy_auto_hyperopt_async(mocker, hyperopt_conf, tmp_path, fee, caplog) -> None:
+    mocker.patch(f"{EXMS}.validate_config", MagicMock())
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    mocker.patch(f"{EXMS}.reload_markets")
+    mocker.patch(f"{EXMS}.markets", PropertyMock(return_value=get_markets()))
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt_conf.update(
+        {
+            "strategy": "HyperoptableStrategy",
+            "user_data_dir": tmp_path,
+            "hyperopt_random_state": 42,
+            "spaces": ["all"],
+            "epochs": 5,
+            "hyperopt_jobs": 2,
+            "hyperopt_async_scheduling": True,
+            "fee": fee.return_value,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.persistent_workers is True
+    opt = hyperopt.hyperopter
+    opt.backtesting.exchange.get_max_leverage = lambda *x, **xx: 1.0
+    opt.backtesting.exchange.get_min_pair_stake_amount = lambda *x, **xx: 0.00001
+    opt.backtesting.exchange.get_max_pair_stake_amount = lambda *x, **xx: 100.0
+    opt.backtesting.exchange._markets = get_markets()
+
+    hyperopt.start()
+    assert hyperopt._worker_pool is None
+    assert hyperopt.num_epochs_saved == 5
+    assert len(hyperopt.epoch_timings) == 5
+    assert log_has_re(r"Epoch timings: average queue wait .*", caplog)
+    assert log_has("Test: Bot loop started", caplog)
+
+
+def test_hyperopt_attach_processed_data(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path})
+    (tmp_path / "hyperopt_results").mkdir(parents=True)
+    hyperopt = Hyperopt(hyperopt_conf)
+    opt = hyperopt.hyperopter
+    data = {"UNITTEST/BTC": generate_test_data("5m", 10)}
+    dump(data, hyperopt.data_pickle_file)
+
+    loaded = opt._load_processed_data()
+    assert opt._processed is None
+    pd.testing.assert_frame_equal(loaded["UNITTEST/BTC"], data["UNITTEST/BTC"])
+
+    opt.attach_processed_data()
+    assert opt._processed is not None
+    first = opt._load_processed_data()
+    first["UNITTEST/BTC"]["enter_long"] = 1
+    # Columns added while backtesting must not leak into following epochs
+    second = opt._load_processed_data()
+    assert "enter_long" not in second["UNITTEST/BTC"].columns
+    assert "enter_long" not in opt._processed["UNITTEST/BTC"].columns
+
+
 def test_in_strategy_auto_hyperopt_per_epoch(mocker, hyperopt_conf, tmp_path, fee) -> None:
     patch_exchange(mocker)
     mocker.patch(f"{EXMS}.get_fee", fee)
@@ -0,0 +1,119 @@
+import pickle
+
+import pandas as pd
+
+from freqtrade.configuration import TimeRange
+from freqtrade.optimize.hyperopt import Hyperopt
+from freqtrade.optimize.hyperopt.hyperopt_indicator_cache import IndicatorCache
+from tests.conftest import generate_test_data, patch_exchange
+
+
+def get_strategy(mocker, hyperopt_conf, tmp_path):
+    patch_exchange(mocker)
+    hyperopt_conf.update(
+        {
+            "user_data_dir": tmp_path,
+            "analyze_per_epoch": True,
+            "hyperopt_indicator_cache_mb": 10,
+        }
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.hyperopter.timerange = TimeRange()
+    strategy = hyperopt.hyperopter.backtesting.strategy
+    calls = []
+
+    def populate_indicators(dataframe, metadata):
+        calls.append(metadata["pair"])
+        dataframe["indicator"] = dataframe["close"] * strategy.buy_rsi.value
+        return dataframe
+
+    strategy.populate_indicators = populate_indicators
+    return hyperopt, strategy, calls
+
+
+def test_indicator_cache_reuse(mocker, hyperopt_conf, tmp_path) -> None:
+    hyperopt, strategy, calls = get_strategy(mocker, hyperopt_conf, tmp_path)
+    cache = hyperopt.hyperopter.indicator_cache
+    assert isinstance(cache, IndicatorCache)
+    data = {
+        "UNITTEST/BTC": generate_test_data("5m", 100),
+        "ETH/BTC": generate_test_data("5m", 100, random_seed=1),
+    }
+    # HyperoptableStrategy assigns buy_rsi in bot_start - as instance attribute
+    buy_rsi = strategy.buy_rsi
+    assert "buy_rsi" in strategy.__dict__
+    assert "sell_rsi" not in strategy.__dict__
+    assert buy_rsi.in_space
+    assert strategy.sell_rsi.in_space
+
+    first = hyperopt.hyperopter.advise_and_trim(data)
+    assert calls == ["UNITTEST/BTC", "ETH/BTC"]
+    assert cache.misses == 2
+    assert cache._tracked == {"buy_rsi"}
+    # Parameters are restored after analysis
+    assert strategy.buy_rsi is buy_rsi
+    assert "sell_rsi" not in strategy.__dict__
+
+    # Parameter not used in populate_indicators changed - reuse cached indicators
+    strategy.sell_rsi.value = strategy.sell_rsi.value + 1
+    second = hyperopt.hyperopter.advise_and_trim(data)
+    assert len(calls) == 2
+    assert cache.hits == 2
+    pd.testing.assert_frame_equal(first["ETH/BTC"], second["ETH/BTC"])
+    # Returned dataframes are copies
+    second["ETH/BTC"]["enter_long"] = 1
+    assert "enter_long" not in hyperopt.hyperopter.advise_and_trim(data)["ETH/BTC"].columns
+
+    # Parameter used in populate_indicators changed - recalculate
+    strategy.buy_rsi.value = strategy.buy_rsi.value + 1
+    third = hyperopt.hyperopter.advise_and_trim(data)
+    assert len(calls) == 4
+    assert cache.misses == 4
+    assert (third["ETH/BTC"]["indicator"] != first["ETH/BTC"]["indicator"]).all()
+
+    # Cached dataframes are not sent to worker processes
+    unpickled = pickle.loads(pickle.dumps(cache))  # noqa: S301
+    assert len(unpickled._entries) == 0
+    assert unpickled.memory == 0
+    assert unpickled._tracked == {"buy_rsi"}
+
+
+def test_indicator_cache_eviction(mocker, hyperopt_conf, tmp_path) -> None:
+    hyperopt, strategy, _ = get_strategy(mocker, hyperopt_conf, tmp_path)
+    data = {"UNITTEST/BTC": generate_test_data("5m", 1000)}
+    hyperopt.hyperopter.advise_and_trim(data)
+    entry_size = hyperopt.hyperopter.indicator_cache.memory
+    assert entry_size > 0
+
+    # Budget for 2 entries
+    cache = IndicatorCache(entry_size * 2.5 / 1024 / 1024)
+    hyperopt.hyperopter.indicator_cache = cache
+    for value in (10, 11, 12):
+        strategy.buy_rsi.value = value
+        hyperopt.hyperopter.advise_and_trim(data)
+    assert len(cache._entries) == 2
+    assert cache.memory == entry_size * 2
+
+    # Least recently used entry (10) has been evicted
+    strategy.buy_rsi.value = 11
+    hyperopt.hyperopter.advise_and_trim(data)
+    strategy.buy_rsi.value = 10
+    hyperopt.hyperopter.advise_and_trim(data)
+    assert cache.hits == 1
+    assert cache.misses == 4
+
+    # Entries larger than the budget are not cached
+    cache = IndicatorCache(entry_size / 2 / 1024 / 1024)
+    hyperopt.hyperopter.indicator_cache = cache
+    hyperopt.hyperopter.advise_and_trim(data)
+    assert len(cache._entries) == 0
+    assert cache.memory == 0
+
+
+def test_indicator_cache_disabled(mocker, hyperopt_conf, tmp_path) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"user_data_dir": tmp_path, "hyperopt_indicator_cache_mb": 10})
+    # Only used with analyze_per_epoch
+    assert Hyperopt(hyperopt_conf).hyperopter.indicator_cache is None
+    hyperopt_conf.update({"analyze_per_epoch": True, "hyperopt_indicator_cache_mb": 0})
+    assert Hyperopt(hyperopt_conf).hyperopter.indicator_cache is None
@@ -1359,6 +1359,72 @@ def test_get_open(fee, is_short, use_db):
     Trade.use_db = True
 
 
+@pytest.mark.usefixtures("init_persistence")
+def test_get_open_trades_cached(fee, mocker, caplog):
+    create_mock_trades(fee)
+    get_trades_mock = mocker.spy(Trade, "get_trades")
+
+    trades = Trade.get_open_trades()
+    assert len(trades) == 4
+    assert get_trades_mock.call_count == 1
+    # Served from the session cache - same instances
+    assert Trade.get_open_trades() == trades
+    assert Trade.get_open_trade_count() == 4
+    assert len(Trade.get_trades_proxy(is_open=True, pair="ETC/BTC")) == 1
+    assert get_trades_mock.call_count == 1
+    # Not cached
+    Trade.get_trades_proxy(is_open=False)
+    assert get_trades_mock.call_count == 2
+
+    trades[0].is_open = False
+    Trade.commit()
+    assert len(Trade.get_open_trades()) == 3
+    assert get_trades_mock.call_count == 3
+
+    # Cache out of sync - only detected in check mode
+    Trade.session.info["open_trades"] = (Trade.open_trades_version, trades[:1])
+    assert len(Trade.get_open_trades()) == 1
+    Trade.check_open_trades_cache = True
+    try:
+        assert len(Trade.get_open_trades()) == 3
+        assert log_has_re(r"Open trades cache out of sync.*", caplog)
+        assert len(Trade.get_open_trades()) == 3
+    finally:
+        Trade.check_open_trades_cache = False
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_get_closed_trades_count(fee, mocker):
+    create_mock_trades(fee)
+    scalar_mock = mocker.spy(Trade.session, "scalar")
+
+    assert Trade.get_closed_trades_count() == 2
+    assert scalar_mock.call_count == 1
+    assert Trade.get_closed_trades_count() == 2
+    assert scalar_mock.call_count == 1
+
+    # Unrelated changes keep the cached count
+    trade = Trade.get_open_trades()[0]
+    trade.max_rate = 1000
+    Trade.commit()
+    assert Trade.get_closed_trades_count() == 2
+    assert scalar_mock.call_count == 1
+
+    # Closing a trade invalidates the count
+    trade.is_open = False
+    trade.close_date = datetime.now(tz=UTC)
+    Trade.session.flush()
+    assert Trade.get_closed_trades_count() == 3
+    assert scalar_mock.call_count == 2
+    Trade.commit()
+    assert Trade.get_closed_trades_count() == 3
+    assert scalar_mock.call_count == 3
+
+    trade.delete()
+    assert Trade.get_closed_trades_count() == 2
+    assert scalar_mock.call_count == 4
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("use_db", [True, False])
 def test_get_open_lev(fee, use_db):
@@ -1889,6 +1955,53 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_backtesting(fee):
+    Trade.use_db = False
+    Trade.reset_trades()
+    now = datetime(2024, 5, 10, 12, 0, tzinfo=UTC)
+
+    def closed_trade(pair: str, minutes: int) -> LocalTrade:
+        return LocalTrade(
+            pair=pair,
+            stake_amount=10,
+            amount=1,
+            open_rate=10,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            is_open=False,
+            open_date=now - timedelta(minutes=minutes + 30),
+            close_date=now - timedelta(minutes=minutes),
+            exchange="binance",
+        )
+
+    # Added out of close_date order
+    for pair, minutes in [("ETH/BTC", 50), ("XRP/BTC", 10), ("ETH/BTC", 5), ("ETH/BTC", 20)]:
+        LocalTrade.add_bt_trade(closed_trade(pair, minutes))
+
+    trades = Trade.get_trades_proxy(is_open=False, close_date=now - timedelta(minutes=30))
+    assert [t.close_date for t in trades] == [
+        now - timedelta(minutes=20),
+        now - timedelta(minutes=10),
+        now - timedelta(minutes=5),
+    ]
+    trades = Trade.get_trades_proxy(
+        pair="ETH/BTC", is_open=False, close_date=now - timedelta(minutes=20)
+    )
+    assert len(trades) == 1
+    assert trades[0].close_date == now - timedelta(minutes=5)
+    assert Trade.get_trades_proxy(pair="LTC/BTC", is_open=False, close_date=now) == []
+    trades = Trade.get_trades_proxy(
+        is_open=False,
+        close_date=now - timedelta(minutes=60),
+        open_date=now - timedelta(minutes=45),
+    )
+    assert len(trades) == 2
+
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(is_open=False, close_date=now - timedelta(days=1)) == []
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2139,6 +2252,14 @@ def test_Trade_object_idem():
         "get_trading_volume",
         "validate_string_len",
         "custom_data",
+        "open_trades_version",
+        "check_open_trades_cache",
+        "reset_open_trades_cache",
+        "closed_trades_version",
+        "reset_closed_trades_count",
+        "check_closed_trades_changed",
+        "end_closed_trades_transaction",
+        "get_closed_trades_count",
     )
     EXCLUDES2 = (
         "bt_trades",
@@ -2146,6 +2267,7 @@ def test_Trade_object_idem():
         "bt_trades_open_pp",
         "bt_open_open_trade_count",
         "bt_total_profit",
+        "bt_trades_closed_idx",
         "from_json",
     )
 
@@ -158,3 +158,45 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def test_PairLocks_backtesting_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    now = datetime(2024, 5, 1, 10, 0, tzinfo=UTC)
+
+    PairLocks.lock_pair("ETH/BTC", now + timedelta(minutes=10), "lock1", now=now)
+    PairLocks.lock_pair("ETH/BTC", now + timedelta(minutes=30), "lock2", now=now, side="long")
+    PairLocks.lock_pair("*", now + timedelta(minutes=20), "global", now=now, side="short")
+
+    assert PairLocks.is_pair_locked("ETH/BTC", now)
+    assert not PairLocks.is_pair_locked("XRP/BTC", now, side="long")
+    assert PairLocks.is_pair_locked("XRP/BTC", now, side="short")
+    assert [lock.reason for lock in PairLocks.get_pair_locks("ETH/BTC", now, side="long")] == [
+        "lock1",
+        "lock2",
+    ]
+
+    later = now + timedelta(minutes=27)
+    # lock1 and the global lock expired - and are evicted from the index
+    assert not PairLocks.is_pair_locked("ETH/BTC", later)
+    assert not PairLocks.is_pair_locked("XRP/BTC", later, side="short")
+    assert [lock.reason for lock in PairLocks.get_pair_locks("ETH/BTC", later, side="long")] == [
+        "lock2"
+    ]
+    assert len(PairLocks._active_locks["ETH/BTC"]["*"]) == 0
+
+    # Earlier dates still see expired locks
+    assert PairLocks.is_pair_locked("ETH/BTC", now)
+    assert PairLocks.is_pair_locked("XRP/BTC", now, side="short")
+
+    PairLocks.unlock_pair("ETH/BTC", later, side="long")
+    assert not PairLocks.is_pair_locked("ETH/BTC", later, side="long")
+
+    # All locks are kept for reporting
+    assert [lock.reason for lock in PairLocks.get_all_locks()] == ["lock1", "lock2", "global"]
+
+    PairLocks.reset_locks()
+    assert not PairLocks.is_pair_locked("ETH/BTC", later, side="long")
+    PairLocks.use_db = True
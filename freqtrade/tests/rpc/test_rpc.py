@@ -348,6 +348,23 @@ def test__rpc_timeunit_profit(
         assert day["fiat_value"] in (0.0,)
     # ensure first day is current date
     assert str(days["data"][0]["date"]) == str(datetime.now(UTC).date())
+    trade_count = sum(day["trade_count"] for day in days["data"])
+    assert trade_count > 0
+
+    weeks = rpc._rpc_timeunit_profit(3, stake_currency, fiat_display_currency, "weeks")
+    assert [str(week["date"]) for week in weeks["data"]] == [
+        "2023-09-04",
+        "2023-08-28",
+        "2023-08-21",
+    ]
+    assert sum(week["trade_count"] for week in weeks["data"]) == trade_count
+    assert weeks["data"][0]["abs_profit"] == pytest.approx(
+        sum(day["abs_profit"] for day in days["data"][:2])
+    )
+
+    months = rpc._rpc_timeunit_profit(2, stake_currency, fiat_display_currency, "months")
+    assert [str(month["date"]) for month in months["data"]] == ["2023-09-01", "2023-08-01"]
+    assert sum(month["trade_count"] for month in months["data"]) == trade_count
 
     # Try invalid data
     with pytest.raises(RPCException, match=r".*must be an integer greater than 0*"):
@@ -376,6 +393,32 @@ def test_rpc_trade_history(mocker, default_conf, markets, fee, is_short):
     assert trades["trades"][-1]["pair"] == "ETC/BTC"
     assert trades["trades"][0]["pair"] == "XRP/BTC"
 
+    # Keyset pagination
+    trades = rpc._rpc_trade_history(1)
+    assert trades["trades"][0]["pair"] == "XRP/BTC"
+    trades = rpc._rpc_trade_history(1, after_id=trades["trades"][0]["trade_id"])
+    assert trades["trades_count"] == 1
+    assert trades["total_trades"] == 2
+    assert trades["trades"][0]["pair"] == "ETC/BTC"
+    trades = rpc._rpc_trade_history(1, after_id=trades["trades"][0]["trade_id"])
+    assert trades["trades"] == []
+
+    trades = rpc._rpc_trade_history(5, order_by_id=True, after_id=2)
+    assert [t["trade_id"] for t in trades["trades"]] == [3]
+
+    with pytest.raises(RPCException, match=r"Closed trade 1 not found\."):
+        # Trade 1 is open
+        rpc._rpc_trade_history(5, after_id=1)
+
+    # Summaries contain the same values, without orders
+    trades = rpc._rpc_trade_history(2)
+    summaries = rpc._rpc_trade_history(2, summary=True)
+    assert summaries["total_trades"] == 2
+    assert len(summaries["trades"]) == 2
+    for trade, trade_summary in zip(trades["trades"], summaries["trades"], strict=True):
+        assert "orders" not in trade_summary
+        assert trade_summary == {key: trade[key] for key in trade_summary}
+
 
 @pytest.mark.parametrize("is_short", [True, False])
 def test_rpc_delete_trade(mocker, default_conf, fee, markets, caplog, is_short):
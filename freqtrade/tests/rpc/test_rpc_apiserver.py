@@ -4,6 +4,7 @@ Unit test file for rpc/api_server.py
 
 import asyncio
 import logging
+import os
 import time
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
@@ -21,16 +22,25 @@ from requests.auth import _basic_auth_str
 from sqlalchemy import select
 
 from freqtrade.__init__ import __version__
-from freqtrade.enums import CandleType, RunMode, State, TradingMode
+from freqtrade.enums import CandleType, RPCMessageType, RunMode, State, TradingMode
 from freqtrade.exceptions import DependencyException, ExchangeError, OperationalException
 from freqtrade.loggers import setup_logging, setup_logging_pre
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import CustomDataWrapper, Trade
-from freqtrade.rpc import RPC
+from freqtrade.resolvers import StrategyResolver
+from freqtrade.rpc import RPC, analysed_history_cache
 from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.ws import (
+    ArrowWebSocketSerializer,
+    ChannelMessageQueue,
+    HybridJSONWebSocketSerializer,
+    SerializedMessage,
+)
+from freqtrade.strategy import IStrategy
+from freqtrade.util import LoopMetrics
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -2200,6 +2210,19 @@ def test_api_pair_candles(botclient, ohlcv_history, annotations, expected):
             None,
         ],
     ]
+    rows = rc.json()["data"]
+
+    rc = client_post(
+        client,
+        f"{BASE_URI}/pair_candles",
+        data={"pair": "XRP/BTC", "timeframe": timeframe, "limit": amount, "columnar": True},
+    )
+    assert_response(rc)
+    resp = rc.json()
+    assert resp["data"] == []
+    assert resp["length"] == amount
+    assert len(resp["column_data"]) == len(resp["columns"])
+    assert [list(row) for row in zip(*resp["column_data"], strict=True)] == rows
 
 
 def test_api_pair_history(botclient, tmp_path, mocker):
@@ -2297,7 +2320,8 @@ def test_api_pair_history(botclient, tmp_path, mocker):
         assert data[0][date_col_idx] == "2018-01-11T00:00:00Z"
         assert data[0][rsi_col_idx] is not None
         assert data[0][rsi_col_idx] > 0
-        assert lfm.call_count == 1
+        # The strategy is reused for the 2nd call
+        assert lfm.call_count == (1 if call == "get" else 0)
         assert result["pair"] == "UNITTEST/BTC"
         assert result["strategy"] == CURRENT_TEST_STRATEGY
         assert result["data_start"] == "2018-01-11 00:00:00+00:00"
@@ -2352,6 +2376,83 @@ def test_api_pair_history(botclient, tmp_path, mocker):
     assert result["columns"] == ["date", "open", "high", "low", "close", "volume", "__date_ts"]
 
 
+def test_api_pair_history_cache(botclient, tmp_path, mocker):
+    _ftbot, client = botclient
+    _ftbot.config["user_data_dir"] = tmp_path
+    _ftbot.config["runmode"] = RunMode.WEBSERVER
+    mocker.patch("freqtrade.strategy.interface.IStrategy.load_freqAI_model")
+    # Process wide cache - may contain results of previous tests
+    mocker.patch.object(analysed_history_cache, "_cache", None)
+    load_data_mock = mocker.spy(analysed_history_cache, "load_data")
+    load_strategy_mock = mocker.spy(StrategyResolver, "load_strategy")
+    analyze_mock = mocker.spy(IStrategy, "analyze_ticker")
+    get_strategy_mock = mocker.spy(analysed_history_cache.AnalysedHistoryCache, "get_strategy")
+    url = (
+        f"{BASE_URI}/pair_history?pair=UNITTEST%2FBTC&timeframe=5m"
+        f"&timerange=20180111-20180112&strategy={CURRENT_TEST_STRATEGY}"
+    )
+
+    rc = client_get(client, url)
+    assert_response(rc, 200)
+    result = rc.json()
+    strategy = get_strategy_mock.spy_return[0]
+    dp = strategy.dp
+    assert load_data_mock.call_count == 1
+    assert load_strategy_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+
+    rc = client_get(client, url)
+    assert_response(rc, 200)
+    assert rc.json()["data"] == result["data"]
+    assert load_data_mock.call_count == 1
+    assert load_strategy_mock.call_count == 1
+    assert analyze_mock.call_count == 1
+
+    # Different timerange - strategy is reused, data is loaded again
+    rc = client_get(client, url.replace("20180111-20180112", "20180111-20180113"))
+    assert_response(rc, 200)
+    assert rc.json()["length"] > result["length"]
+    assert load_data_mock.call_count == 2
+    assert load_strategy_mock.call_count == 1
+    assert analyze_mock.call_count == 2
+    # Informative data must not be served from the DataProvider of the previous request
+    assert get_strategy_mock.spy_return[0] is strategy
+    assert strategy.dp is not dp
+
+    # Disabled cache
+    _ftbot.config["api_server"]["pair_history_cache_size"] = 0
+    for _ in range(2):
+        rc = client_get(client, url)
+        assert_response(rc, 200)
+    assert load_data_mock.call_count == 4
+    assert load_strategy_mock.call_count == 3
+    assert analyze_mock.call_count == 4
+    del _ftbot.config["api_server"]["pair_history_cache_size"]
+
+
+def test_analysed_history_cache_informative(default_conf, tmp_path):
+    default_conf["datadir"] = tmp_path
+    default_conf["dataformat_ohlcv"] = "feather"
+    datafile = tmp_path / "UNITTEST_BTC-5m.feather"
+    datafile.write_bytes(
+        (Path(__file__).parents[1] / "testdata/UNITTEST_BTC-5m.feather").read_bytes()
+    )
+    dp = MagicMock()
+    dp.historic_pairs.return_value = [("UNITTEST/BTC", "5m", CandleType.SPOT)]
+    history_cache = analysed_history_cache.AnalysedHistoryCache(max_size_mb=10)
+    df = pd.DataFrame({"close": [1.0, 2.0]})
+
+    history_cache.set_result(default_conf, ("key",), df, [], dp)
+    cached = history_cache.get_result(default_conf, ("key",))
+    assert cached is not None
+    assert cached[0] is df
+
+    # Informative data changed on disk
+    mtime = datafile.stat().st_mtime_ns
+    os.utime(datafile, ns=(mtime + 10**9, mtime + 10**9))
+    assert history_cache.get_result(default_conf, ("key",)) is None
+
+
 def test_api_pair_history_live_mode(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -3142,6 +3243,27 @@ def test_health(botclient):
     assert ret["last_process"] is None
 
 
+def test_api_loop_metrics(botclient, mocker):
+    _ftbot, client = botclient
+    metrics = LoopMetrics()
+    metrics.add("phase", "enter_positions", 0.3)
+    metrics.add("exchange", "fetch_ticker", 0.02)
+    mocker.patch("freqtrade.rpc.rpc.loop_metrics", metrics)
+
+    rc = client_get(client, f"{BASE_URI}/loop_metrics")
+    assert_response(rc)
+    ret = rc.json()
+    assert ret["analyze"] == {}
+    assert ret["phase"]["enter_positions"]["count"] == 1
+    assert ret["phase"]["enter_positions"]["max"] == 0.3
+    assert ret["exchange"]["fetch_ticker"]["buckets"]["0.025"] == 1
+
+    rc = client_get(client, f"{BASE_URI}/loop_metrics/prometheus")
+    assert rc.status_code == 200
+    assert rc.headers.get("content-type") == "text/plain; charset=utf-8"
+    assert 'freqtrade_phase_duration_seconds_count{name="enter_positions"} 1' in rc.text
+
+
 def test_api_ws_subscribe(botclient, mocker):
     _ftbot, client = botclient
     ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
@@ -3223,7 +3345,7 @@ def test_api_ws_send_msg(default_conf, mocker, caplog):
             test_message = {"type": "status", "data": "test"}
             first_waiter = apiserver._message_stream._waiter
             apiserver.send_msg(test_message)
-            assert first_waiter.result()[0] == test_message
+            assert first_waiter.result()[0].message == test_message
 
             second_waiter = apiserver._message_stream._waiter
             apiserver.send_msg(test_message)
@@ -3234,6 +3356,118 @@ def test_api_ws_send_msg(default_conf, mocker, caplog):
         ApiServer.shutdown()
 
 
+async def test_ws_channel_message_queue(caplog):
+    def analyzed_df_msg(pair, candle):
+        return SerializedMessage(
+            {
+                "type": RPCMessageType.ANALYZED_DF,
+                "data": {"key": (pair, "5m", "spot"), "df": candle},
+            }
+        )
+
+    queue = ChannelMessageQueue(maxsize=3)
+    queue.put(analyzed_df_msg("ETH/BTC", 1), 1.0)
+    queue.put(SerializedMessage({"type": RPCMessageType.WHITELIST, "data": []}), 2.0)
+    queue.put(analyzed_df_msg("XRP/BTC", 1), 3.0)
+    # Replaces the first message, keeping its position
+    queue.put(analyzed_df_msg("ETH/BTC", 2), 4.0)
+    assert len(queue) == 3
+    assert queue.coalesced == 1
+
+    message, ts = await queue.get()
+    assert message.message["data"]["df"] == 2
+    assert ts == 4.0
+
+    queue.put(analyzed_df_msg("LTC/BTC", 1), 5.0)
+    # Queue is full - the whitelist message is dropped
+    queue.put(analyzed_df_msg("NEO/BTC", 1), 6.0)
+    assert log_has_re(r"Message queue is full, dropped 1 messages so far.*", caplog)
+    assert [(await queue.get())[1] for _ in range(3)] == [3.0, 5.0, 6.0]
+    assert queue.stats() == {
+        "depth": 0,
+        "max_depth": 3,
+        "enqueued": 6,
+        "sent": 0,
+        "coalesced": 1,
+        "dropped": 1,
+    }
+
+
+def test_ws_serialized_message(mocker):
+    message = SerializedMessage({"type": RPCMessageType.WHITELIST, "data": ["ETH/BTC"]})
+    serialize_mock = mocker.spy(HybridJSONWebSocketSerializer, "_serialize")
+    serializers = [HybridJSONWebSocketSerializer(MagicMock()) for _ in range(3)]
+    results = [message.serialize(serializer) for serializer in serializers]
+    assert serialize_mock.call_count == 1
+    assert results == ['{"type":"whitelist","data":["ETH/BTC"]}'] * 3
+
+
+def test_ws_arrow_serializer(ohlcv_history):
+    serializer = ArrowWebSocketSerializer(MagicMock())
+    message = {
+        "type": RPCMessageType.ANALYZED_DF,
+        "data": {
+            "key": ("ETH/BTC", "5m", "spot"),
+            "df": ohlcv_history,
+            "la": datetime(2024, 1, 1, tzinfo=UTC),
+        },
+    }
+    data = serializer._serialize(message)
+    assert isinstance(data, bytes)
+
+    result = serializer._deserialize(data)
+    assert result["type"] == "analyzed_df"
+    assert result["data"]["key"] == ["ETH/BTC", "5m", "spot"]
+    assert result["data"]["la"] == "2024-01-01T00:00:00+00:00"
+    pd.testing.assert_frame_equal(result["data"]["df"], ohlcv_history)
+
+    # Messages without dataframe are sent as JSON
+    data = serializer._serialize({"type": RPCMessageType.WHITELIST, "data": ["ETH/BTC"]})
+    assert data == '{"type":"whitelist","data":["ETH/BTC"]}'
+    assert serializer._deserialize(data) == {"type": "whitelist", "data": ["ETH/BTC"]}
+
+
+def test_api_ws_encoding(botclient, caplog):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({"type": "encoding", "data": "msgpack"})
+        ws.send_json({"type": "whitelist", "data": None})
+        # Unknown encodings keep JSON
+        response = ws.receive_json()
+        assert response["type"] == "whitelist"
+    assert log_has_re(r"Invalid encoding request from .*", caplog)
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({"type": "encoding", "data": "arrow"})
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+        assert response["type"] == "whitelist"
+
+        ws.send_json({"type": "analyzed_df", "data": {}})
+        response = ArrowWebSocketSerializer(MagicMock())._deserialize(ws.receive_bytes())
+        assert response["type"] == "analyzed_df"
+        assert isinstance(response["data"]["df"], pd.DataFrame)
+
+
+def test_api_ws_channels(botclient):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+
+    rc = client_get(client, f"{BASE_URI}/ws_channels")
+    assert_response(rc)
+    assert rc.json() == []
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({"type": "subscribe", "data": ["whitelist"]})
+        time.sleep(0.2)
+        rc = client_get(client, f"{BASE_URI}/ws_channels")
+        assert_response(rc)
+        assert len(rc.json()) == 1
+        assert rc.json()[0]["dropped"] == 0
+
+
 def test_api_download_data(botclient, mocker, tmp_path):
     ftbot, client = botclient
 
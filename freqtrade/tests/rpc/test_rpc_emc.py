@@ -11,6 +11,7 @@ import pytest
 import websockets
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import RPCRequestType
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
 from tests.conftest import log_has, log_has_re, log_has_when
 
@@ -76,6 +77,38 @@ def test_emc_init(patched_emc):
     assert patched_emc.sleep_time > 0
 
 
+def test_emc_init_dataframe_encoding(default_conf, mocker, caplog):
+    default_conf.update(
+        {
+            "external_message_consumer": {
+                "enabled": True,
+                "producers": [
+                    {"name": "default", "host": "null", "port": 9891, "ws_token": _TEST_WS_TOKEN}
+                ],
+                "dataframe_encoding": "arrow",
+            }
+        }
+    )
+    dataprovider = DataProvider(default_conf, None, None, None)
+    mocker.patch(
+        "freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.start", MagicMock()
+    )
+    emc = ExternalMessageConsumer(default_conf, dataprovider)
+    assert emc.dataframe_encoding == "arrow"
+    # Encoding is requested before any dataframe
+    assert emc._initial_requests[0].type == RPCRequestType.ENCODING
+    assert emc._initial_requests[0].data == "arrow"
+
+    mocker.patch(
+        "freqtrade.rpc.external_message_consumer.ArrowWebSocketSerializer.is_available",
+        return_value=False,
+    )
+    emc = ExternalMessageConsumer(default_conf, dataprovider)
+    assert log_has("pyarrow is not available, falling back to JSON dataframe encoding.", caplog)
+    assert emc.dataframe_encoding == "json"
+    assert all(req.type != RPCRequestType.ENCODING for req in emc._initial_requests)
+
+
 # Parametrize this?
 def test_emc_handle_producer_message(patched_emc, caplog, ohlcv_history):
     test_producer = {"name": "test", "url": "ws://test", "ws_token": "test"}
@@ -1,10 +1,13 @@
 # pragma pylint: disable=missing-docstring, C0103
 import logging
 import math
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pandas import DataFrame, concat
 
@@ -21,8 +24,15 @@ from freqtrade.strategy.parameters import (
     IntParameter,
 )
 from freqtrade.strategy.strategy_validation import StrategyResultValidator
+from freqtrade.strategy.streaming_indicators import StreamingEMA
 from freqtrade.util import dt_now
-from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
+from tests.conftest import (
+    CURRENT_TEST_STRATEGY,
+    TRADE_SIDES,
+    generate_test_data,
+    log_has,
+    log_has_re,
+)
 
 from .strats.strategy_test_v3 import StrategyTestV3
 
@@ -125,6 +135,147 @@ def test_analyze_pair_empty(mocker, caplog, ohlcv_history):
     assert log_has("Empty dataframe for pair ETH/BTC", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 4])
+def test_analyze_concurrent(mocker, default_conf, ohlcv_history, workers):
+    default_conf["analyze_workers"] = workers
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    pairs = ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC", "TKN/BTC"]
+    delays = {"ETH/BTC": 0.05, "LTC/BTC": 0.0, "XRP/BTC": 0.02, "NEO/BTC": 0.03}
+    mocker.patch.object(
+        strategy.dp,
+        "ohlcv",
+        side_effect=lambda pair, *args, **kwargs: (
+            ohlcv_history.copy() if pair in delays else DataFrame()
+        ),
+    )
+    threads = set()
+
+    def populate_indicators(dataframe, metadata):
+        threads.add(threading.current_thread().name)
+        time.sleep(delays[metadata["pair"]])
+        dataframe["pair"] = metadata["pair"]
+        return dataframe
+
+    mocker.patch.object(strategy, "populate_indicators", side_effect=populate_indicators)
+    mocker.patch.object(strategy, "populate_entry_trend", side_effect=lambda df, meta: df)
+    mocker.patch.object(strategy, "populate_exit_trend", side_effect=lambda df, meta: df)
+    cache_mock = mocker.spy(strategy.dp, "_set_cached_df")
+
+    strategy.analyze(pairs)
+    assert (len(threads) > 1) == (workers > 1)
+    # Stored in order of the pairs - independent of the time analysis took
+    assert [c[0][0] for c in cache_mock.call_args_list] == list(delays)
+    for pair in delays:
+        df, _ = strategy.dp.get_analyzed_dataframe(pair, strategy.timeframe)
+        assert (df["pair"] == pair).all()
+    assert set(strategy.analyze_timings) == set(pairs)
+    assert strategy.slowest_pairs(2)[0][0] == "ETH/BTC"
+    assert strategy.slowest_pairs(2)[0][1] >= 0.05
+
+    # Already analyzed candles are not stored again
+    cache_mock.reset_mock()
+    strategy.analyze(pairs)
+    assert cache_mock.call_count == 0
+
+
+def test_analyze_ticker_incremental(mocker, default_conf, caplog):
+    caplog.set_level(logging.DEBUG)
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.dp = DataProvider(default_conf, None, None)
+    strategy.incremental_recompute_candles = 5
+    data = generate_test_data(default_conf["timeframe"], 200)
+    emas = {}
+
+    def populate_indicators(dataframe, metadata):
+        emas[metadata["pair"]] = StreamingEMA(10)
+        dataframe["ema"] = emas[metadata["pair"]].update(dataframe["close"])
+        return dataframe
+
+    def populate_indicators_incremental(self, dataframe, metadata, new_candles):
+        new_rows = dataframe.index[-new_candles:]
+        dataframe.loc[new_rows, "ema"] = emas[metadata["pair"]].update(
+            dataframe.loc[new_rows, "close"]
+        )
+        return dataframe
+
+    ind_mock = mocker.patch.object(strategy, "populate_indicators", side_effect=populate_indicators)
+    incremental_mock = mocker.patch.object(
+        type(strategy),
+        "populate_indicators_incremental",
+        side_effect=populate_indicators_incremental,
+        autospec=True,
+    )
+    mocker.patch.object(strategy, "populate_entry_trend", side_effect=lambda df, meta: df)
+    mocker.patch.object(strategy, "populate_exit_trend", side_effect=lambda df, meta: df)
+
+    # Candle window of 150 candles, sliding forward
+    def analyze(end):
+        return strategy._analyze_ticker_internal(
+            data.iloc[end - 150 : end].reset_index(drop=True), {"pair": "ETH/BTC"}
+        )
+
+    df = analyze(150)
+    assert ind_mock.call_count == 1
+    assert incremental_mock.call_count == 0
+
+    df = analyze(151)
+    df = analyze(153)
+    assert ind_mock.call_count == 1
+    assert incremental_mock.call_count == 2
+    assert incremental_mock.call_args[0][3] == 2
+    assert len(df) == 150
+    assert df["date"].equals(data["date"].iloc[3:153].reset_index(drop=True))
+    assert log_has_re(r"Populating indicators incrementally for pair ETH/BTC\.", caplog)
+    # Incremental result matches the full calculation
+    full = StreamingEMA(10).update(data["close"].iloc[:153])
+    assert np.allclose(df["ema"].iloc[-10:], full[-10:], rtol=1e-12)
+
+    # Recalculated after incremental_recompute_candles
+    df = analyze(155)
+    assert ind_mock.call_count == 2
+    assert incremental_mock.call_count == 3
+    assert not log_has_re(r"Incrementally calculated indicators .*", caplog)
+
+    # Drift is detected
+    def drifting_incremental(self, dataframe, metadata, new_candles):
+        dataframe = populate_indicators_incremental(self, dataframe, metadata, new_candles)
+        dataframe.loc[dataframe.index[-1], "ema"] += 1
+        return dataframe
+
+    incremental_mock.side_effect = drifting_incremental
+    for end in range(156, 161):
+        analyze(end)
+    assert log_has_re(
+        r"Incrementally calculated indicators for ETH/BTC differ from populate_indicators\(\): "
+        r"ema\. Using recalculated indicators\.",
+        caplog,
+    )
+
+    # Missing last analyzed candle results in a full analysis
+    ind_mock.reset_mock()
+    incremental_mock.reset_mock()
+    gap = data.drop(index=159).iloc[10:160].reset_index(drop=True)
+    strategy._analyze_ticker_internal(gap, {"pair": "ETH/BTC"})
+    assert ind_mock.call_count == 1
+
+    # Changed candle data results in a full analysis
+    changed = data.iloc[12:162].reset_index(drop=True)
+    changed.loc[100, "close"] += 1
+    strategy._analyze_ticker_internal(changed, {"pair": "ETH/BTC"})
+    assert ind_mock.call_count == 2
+    assert incremental_mock.call_count == 0
+
+    # Not used without process_only_new_candles
+    strategy.process_only_new_candles = False
+    ind_mock.reset_mock()
+    incremental_mock.reset_mock()
+    analyze(200)
+    analyze(201)
+    assert ind_mock.call_count == 2
+    assert incremental_mock.call_count == 0
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         "foo", default_conf["timeframe"], DataFrame()
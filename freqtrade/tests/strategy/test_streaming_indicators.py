@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+import talib.abstract as ta
+
+from freqtrade.strategy.streaming_indicators import (
+    StreamingATR,
+    StreamingBollinger,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+)
+from tests.conftest import generate_test_data
+
+
+@pytest.mark.parametrize("split", [0, 1, 100, 199])
+def test_streaming_indicators_match_talib(split):
+    data = generate_test_data("5m", 200)
+    head, tail = data.iloc[:split], data.iloc[split:]
+
+    def streamed(indicator, *columns):
+        return np.concatenate(
+            [
+                indicator.update(*[head[col] for col in columns]),
+                indicator.update(*[tail[col] for col in columns]),
+            ]
+        )
+
+    np.testing.assert_allclose(
+        streamed(StreamingEMA(20), "close"), ta.EMA(data, timeperiod=20), rtol=1e-10
+    )
+    np.testing.assert_allclose(
+        streamed(StreamingRSI(14), "close"), ta.RSI(data, timeperiod=14), rtol=1e-10
+    )
+    np.testing.assert_allclose(
+        streamed(StreamingATR(14), "high", "low", "close"),
+        ta.ATR(data, timeperiod=14),
+        rtol=1e-10,
+    )
+    bollinger = ta.BBANDS(data, timeperiod=20, nbdevup=2.0, nbdevdn=2.0)
+    np.testing.assert_allclose(
+        streamed(StreamingBollinger(20, 2.0), "close"),
+        bollinger[["upperband", "middleband", "lowerband"]].to_numpy(),
+        rtol=1e-10,
+    )
+    macd = ta.MACD(data)
+    np.testing.assert_allclose(
+        streamed(StreamingMACD(), "close"),
+        macd[["macd", "macdsignal", "macdhist"]].to_numpy(),
+        rtol=1e-8,
+    )
+
+
+def test_streaming_indicators_nan():
+    ema = StreamingEMA(2)
+    assert np.isnan(ema.update([np.nan, 1.0])).all()
+    assert ema.update(3.0)[0] == 2.0
+    # Missing values don't change the state
+    assert np.isnan(ema.update(np.nan)[0])
+    assert ema.value == 2.0
+    assert ema.update(5.0)[0] == 4.0
+
+    rsi = StreamingRSI(2)
+    assert np.isnan(rsi.update([1.0, np.nan, 2.0])).all()
+    assert rsi.update(3.0)[0] == 100.0
+    assert rsi.update(3.0)[0] == 100.0
+    assert rsi.update(1.0)[0] == pytest.approx(20.0)
+
+    with pytest.raises(ValueError, match=r"period must be >= 1\."):
+        StreamingEMA(0)
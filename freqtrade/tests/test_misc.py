@@ -4,11 +4,14 @@ from copy import deepcopy
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from freqtrade.misc import (
+    dataframe_to_columns,
     dataframe_to_json,
+    dataframe_to_rows,
     deep_merge_dicts,
     file_dump_json,
     file_load_json,
@@ -220,3 +223,40 @@ def test_dataframe_json(ohlcv_history):
     json = dataframe_to_json(ohlcv_history)
 
     dataframe = json_to_dataframe(json)
+
+
+def test_dataframe_to_columns():
+    df = pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2024-01-01 00:00", None, "2024-01-01 00:10"], utc=True),
+            "close": [1.5, np.nan, np.inf],
+            "volume": np.array([1.0, -np.inf, 2.0], dtype="float32"),
+            "enter_long": [0, 1, 0],
+            "flag": [True, False, True],
+            "enter_tag": ["tag", None, np.nan],
+            "mixed": [np.inf, "a", 2],
+            "nullable": pd.array([1, None, 3], dtype="Int64"),
+        }
+    )
+    columns = dataframe_to_columns(df)
+    assert len(columns) == 8
+    assert columns[0] == [
+        pd.Timestamp("2024-01-01 00:00", tz="UTC"),
+        None,
+        pd.Timestamp("2024-01-01 00:10", tz="UTC"),
+    ]
+    assert columns[1] == [1.5, None, None]
+    assert columns[2] == [1.0, None, 2.0]
+    assert columns[3] == [0, 1, 0]
+    assert all(type(val) is int for val in columns[3])
+    assert columns[4] == [True, False, True]
+    assert columns[5] == ["tag", None, None]
+    assert columns[6] == [None, "a", 2]
+    assert columns[7] == [1, None, 3]
+
+    rows = dataframe_to_rows(columns)
+    assert len(rows) == 3
+    assert rows[1] == [None, None, None, 1, False, None, "a", None]
+
+    assert dataframe_to_columns(df.iloc[0:0]) == [[]] * 8
+    assert dataframe_to_rows(dataframe_to_columns(df.iloc[0:0])) == []
@@ -7,12 +7,14 @@ from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.wallets import Wallets
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
     get_patched_freqtradebot,
+    log_has_re,
     patch_wallet,
 )
 
@@ -416,6 +418,71 @@ def test_sync_wallet_futures_dry(mocker, default_conf, fee):
     assert free + used == total
 
 
+@pytest.mark.parametrize("trading_mode", ["spot", "futures"])
+def test_update_trade_balance_backtest(mocker, default_conf_usdt, fee, caplog, trading_mode):
+    default_conf_usdt["dry_run"] = True
+    default_conf_usdt["trading_mode"] = trading_mode
+    default_conf_usdt["margin_mode"] = "isolated"
+    freqtrade = get_patched_freqtradebot(mocker, default_conf_usdt)
+    Trade.use_db = False
+    Trade.reset_trades()
+    try:
+        wallets = Wallets(default_conf_usdt, freqtrade.exchange, is_backtest=True)
+        full_wallets = Wallets(default_conf_usdt, freqtrade.exchange, is_backtest=True)
+
+        def assert_wallets_match():
+            full_wallets.update()
+            assert wallets.get_all_balances().keys() == full_wallets.get_all_balances().keys()
+            for currency, wallet in full_wallets.get_all_balances().items():
+                assert wallets.get_total(currency) == pytest.approx(wallet.total)
+                assert wallets.get_free(currency) == pytest.approx(wallet.free)
+                assert wallets.get_used(currency) == pytest.approx(wallet.used)
+            assert wallets.get_all_positions() == full_wallets.get_all_positions()
+
+        create_mock_trades_usdt(fee, is_short=None, use_db=False)
+        open_trades = list(LocalTrade.bt_trades_open)
+        assert len(open_trades) == 4
+        for trade in open_trades:
+            # Backtesting always assigns leverage - required for the stake of open orders
+            trade.leverage = 1.0
+        for trade in open_trades:
+            wallets.update_trade_balance(trade)
+        assert_wallets_match()
+        if trading_mode == "spot":
+            assert wallets.get_total("XRP") == 10
+        else:
+            assert len(wallets.get_all_positions()) == 4
+
+        # Changed trade
+        open_trades[0].stake_amount += 5
+        open_trades[0].amount += 1
+        wallets.update_trade_balance(open_trades[0])
+        assert_wallets_match()
+
+        # Removed trade
+        LocalTrade.remove_bt_trade(open_trades[1])
+        wallets.update_trade_balance(open_trades[1])
+        assert_wallets_match()
+
+        # Repeated updates of a removed trade don't change the wallets
+        wallets.update_trade_balance(open_trades[1])
+        assert_wallets_match()
+
+        # Validation against a full update
+        wallets._check_interval = 2
+        wallets._updates_since_check = 0
+        open_trades[2].stake_amount += 10
+        wallets.update_trade_balance(open_trades[3])
+        assert not log_has_re(r"Incrementally updated wallets differ.*", caplog)
+        wallets.update_trade_balance(open_trades[3])
+        assert log_has_re(r"Incrementally updated wallets differ.*", caplog)
+        # Recalculated wallets are kept
+        assert_wallets_match()
+    finally:
+        Trade.reset_trades()
+        Trade.use_db = True
+
+
 def test_check_exit_amount(mocker, default_conf, fee):
     freqtrade = get_patched_freqtradebot(mocker, default_conf)
     update_mock = mocker.patch("freqtrade.wallets.Wallets.update")
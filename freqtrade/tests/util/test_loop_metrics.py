@@ -0,0 +1,89 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from freqtrade.exceptions import DDosProtection, TemporaryError
+from freqtrade.exchange.common import retrier, retrier_async
+from freqtrade.util import LoopMetrics
+from tests.conftest import get_mock_coro
+
+
+def test_loop_metrics():
+    metrics = LoopMetrics(window=3)
+    assert metrics.to_dict() == {}
+
+    for duration in (0.001, 0.2, 3.0, 50.0):
+        metrics.add("exchange", "fetch_ticker", duration)
+    with metrics.measure("phase", "enter_positions"):
+        pass
+    with pytest.raises(ValueError), metrics.measure("phase", "exit_positions"):
+        raise ValueError("Failed")
+
+    res = metrics.to_dict()
+    assert list(res.keys()) == ["exchange", "phase"]
+    assert list(res["phase"].keys()) == ["enter_positions", "exit_positions"]
+    assert res["phase"]["exit_positions"]["count"] == 1
+
+    ticker = res["exchange"]["fetch_ticker"]
+    # Lifetime values
+    assert ticker["count"] == 4
+    assert ticker["sum"] == pytest.approx(53.201)
+    assert ticker["buckets"]["0.005"] == 1
+    assert ticker["buckets"]["0.25"] == 2
+    assert ticker["buckets"]["5.0"] == 3
+    assert ticker["buckets"]["30.0"] == 3
+    assert ticker["buckets"]["+Inf"] == 4
+    # Rolling window - first measurement dropped
+    assert ticker["window"] == 3
+    assert ticker["avg"] == pytest.approx(17.733333)
+    assert ticker["p50"] == 3.0
+    assert ticker["max"] == 50.0
+
+    metrics.reset()
+    assert metrics.to_dict() == {}
+
+
+def test_loop_metrics_prometheus():
+    metrics = LoopMetrics()
+    metrics.add("exchange", "fetch_ticker", 0.02)
+    metrics.add("analyze", 'ETH/BTC"', 0.5)
+
+    res = metrics.to_prometheus()
+    assert "# TYPE freqtrade_exchange_duration_seconds histogram" in res
+    assert 'freqtrade_exchange_duration_seconds_bucket{name="fetch_ticker",le="0.01"} 0' in res
+    assert 'freqtrade_exchange_duration_seconds_bucket{name="fetch_ticker",le="0.025"} 1' in res
+    assert 'freqtrade_exchange_duration_seconds_bucket{name="fetch_ticker",le="+Inf"} 1' in res
+    assert 'freqtrade_exchange_duration_seconds_count{name="fetch_ticker"} 1' in res
+    assert 'freqtrade_analyze_duration_seconds_sum{name="ETH/BTC\\""} 0.5' in res
+    assert res.endswith("\n")
+
+
+def test_loop_metrics_retrier(mocker):
+    metrics = LoopMetrics()
+    mocker.patch("freqtrade.exchange.common.loop_metrics", metrics)
+    mocker.patch("freqtrade.exchange.common.time.sleep")
+    calls = MagicMock(side_effect=[TemporaryError("Failed"), TemporaryError("Failed"), 5])
+
+    @retrier
+    def fetch_sync():
+        return calls()
+
+    # One sample per call, including its retries
+    assert fetch_sync() == 5
+    assert calls.call_count == 3
+    assert metrics.to_dict()["exchange"]["fetch_sync"]["count"] == 1
+
+
+async def test_loop_metrics_retrier_async(mocker):
+    metrics = LoopMetrics()
+    mocker.patch("freqtrade.exchange.common.loop_metrics", metrics)
+    mocker.patch("freqtrade.exchange.common.asyncio.sleep", get_mock_coro(None))
+    calls = MagicMock(side_effect=[DDosProtection("Failed"), 5])
+
+    @retrier_async
+    async def fetch_async(exchange):
+        return calls()
+
+    assert await fetch_async(MagicMock()) == 5
+    assert calls.call_count == 2
+    assert metrics.to_dict()["exchange"]["fetch_async"]["count"] == 1